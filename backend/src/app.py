@@ -12,10 +12,20 @@ from sqlalchemy.ext.asyncio import create_async_engine
 
 # Custom Modules
 from backend.src.modules.candidate_finder.deps import provide_candidate_finder
+from backend.src.modules.team_type_coverage_analyzer.deps import provide_team_coverage
+from backend.src.modules.pokedex.deps import provide_pokedex
 from backend.src.config.settings import settings
+from backend.src.lib.deps import (
+    create_repository_loader,
+    index_version_header,
+    start_index_refresh
+)
+from backend.src.lib.index_store import index_store
 
 # Controllers
 from backend.src.modules.candidate_finder.controllers import CandidateFinderController
+from backend.src.modules.team_type_coverage_analyzer.controllers import TeamCoverageController
+from backend.src.modules.pokedex.controllers import PokedexController
 
 # Providers
 
@@ -35,11 +45,19 @@ alchemy_config = SQLAlchemyAsyncConfig(
     session_config=AsyncSessionConfig(expire_on_commit=False)
 )
 
+# Indexes: loaded once at startup, shared by every request
+index_store.configure(create_repository_loader(alchemy_config))
+
 # App
 app = Litestar(
-    route_handlers=[CandidateFinderController],
+    route_handlers=[CandidateFinderController, TeamCoverageController, PokedexController],
+    on_startup=[index_store.reload, start_index_refresh],
+    on_shutdown=[index_store.stop_refresh_task],
+    before_send=[index_version_header],
     dependencies={
-        "finder": Provide(provide_candidate_finder)},
+        "finder": Provide(provide_candidate_finder),
+        "coverage": Provide(provide_team_coverage),
+        "pokedex": Provide(provide_pokedex)},
     cors_config=cors_config,
     middleware=[rate_limit_config.middleware],
     plugins=[
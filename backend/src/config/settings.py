@@ -19,6 +19,21 @@ class Settings(BaseSettings):
     cors_origins: list[str] = ["*"]
     log_level: str = "INFO"
 
+    # Indexes
+    index_refresh_interval: float = 0.0  # seconds between background refreshes, 0 disables
+    index_load_concurrently: bool = False  # one pooled connection per index query
+    index_source: str = "database"  # "database", "snapshot" (startup only; refreshes query the database) or "fixtures"
+    index_snapshot_write: bool = False  # write a snapshot after each database load, refreshes included
+    cold_field_cache_size: int = 256  # decoded Pokédex text entries kept per worker, 0 disables
+
+    # Responses
+    response_cache_size: int = 1024  # cached candidate finder responses, 0 disables
+    response_max_age: int = 300  # Cache-Control max-age (seconds) for candidate finder responses
+    response_encoder: str = "msgspec"  # "msgspec" (encode directly) or "pydantic" (validate via schemas)
+
+    # Admin
+    admin_token: str = ""  # X-Admin-Token required by POST /indexes/reload, empty disables the route
+
     # Env
     environment: str = "development"
     debug: bool = False
@@ -33,6 +48,10 @@ class Settings(BaseSettings):
     def fixtures_dir(self) -> Path:
         return self.data_dir / "fixtures" / self.dataset
     
+    @property
+    def index_snapshot_path(self) -> Path:
+        return self.data_dir / "snapshots" / f"{self.dataset}.pkfidx"
+
     # Fixture paths
     @property
     def tm_fixture_path(self) -> Path:
@@ -0,0 +1,92 @@
+"""
+Dense species IDs and bitsets over them.
+
+Every pokemon name gets an integer ID (its position in sorted name order) and
+each membership - legendary, a type, the learners of a move - is a Python int
+with bit `id` set for every member. Intersections and species filters become
+`&` / `& ~` on those ints, and names are only materialised at the end.
+"""
+from itertools import islice
+from typing import Any, Iterable, Mapping
+
+
+def iter_bits(bits: int) -> Iterable[int]:
+    """Yield the positions of set bits, lowest first."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class SpeciesBitsets():
+    """
+    Bitsets for species flags, type membership and move learners.
+
+    Built once per index snapshot; read-only afterwards.
+    """
+
+    def __init__(
+        self,
+        pokemon_index: Mapping[str, Mapping[str, Any]],
+        type_index: Mapping[str, Iterable[str]],
+        move_index: Mapping[str, Iterable[str]],
+    ):
+        # Names only referenced by the type/move indexes still get an ID
+        names = set(pokemon_index)
+        for members in type_index.values():
+            names.update(members)
+        for learners in move_index.values():
+            names.update(learners)
+
+        self.names: tuple[str, ...] = tuple(sorted(names))
+        self.ids: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+        self.known = self.encode(pokemon_index)
+        self.legendary = self._flag(pokemon_index, "is_legendary")
+        self.mythical = self._flag(pokemon_index, "is_mythical")
+        self.ultra_beast = self._flag(pokemon_index, "is_ultra_beast")
+
+        self.types: dict[str, int] = {
+            type_name: self.encode(members)
+            for type_name, members in type_index.items()
+        }
+        self.moves: dict[str, int] = {
+            move_name: self.encode(learners)
+            for move_name, learners in move_index.items()
+        }
+
+    def _flag(self, pokemon_index: Mapping[str, Mapping[str, Any]], flag: str) -> int:
+        return self.encode(name for name, info in pokemon_index.items() if info[flag])
+
+    def encode(self, names: Iterable[str]) -> int:
+        bits = 0
+        for name in names:
+            bits |= 1 << self.ids[name]
+        return bits
+
+    def decode(self, bits: int, offset: int = 0, limit: int | None = None) -> list[str]:
+        """Names for every set bit, in ID (alphabetical) order.
+
+        `offset` / `limit` select a page without materialising the other names.
+        """
+        names = self.names
+        ids = iter_bits(bits)
+        if offset or limit is not None:
+            ids = islice(ids, offset, None if limit is None else offset + limit)
+        return [names[i] for i in ids]
+
+    def excluded(
+        self,
+        include_legendary: bool = False,
+        include_mythical: bool = False,
+        include_ultra_beasts: bool = False
+    ) -> int:
+        """Bits to clear for the species filters the caller did not opt into."""
+        bits = 0
+        if not include_legendary:
+            bits |= self.legendary
+        if not include_mythical:
+            bits |= self.mythical
+        if not include_ultra_beasts:
+            bits |= self.ultra_beast
+        return bits
@@ -0,0 +1,89 @@
+"""
+Packed Pokédex text for the pokemon index.
+
+The candidate finder only reads a species' number, types and flags, yet
+every species also carries a display name, sprite URL, genus and a long
+description that only the Pokédex and result rendering ever show. Here
+those cold fields live in one blob instead of four str objects per
+species:
+
+    blob      msgpack arrays [display_name, sprite_url, description, genus],
+              one per species, back to back
+    offsets   array("I") of len(species) + 1 start positions into blob
+
+Entries are decoded on first access and kept in a small LRU. Snapshots
+write the blob as an out-of-band pickle buffer (see snapshot_format), so a
+store opened from a snapshot reads straight off the memory-mapped file and
+only the pages actually looked at are ever faulted in.
+"""
+import pickle
+
+from array import array
+from collections import OrderedDict
+from typing import Any, Iterable, Sequence
+
+import msgspec
+
+from backend.src.config.settings import settings
+
+COLD_FIELDS = ("display_name", "sprite_url", "description", "genus")
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(tuple[str, str, str, str])
+
+
+class ColdFieldStore():
+    """Cold text fields for every species, decoded lazily through an LRU."""
+
+    __slots__ = ("blob", "offsets", "max_entries", "_entries", "hits", "misses")
+
+    def __init__(self, blob: bytes | memoryview, offsets: array, max_entries: int | None = None):
+        self.blob = blob
+        self.offsets = offsets
+        self.max_entries = settings.cold_field_cache_size if max_entries is None else max_entries
+        self._entries: OrderedDict[int, dict[str, str]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[str]], max_entries: int | None = None) -> "ColdFieldStore":
+        """Pack one (display_name, sprite_url, description, genus) per species, in ID order."""
+        blob = bytearray()
+        offsets = array("I", [0])
+        for row in rows:
+            _encoder.encode_into(tuple(row), blob, len(blob))
+            offsets.append(len(blob))
+        return cls(bytes(blob), offsets, max_entries)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def get(self, cold_id: int) -> dict[str, str]:
+        """Cold fields of species `cold_id`, marking them most recent."""
+        fields = self._entries.get(cold_id)
+        if fields is not None:
+            self._entries.move_to_end(cold_id)
+            self.hits += 1
+            return fields
+
+        self.misses += 1
+        start, end = self.offsets[cold_id], self.offsets[cold_id + 1]
+        fields = dict(zip(COLD_FIELDS, _decoder.decode(self.blob[start:end])))
+        if self.max_entries > 0:
+            self._entries[cold_id] = fields
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return fields
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __repr__(self) -> str:
+        return f"ColdFieldStore({len(self)} species, {len(self.blob)} bytes)"
+
+    def __reduce_ex__(self, protocol: int) -> tuple[Any, ...]:
+        # Protocol 5 hands the blob to the pickler's buffer_callback, if any,
+        # instead of copying it into the pickle stream
+        blob = pickle.PickleBuffer(self.blob) if protocol >= 5 else bytes(self.blob)
+        return ColdFieldStore, (blob, self.offsets)
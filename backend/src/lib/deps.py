@@ -1 +1,90 @@
+import asyncio
+import hmac
+import structlog
 
+from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig
+from litestar.connection import ASGIConnection
+from litestar.datastructures import MutableScopeHeaders
+from litestar.exceptions import NotAuthorizedException, PermissionDeniedException
+from litestar.handlers.base import BaseRouteHandler
+from litestar.types import Message, Scope
+
+from backend.src.config.settings import settings
+from backend.src.lib.exceptions import IndexSnapshotError
+from backend.src.lib.index_store import RepositoryLoader, index_store
+from backend.src.lib.repository import (
+    AbstractRepository,
+    FixtureRepository,
+    SnapshotRepository,
+    SQLAlchemyRepository
+)
+
+logger = structlog.get_logger(__name__)
+
+INDEX_VERSION_HEADER = "X-Index-Version"
+INDEX_VERSION_STATE_KEY = "index_version"
+INDEX_CONTENT_HASH_STATE_KEY = "index_content_hash"
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+def create_repository_loader(config: SQLAlchemyAsyncConfig) -> RepositoryLoader:
+    """Build the loader the IndexStore calls on startup and on reload."""
+    async def load_from_database() -> SQLAlchemyRepository:
+        if settings.index_load_concurrently:
+            return await SQLAlchemyRepository.create_concurrent(settings.db_url)
+
+        async with config.get_session() as session:
+            return await SQLAlchemyRepository.create(session=session)
+
+    # Only the startup load may come from the snapshot file: it never changes on
+    # its own, so refreshes rebuild from the database to pick up reseeded data
+    snapshot_pending = settings.index_source == "snapshot"
+
+    async def load_repository() -> AbstractRepository:
+        nonlocal snapshot_pending
+        if settings.index_source == "fixtures":
+            # Read-only deployments with no database; fixtures are the source of truth
+            return await asyncio.to_thread(FixtureRepository.create, settings)
+
+        if snapshot_pending:
+            snapshot_pending = False
+            try:
+                return await asyncio.to_thread(
+                    SnapshotRepository.open, settings.index_snapshot_path, dataset=settings.dataset)
+            except (FileNotFoundError, IndexSnapshotError) as e:
+                # Unusable snapshot: fall back to the database (and rewrite it below)
+                logger.warning("Index snapshot unusable, loading from database", error=str(e))
+
+        repository = await load_from_database()
+        if settings.index_snapshot_write:
+            # Pickling, hashing and writing the file is blocking work
+            await asyncio.to_thread(
+                repository.write_snapshot, settings.index_snapshot_path, dataset=settings.dataset)
+        return repository
+
+    return load_repository
+
+
+async def start_index_refresh() -> None:
+    """Startup hook: keep the snapshot in sync with reseeded data."""
+    index_store.start_refresh_task(settings.index_refresh_interval)
+
+
+async def index_version_header(message: Message, scope: Scope) -> None:
+    """Tag responses with the version of the snapshot that served them."""
+    if message["type"] != "http.response.start":
+        return
+
+    version = scope.get("state", {}).get(INDEX_VERSION_STATE_KEY)
+    if version is not None:
+        MutableScopeHeaders.from_message(message).add(INDEX_VERSION_HEADER, str(version))
+
+
+def admin_token_guard(connection: ASGIConnection, _: BaseRouteHandler) -> None:
+    """Route guard for admin endpoints: 403 unless settings.admin_token is set and sent."""
+    if not settings.admin_token:
+        raise PermissionDeniedException("Admin endpoints are disabled")
+
+    token = connection.headers.get(ADMIN_TOKEN_HEADER, "")
+    if not hmac.compare_digest(token.encode(), settings.admin_token.encode()):
+        raise NotAuthorizedException(f"Missing or invalid {ADMIN_TOKEN_HEADER}")
@@ -33,4 +33,35 @@ class InvalidPokemonNameError(PokemonSearchError):
 
 class InvalidPokemonStatError(PokemonSearchError):
     """Raised when invalid pokemon stat provided"""
-    pass
\ No newline at end of file
+    pass
+
+class TooManyTeamMembersError(PokemonSearchError):
+    """Raised when a team has more than 6 members."""
+    pass
+
+class TooManyBatchItemsError(PokemonSearchError):
+    """Raised when a batch lookup asks for more items than allowed."""
+    pass
+
+class InvalidFilterExpressionError(PokemonSearchError):
+    """Raised when an export filter expression cannot be parsed."""
+    pass
+
+# =============
+# Data layer
+# =============
+class IndexesNotLoadedError(Exception):
+    """Raised when the shared index snapshot is requested before it is loaded."""
+    pass
+
+class IndexSnapshotError(Exception):
+    """Base exception for on-disk index snapshot errors."""
+    pass
+
+class IndexSnapshotMismatchError(IndexSnapshotError):
+    """Raised when a snapshot was built for another format, schema or dataset."""
+    pass
+
+class IndexSnapshotCorruptError(IndexSnapshotError):
+    """Raised when a snapshot is truncated or fails its checksum."""
+    pass
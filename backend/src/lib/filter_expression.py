@@ -0,0 +1,105 @@
+"""
+Filter expressions for species exports.
+
+An expression is a list of comparisons joined by "," or "and":
+
+    type=fire and attack>=100, legendary=false, move!=tackle
+
+String fields (name, type, move) support = and !=. Flag fields
+(legendary, mythical, ultra_beast) compare against true/false. Numeric
+fields (number and the six base stats) support = != > >= < <=.
+"""
+import operator
+import re
+
+from typing import Any, Callable
+
+from backend.src.lib.exceptions import InvalidFilterExpressionError
+from backend.src.lib.stat_matrix import STAT_NAMES
+
+STRING_FIELDS = ("name", "type", "move")
+FLAG_FIELDS = ("legendary", "mythical", "ultra_beast")
+NUMERIC_FIELDS = ("number", *STAT_NAMES)
+
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+_CLAUSE_SEPARATOR = re.compile(r"\s*(?:,|\band\b)\s*", re.IGNORECASE)
+_CLAUSE = re.compile(r"^([a-z_]+)\s*(>=|<=|!=|=|>|<)\s*([\w.\-]+)$")
+
+
+class Clause():
+    """One parsed `field op value` comparison."""
+
+    __slots__ = ("field", "op", "value")
+
+    def __init__(self, field: str, op: str, value: str | int | bool):
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Clause({self.field!r}, {self.op!r}, {self.value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Clause):
+            return NotImplemented
+        return (self.field, self.op, self.value) == (other.field, other.op, other.value)
+
+
+def parse_filter(expression: str) -> list[Clause]:
+    """
+    Parse a filter expression into clauses (ANDed together).
+
+    Raises:
+        InvalidFilterExpressionError: On unknown fields, operators the field
+            does not support, or values of the wrong kind
+    """
+    clauses = []
+    for part in _CLAUSE_SEPARATOR.split(expression.strip()):
+        if not part:
+            continue
+        match = _CLAUSE.match(part)
+        if match is None:
+            raise InvalidFilterExpressionError(
+                f"Invalid filter clause: '{part}'. Expected field<op>value, e.g. 'attack>=100'"
+            )
+        field, op, value = match.groups()
+        clauses.append(_clause(field, op, value))
+
+    if not clauses:
+        raise InvalidFilterExpressionError("Filter expression is empty")
+    return clauses
+
+
+def _clause(field: str, op: str, value: str) -> Clause:
+    if field in STRING_FIELDS:
+        if op not in ("=", "!="):
+            raise InvalidFilterExpressionError(f"'{field}' only supports = and !=, got '{op}'")
+        return Clause(field, op, value)
+
+    if field in FLAG_FIELDS:
+        if op not in ("=", "!="):
+            raise InvalidFilterExpressionError(f"'{field}' only supports = and !=, got '{op}'")
+        if value.lower() not in ("true", "false"):
+            raise InvalidFilterExpressionError(f"'{field}' expects true or false, got '{value}'")
+        return Clause(field, op, value.lower() == "true")
+
+    if field in NUMERIC_FIELDS:
+        try:
+            return Clause(field, op, int(value))
+        except ValueError:
+            raise InvalidFilterExpressionError(
+                f"'{field}' expects an integer, got '{value}'"
+            ) from None
+
+    raise InvalidFilterExpressionError(
+        f"Unknown filter field: '{field}'. "
+        f"Valid fields: {sorted(STRING_FIELDS + FLAG_FIELDS + NUMERIC_FIELDS)}"
+    )
@@ -0,0 +1,72 @@
+"""
+Streaming reader for the JSON fixture files in backend/data/fixtures.
+
+Every fixture is a top-level array of flat records. Rather than json.load-ing
+the whole array (and holding the text, the list and every dict at once), the
+file is read in chunks and records are decoded and yielded one at a time.
+"""
+import json
+
+from pathlib import Path
+from typing import Any, Iterator
+
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def iter_fixture_records(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[dict[str, Any]]:
+    """Yield each record of the JSON array in `path` without loading the whole file."""
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            """Append the next chunk, dropping what was already consumed."""
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip(delimiters: str) -> str | None:
+            """Skip whitespace and `delimiters`, returning the next significant char."""
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE + delimiters:
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if not fill():
+                    return None
+
+        if skip("") != "[":
+            raise json.JSONDecodeError("Expected a JSON array", buffer, pos)
+        pos += 1
+
+        while True:
+            char = skip(",")
+            if char is None:
+                raise json.JSONDecodeError("Unterminated JSON array", buffer, pos)
+            if char == "]":
+                return
+
+            try:
+                record, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Record straddles the chunk boundary; read more and retry
+                if fill():
+                    continue
+                raise
+
+            # A value ending exactly at the buffer edge may be cut short
+            if end == len(buffer) and not eof and fill():
+                continue
+
+            pos = end
+            yield record
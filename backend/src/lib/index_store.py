@@ -0,0 +1,213 @@
+import asyncio
+import hashlib
+import json
+import structlog
+
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Mapping, TypeVar
+
+from backend.src.lib.repository import AbstractRepository
+from backend.src.lib.exceptions import IndexesNotLoadedError
+
+logger = structlog.get_logger(__name__)
+
+ServiceT = TypeVar("ServiceT")
+RepositoryLoader = Callable[[], Awaitable[AbstractRepository]]
+
+
+def _canonical(value: Any) -> Any:
+    """JSON fallback so frozensets hash the same regardless of iteration order."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    # Records hash like the dicts they replace
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Cannot hash index value of type {type(value).__name__}")
+
+
+def index_content_hash(repository: AbstractRepository) -> str:
+    """sha256 over every index, stable across processes and load order."""
+    digest = hashlib.sha256()
+    for index in (
+        repository.get_pokemon_index(),
+        repository.get_move_index(),
+        repository.get_stat_index(),
+        repository.get_stat_spread_index(),
+        repository.get_type_index(),
+        repository.get_type_matchup_index(),
+        repository.get_type_matrix().as_dict(),
+        repository.get_machine_moves_index(),
+    ):
+        digest.update(json.dumps(index, sort_keys=True, default=_canonical).encode())
+    return digest.hexdigest()
+
+
+class IndexSnapshot():
+    """
+    One fully loaded set of repository indexes, shared by every request.
+
+    The indexes are treated as read-only once published. Services built from
+    a snapshot are cached on it, so the per-request dependency hands out the
+    same service instance until the next reload.
+    """
+
+    def __init__(self, version: int, repository: AbstractRepository, content_hash: str):
+        self.version = version
+        self.repository = repository
+        self.content_hash = content_hash
+        self.loaded_at = datetime.now(timezone.utc)
+        self._services: dict[type, Any] = {}
+
+    def service(self, service_cls: type[ServiceT]) -> ServiceT:
+        """Return the service built from this snapshot, creating it on first use."""
+        service = self._services.get(service_cls)
+        if service is None:
+            service = service_cls(repository=self.repository)  # type: ignore[call-arg]
+            self._services[service_cls] = service
+        return service
+
+
+class RefreshMetrics():
+    """Counters describing the most recent index rebuilds."""
+
+    def __init__(self):
+        self.refresh_count = 0
+        self.swap_count = 0
+        self.failure_count = 0
+        self.last_refresh_at: datetime | None = None
+        self.last_refresh_latency_ms: float | None = None
+        self.last_refresh_changed: bool | None = None
+
+    def record(self, started: float, changed: bool) -> None:
+        self.refresh_count += 1
+        self.swap_count += int(changed)
+        self.last_refresh_at = datetime.now(timezone.utc)
+        self.last_refresh_latency_ms = (perf_counter() - started) * 1000
+        self.last_refresh_changed = changed
+
+
+class IndexStore():
+    """
+    Process-wide holder of the current IndexSnapshot.
+
+    New snapshots are always built off to the side and published with a
+    single reference swap, so requests holding the previous snapshot keep
+    a complete, consistent view until they finish.
+    """
+
+    def __init__(self):
+        self._snapshot: IndexSnapshot | None = None
+        self._loader: RepositoryLoader | None = None
+        self._version = 0
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        self.metrics = RefreshMetrics()
+
+    def configure(self, loader: RepositoryLoader) -> None:
+        """Set the coroutine used to build a fresh repository on (re)load."""
+        self._loader = loader
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def current(self) -> IndexSnapshot:
+        """Returns the snapshot serving requests right now."""
+        if self._snapshot is None:
+            raise IndexesNotLoadedError("Indexes have not been loaded yet")
+        return self._snapshot
+
+    async def reload(self) -> IndexSnapshot:
+        """Rebuild every index and publish it; unchanged data keeps the current version."""
+        return await self._rebuild(force=True)
+
+    async def refresh(self) -> IndexSnapshot:
+        """Rebuild every index, publishing only if the content hash changed."""
+        return await self._rebuild(force=False)
+
+    async def _rebuild(self, force: bool) -> IndexSnapshot:
+        if self._loader is None:
+            raise IndexesNotLoadedError("No repository loader configured")
+
+        # Serialize rebuilds; readers keep using the old snapshot meanwhile
+        async with self._lock:
+            started = perf_counter()
+            try:
+                repository = await self._loader()
+                content_hash = await asyncio.to_thread(index_content_hash, repository)
+            except Exception:
+                self.metrics.failure_count += 1
+                raise
+
+            current = self._snapshot
+            changed = current is None or current.content_hash != content_hash
+            if changed:
+                current = self.publish(repository, content_hash)
+            elif force:
+                # Same data: keep the version so cached responses and ETags stay valid
+                current = self.publish(repository, content_hash, version=current.version)
+            else:
+                logger.info("Index refresh found no changes", version=current.version)
+
+            self.metrics.record(started, changed)
+            return current
+
+    def publish(
+        self,
+        repository: AbstractRepository,
+        content_hash: str | None = None,
+        version: int | None = None
+    ) -> IndexSnapshot:
+        """Make an already loaded repository the current snapshot, under a new version unless given one."""
+        if content_hash is None:
+            content_hash = index_content_hash(repository)
+
+        if version is None:
+            self._version += 1
+            version = self._version
+        snapshot = IndexSnapshot(
+            version=version,
+            repository=repository,
+            content_hash=content_hash
+            )
+        self._snapshot = snapshot
+
+        logger.info(
+            "Index snapshot published",
+            version=snapshot.version,
+            content_hash=content_hash,
+            loaded_at=snapshot.loaded_at.isoformat()
+            )
+        return snapshot
+
+    # Background refresh
+    def start_refresh_task(self, interval: float) -> None:
+        """Refresh every `interval` seconds until stopped. 0 disables."""
+        if interval <= 0 or self._refresh_task is not None:
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_loop(interval))
+        logger.info("Background index refresh started", interval=interval)
+
+    async def stop_refresh_task(self) -> None:
+        task, self._refresh_task = self._refresh_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _refresh_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # Keep serving the last good snapshot and try again next tick
+                logger.error("Background index refresh failed", error=str(e))
+
+
+index_store = IndexStore()
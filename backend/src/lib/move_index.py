@@ -0,0 +1,176 @@
+"""
+Packed move index.
+
+The move index maps {move: {pokemon: {learn_method: level/True}}}. Held
+as dicts, every (move, pokemon) pair costs its own small learn-method
+dict. Here each move keeps three parallel arrays sorted by pokemon ID
+instead:
+
+    ids     pokemon IDs (positions in the index's sorted name table)
+    masks   learn methods as a bitmask (bit i <-> methods[i])
+    levels  the level-up level, 0 when not learned by level-up and
+            NO_LEVEL when learned by level-up with no level (NULL)
+
+PackedMoveIndex is a dict of MoveLearners, read-only Mappings that decode
+on access, so callers keep seeing the dict shape. Decoded learn-method dicts
+are shared flyweights: every pair with the same methods and level gets
+the same dict, and callers must not mutate them.
+"""
+from array import array
+from bisect import bisect_left
+from collections.abc import ItemsView, Mapping
+from typing import Any, Iterable, Iterator
+
+LEVEL_UP = "level-up"
+
+# Bit order for the common methods; any other method gets the next free bit
+KNOWN_METHODS = (LEVEL_UP, "machine", "tutor", "egg")
+
+# Stored for a level-up pair whose level is None; real levels are 0-100
+NO_LEVEL = 255
+
+
+class LearnerItems(ItemsView):
+    """items() of a MoveLearners: iterates the arrays in one pass instead of a bisect per key."""
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        learners: MoveLearners = self._mapping  # type: ignore[assignment]
+        index = learners._index
+        return zip(
+            map(index.names.__getitem__, learners.ids),
+            map(index.decoded.__getitem__, zip(learners.masks, learners.levels))
+        )
+
+
+class MoveLearners(Mapping):
+    """Decoder view over one move's packed learners: {pokemon: {learn_method: level/True}}."""
+
+    __slots__ = ("_index", "ids", "masks", "levels")
+
+    def __init__(self, index: "PackedMoveIndex", ids: array, masks: array, levels: array):
+        self._index = index
+        self.ids = ids
+        self.masks = masks
+        self.levels = levels
+
+    def _position(self, pokemon: object) -> int:
+        """Index of `pokemon` in the arrays, or -1."""
+        pokemon_id = self._index.pokemon_ids.get(pokemon)  # type: ignore[call-overload]
+        if pokemon_id is None:
+            return -1
+        ids = self.ids
+        i = bisect_left(ids, pokemon_id)
+        return i if i < len(ids) and ids[i] == pokemon_id else -1
+
+    def __getitem__(self, pokemon: str) -> dict[str, Any]:
+        # _position inlined: this is the per-learner hot path
+        index = self._index
+        pokemon_id = index.pokemon_ids.get(pokemon)
+        if pokemon_id is not None:
+            ids = self.ids
+            i = bisect_left(ids, pokemon_id)
+            if i < len(ids) and ids[i] == pokemon_id:
+                return index.decoded[self.masks[i], self.levels[i]]
+        raise KeyError(pokemon)
+
+    def __contains__(self, pokemon: object) -> bool:
+        return self._position(pokemon) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        names = self._index.names
+        return (names[i] for i in self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def items(self) -> LearnerItems:
+        return LearnerItems(self)
+
+    def __repr__(self) -> str:
+        return f"MoveLearners({dict(self.items())!r})"
+
+
+class PackedMoveIndex(dict):
+    """
+    {move: MoveLearners} over one shared, sorted pokemon name table.
+
+    A plain dict of views, so looking up a move costs a dict lookup.
+    """
+
+    __slots__ = ("names", "pokemon_ids", "methods", "decoded")
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        methods: Iterable[str],
+        packed: Mapping[str, tuple[array, array, array]]
+    ):
+        self.names: tuple[str, ...] = tuple(names)
+        self.pokemon_ids: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.methods: tuple[str, ...] = tuple(methods)
+
+        # Every distinct (mask, level) decoded once up front
+        self.decoded: dict[tuple[int, int], dict[str, Any]] = {}
+        for ids, masks, levels in packed.values():
+            for key in zip(masks, levels):
+                if key not in self.decoded:
+                    self.decoded[key] = self._decode(*key)
+
+        super().__init__(
+            (move, MoveLearners(self, ids, masks, levels))
+            for move, (ids, masks, levels) in packed.items()
+        )
+
+    @classmethod
+    def from_pairs(cls, pairs: Mapping[str, Mapping[str, Mapping[str, Any]]]) -> "PackedMoveIndex":
+        """Pack {move: {pokemon: {learn_method: level/True}}}."""
+        names = sorted({pokemon for learners in pairs.values() for pokemon in learners})
+        pokemon_ids = {name: i for i, name in enumerate(names)}
+
+        seen = {method for learners in pairs.values() for methods in learners.values() for method in methods}
+        methods = [m for m in KNOWN_METHODS if m in seen] + sorted(seen.difference(KNOWN_METHODS))
+        bits = {method: 1 << i for i, method in enumerate(methods)}
+
+        packed = {}
+        for move, learners in pairs.items():
+            ids, masks, levels = array("H"), array("H"), array("B")
+            for pokemon in sorted(learners, key=pokemon_ids.__getitem__):
+                methods_for_pair = learners[pokemon]
+                ids.append(pokemon_ids[pokemon])
+                masks.append(sum(bits[method] for method in methods_for_pair))
+                levels.append(cls._encode_level(methods_for_pair))
+            packed[move] = (ids, masks, levels)
+
+        return cls(names, methods, packed)
+
+    @staticmethod
+    def _encode_level(methods: Mapping[str, Any]) -> int:
+        if LEVEL_UP not in methods:
+            return 0
+        level = methods[LEVEL_UP]
+        if level is None:
+            return NO_LEVEL
+        if not 0 <= level < NO_LEVEL:
+            raise ValueError(f"Level-up level {level!r} does not fit the packed move index")
+        return level
+
+    def _decode(self, mask: int, level: int) -> dict[str, Any]:
+        decoded_level = None if level == NO_LEVEL else level
+        return {
+            method: decoded_level if method == LEVEL_UP else True
+            for i, method in enumerate(self.methods)
+            if mask >> i & 1
+        }
+
+    def __repr__(self) -> str:
+        return f"PackedMoveIndex({len(self)} moves, {len(self.names)} pokemon)"
+
+    def __reduce__(self) -> tuple[type, tuple[Any, ...]]:
+        # Arrays pickle as raw bytes; views and flyweights are rebuilt on load
+        packed = {
+            move: (learners.ids, learners.masks, learners.levels)
+            for move, learners in self.items()
+        }
+        return PackedMoveIndex, (self.names, self.methods, packed)
@@ -0,0 +1,128 @@
+"""
+Compound species queries over SpeciesBitsets.
+
+A query is a set of index predicates - learns a move, has a type, resists
+an attacking type - plus optional stat floors. Every predicate is a bitset
+whose cardinality is known when the snapshot is built, so the planner
+intersects them smallest first and stops as soon as the running set is
+empty. Stat floors have no bitset and are checked last, only against the
+species that survived the intersections.
+"""
+from typing import Any, Iterable, Mapping
+
+from backend.src.lib.bitsets import SpeciesBitsets
+from backend.src.lib.type_chart import TypeChart
+
+# (kind, value), e.g. ("move", "thunderbolt"), ("type", "fire"), ("resists", "water")
+Predicate = tuple[str, str]
+
+MOVE = "move"
+TYPE = "type"
+RESISTS = "resists"
+
+
+class PlanStep():
+    """One executed (or skipped) step of a plan, for the response and logs."""
+
+    __slots__ = ("predicate", "cardinality", "remaining")
+
+    def __init__(self, predicate: str, cardinality: int | None, remaining: int | None):
+        self.predicate = predicate
+        # None for residual filters that have no index
+        self.cardinality = cardinality
+        # None when an earlier step already emptied the result
+        self.remaining = remaining
+
+
+class QueryPlanner():
+    """
+    Predicate bitsets and their cardinalities for one index snapshot.
+
+    Built once per snapshot alongside SpeciesBitsets; read-only afterwards.
+    """
+
+    def __init__(
+        self,
+        species: SpeciesBitsets,
+        type_chart: TypeChart,
+        pokemon_index: Mapping[str, Mapping[str, Any]],
+        stat_index: Mapping[str, Mapping[str, int]]
+    ):
+        self._species = species
+        self._stat_index = stat_index
+
+        # Species grouped by their exact (sorted) type combo
+        combo_bits: dict[tuple[str, ...], int] = {}
+        for name, info in pokemon_index.items():
+            combo = tuple(sorted(set(info["type_display"].split("/"))))
+            combo_bits[combo] = combo_bits.get(combo, 0) | 1 << species.ids[name]
+
+        # Species whose combo takes less than 1x from each attacking type
+        resists = {attacker: 0 for attacker in type_chart.types}
+        for combo, bits in combo_bits.items():
+            if not all(t in type_chart.types for t in combo):
+                continue
+            for attacker, multiplier in type_chart.multipliers(*combo).items():
+                if multiplier < 1:
+                    resists[attacker] |= bits
+
+        self._bits: dict[Predicate, int] = {}
+        self._bits.update(((MOVE, move), bits) for move, bits in species.moves.items())
+        self._bits.update(((TYPE, t), bits) for t, bits in species.types.items())
+        self._bits.update(((RESISTS, t), bits) for t, bits in resists.items())
+
+        self.cardinality: dict[Predicate, int] = {
+            predicate: bits.bit_count() for predicate, bits in self._bits.items()
+        }
+
+    def __contains__(self, predicate: Predicate) -> bool:
+        return predicate in self._bits
+
+    def plan(self, predicates: Iterable[Predicate]) -> list[Predicate]:
+        """Distinct predicates, most selective first."""
+        return sorted(set(predicates), key=lambda p: (self.cardinality[p], p))
+
+    def execute(
+        self,
+        predicates: Iterable[Predicate],
+        excluded: int = 0,
+        stat_floors: Mapping[str, int] | None = None
+    ) -> tuple[list[str], list[PlanStep]]:
+        """
+        Species matching every predicate and stat floor, in ID order.
+
+        Args:
+            predicates: Index predicates, ANDed together (may be empty)
+            excluded: Species bits to drop (see SpeciesBitsets.excluded)
+            stat_floors: Minimum base stats, checked after the intersections
+
+        Returns:
+            (names, steps) - steps in execution order
+        """
+        steps = []
+        bits = self._species.known & ~excluded
+
+        for predicate in self.plan(predicates):
+            label = ":".join(predicate)
+            if not bits:
+                steps.append(PlanStep(label, self.cardinality[predicate], None))
+                continue
+            bits &= self._bits[predicate]
+            steps.append(PlanStep(label, self.cardinality[predicate], bits.bit_count()))
+
+        names = self._species.decode(bits)
+        if stat_floors:
+            label = ",".join(f"{stat}>={floor}" for stat, floor in stat_floors.items())
+            if not names:
+                steps.append(PlanStep(f"stats:{label}", None, None))
+                return names, steps
+            names = [
+                name for name in names
+                if all(
+                    self._stat_index.get(name, {}).get(stat, -1) >= floor
+                    for stat, floor in stat_floors.items()
+                )
+            ]
+            steps.append(PlanStep(f"stats:{label}", None, len(names)))
+
+        return names, steps
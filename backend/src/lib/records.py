@@ -0,0 +1,93 @@
+"""
+Compact records for the per-pokemon indexes.
+
+A repository keeps one entry per species alive for the life of the worker,
+so entries are slotted objects instead of dicts: no per-entry hash table,
+and field names are stored once on the class. Records still read like the
+dicts they replace (`info["number"]`, `.get()`, `.items()`, `==` against a
+dict), so services and test doubles can keep handing out plain dicts.
+
+Only the hot fields (number, size, types, flags) are held on the record.
+The Pokédex text fields are read through the shared ColdFieldStore on
+first access.
+"""
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+from backend.src.lib.cold_fields import COLD_FIELDS, ColdFieldStore
+
+# Every field, in `pokemon` column order
+POKEMON_FIELDS = (
+    "display_name",
+    "number",
+    "height",
+    "weight",
+    "sprite_url",
+    "description",
+    "genus",
+    "type_display",
+    "is_legendary",
+    "is_mythical",
+    "is_ultra_beast",
+)
+
+_COLD = frozenset(COLD_FIELDS)
+
+
+class PokemonRecord(Mapping):
+    """One `pokemon` row, as stored in the pokemon index."""
+
+    __slots__ = (
+        "number",
+        "height",
+        "weight",
+        "type_display",
+        "is_legendary",
+        "is_mythical",
+        "is_ultra_beast",
+        "cold",
+        "cold_id",
+    )
+
+    def __init__(
+        self,
+        number: int,
+        height: float,
+        weight: float,
+        type_display: str,
+        is_legendary: bool,
+        is_mythical: bool,
+        is_ultra_beast: bool,
+        cold: ColdFieldStore,
+        cold_id: int
+    ):
+        self.number = number
+        self.height = height
+        self.weight = weight
+        self.type_display = type_display
+        self.is_legendary = is_legendary
+        self.is_mythical = is_mythical
+        self.is_ultra_beast = is_ultra_beast
+        # Where this species' text fields live in the shared store
+        self.cold = cold
+        self.cold_id = cold_id
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _COLD:
+            return self.cold.get(self.cold_id)[key]
+        if key not in POKEMON_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(POKEMON_FIELDS)
+
+    def __len__(self) -> int:
+        return len(POKEMON_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"PokemonRecord({dict(self)!r})"
+
+    def __reduce__(self) -> tuple[type, tuple[Any, ...]]:
+        # Pickle as a bare tuple of values, in slot order; the store is pickled once
+        return PokemonRecord, tuple(getattr(self, field) for field in self.__slots__)
@@ -1,96 +1,133 @@
-
-
-
+import asyncio
+import json
 import structlog
-from typing import Any
+from pathlib import Path
+from sys import intern
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Container, Iterable, Iterator, Mapping, TypeVar
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.exc import DatabaseError
 
-logger = structlog.get_logger(__name__)
-
-class SQLAlchemyRepository():
-    def __init__(self, session: AsyncSession):
-        self.session = session
-    
-    @classmethod
-    async def create(cls, session: AsyncSession):
-        self = cls(session)
-        await self._load_all_indexes()
-        return self
-
-    async def _load_all_indexes(self):
-        """Load all 6 indexes from database on initialization."""
-        try:
-            # Run all 6 queries and cache results
-            self._pokemon_index = await self._query_pokemon_index()
-            self._move_index = await self._query_move_index()
-            self._stat_index = await self._query_stat_index()
-            self._stat_spread_index = await self._query_stat_spread_index()
-            self._type_index = await self._query_type_index()
-            self._type_matchup_index = await self._query_type_matchup_index()
-            self._machine_moves_index = await self._query_machine_moves_index()
-        except DatabaseError as e:
-            logger.error("Database query failed", error=str(e))
-            raise
+from backend.src.config.settings import Settings
+from backend.src.lib.cold_fields import COLD_FIELDS, ColdFieldStore
+from backend.src.lib.fixtures import iter_fixture_records
+from backend.src.lib.move_index import PackedMoveIndex
+from backend.src.lib.records import PokemonRecord
+from backend.src.lib.snapshot_format import read_index_snapshot, write_index_snapshot
+from backend.src.lib.type_chart import TypeChart
+from backend.src.lib.type_matrix import TypeMatrix
 
+logger = structlog.get_logger(__name__)
 
+IndexT = TypeVar("IndexT")
+
+# Every cached index, in load order; snapshots store them under these names
+INDEX_ATTRIBUTES = (
+    "_pokemon_index",
+    "_move_index",
+    "_stat_index",
+    "_stat_spread_index",
+    "_type_index",
+    "_type_matchup_index",
+    "_type_matrix",
+    "_machine_moves_index",
+)
+
+# Database queries behind those indexes: (log name, query method, attributes it fills).
+# The matchup query fills two indexes, so there is one fewer query than index.
+INDEX_QUERIES = (
+    ("pokemon", "_query_pokemon_index", ("_pokemon_index",)),
+    ("move", "_query_move_index", ("_move_index",)),
+    ("stat", "_query_stat_index", ("_stat_index",)),
+    ("stat_spread", "_query_stat_spread_index", ("_stat_spread_index",)),
+    ("type", "_query_type_index", ("_type_index",)),
+    ("type_matchup", "_query_type_matchups", ("_type_matchup_index", "_type_matrix")),
+    ("machine_moves", "_query_machine_moves_index", ("_machine_moves_index",)),
+)
+
+# Learnsets sort after every real TM/TR id
+_NO_MACHINE_ID = "\uffff"
+
+class AbstractRepository():
+    """
+    Public interface shared by every repository: the cached indexes.
+
+    Subclasses only differ in where the indexes come from.
+    """
+    _pokemon_index: dict[str, PokemonRecord]
+    _move_index: PackedMoveIndex
+    _stat_index: dict[str, dict[str, int]]
+    _stat_spread_index: dict[str, Any]
+    _type_index: dict[str, frozenset[str]]
+    _type_matchup_index: dict[str, dict[str, frozenset[str]]]
+    _type_matrix: TypeMatrix
+    _machine_moves_index: dict
+    # Derived from _move_index + _machine_moves_index; never stored in snapshots
+    _learnset_index: dict[str, dict[str, dict[str, Any]]]
+
+    def _log_loaded(self, started: float, mode: str) -> None:
         logger.info(
             "All indexes loaded successfully",
+            mode=mode,
+            elapsed_ms=round((perf_counter() - started) * 1000, 2),
             pokemon_count=len(self._pokemon_index),
             move_count=len(self._move_index),
             stat_count=len(self._stat_index),
             stat_spread_count=len(self._stat_spread_index),
             type_count=len(self._type_index),
             type_matchup_count=len(self._type_matchup_index),
+            type_matrix_size=len(self._type_matrix),
             machine_moves_count=len(self._machine_moves_index),
+            learnset_count=len(self._learnset_index),
             )
 
-    async def _query_pokemon_index(self) -> dict[str,dict[str,Any]]:
-        result = await self.session.execute(text("""
-            SELECT * from pokemon
-        """))
-        rows = result.all()
-
-        pokemon_index = {}
+    def write_snapshot(self, path: Path, dataset: str) -> None:
+        """Persist every index so SnapshotRepository can open it without a database."""
+        indexes = {attr: getattr(self, attr) for attr in INDEX_ATTRIBUTES}
+        write_index_snapshot(path, indexes, dataset=dataset)
 
+    # Index builders - shared by every source that yields row mappings
+    @staticmethod
+    def _build_pokemon_index(rows: Iterable[Mapping[str, Any]]) -> dict[str, PokemonRecord]:
+        hot_rows = []
+        cold_rows = []
         for row in rows:
-            pokemon_index[row.name] = {
-                "display_name": row.display_name,
-                "number": row.number,
-                "height": row.height,
-                "weight": row.weight,
-                "sprite_url": row.sprite_url,
-                "description": row.description,
-                "genus": row.genus,
-                "type_display": row.type_display,
-                "is_legendary": row.is_legendary,  # Fixed typo
-                "is_mythical": row.is_mythical,
-                "is_ultra_beast": row.is_ultra_beast
-            }
+            hot_rows.append((
+                intern(row["name"]),
+                row["number"],
+                row["height"],
+                row["weight"],
+                # A few dozen distinct combos shared by every species
+                intern(row["type_display"]),
+                row["is_legendary"],
+                row["is_mythical"],
+                row["is_ultra_beast"],
+            ))
+            cold_rows.append(tuple(row[field] for field in COLD_FIELDS))
+
+        # Pokédex text is packed into one shared store and decoded on demand
+        cold = ColdFieldStore.from_rows(cold_rows)
+        pokemon_index = {
+            name: PokemonRecord(*hot, cold=cold, cold_id=cold_id)
+            for cold_id, (name, *hot) in enumerate(hot_rows)
+        }
         logger.info(
                 "Pokemon info index created successfully",
                 pokemon_count=len(pokemon_index)
             )
         return pokemon_index
 
-    async def _query_move_index(self) -> dict[str, dict[str, dict[str, Any]]]:
-        """Query move index: {move_name: {pokemon_name: {learn_method: level/True}}}"""
-
-        result = await self.session.execute(text("""
-            SELECT pm.move_name, p.name as pokemon_name, pm.learn_method, pm.level
-            FROM pokemon_move pm
-            JOIN pokemon p ON pm.pokemon_id = p.id
-            ORDER BY pm.move_name, p.name
-        """))
-        rows = result.all()
-        
+    @staticmethod
+    def _build_move_index(rows: Iterable[Mapping[str, Any]]) -> PackedMoveIndex:
+        """Build move index: {move_name: {pokemon_name: {learn_method: level/True}}}, packed"""
         move_index = {}
         for row in rows:
-            move_name = row.move_name
-            pokemon_name = row.pokemon_name
-            method = row.learn_method
-            level = row.level
+            # Each row carries fresh copies of these; interning keeps one of each
+            move_name = intern(row["move_name"])
+            pokemon_name = intern(row["pokemon_name"])
+            method = intern(row["learn_method"])
+            level = row["level"]
 
             # Initialize move entry
             if move_name not in move_index:
@@ -107,31 +144,66 @@ class SQLAlchemyRepository():
                 # machine, tutor, egg stored as boolean
                 move_index[move_name][pokemon_name][method] = True
 
+        # The per-pair dicts above are only scratch; the index keeps arrays
+        packed = PackedMoveIndex.from_pairs(move_index)
+
         logger.info(
             "Move index created successfully",
-            move_count=len(move_index)
+            move_count=len(packed)
             )
-        return move_index
+        return packed
+
+    @staticmethod
+    def _build_learnset_index(
+        move_index: Mapping[str, Mapping[str, dict[str, Any]]],
+        machine_moves_index: Mapping[str, str]
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Build the reverse of the move index: {pokemon_name: {move_name: {learn_method: level/True}}}
+
+        Each learn-method dict is the same object the move index hands out, so
+        the reverse index only costs its own outer dicts. Every learnset is
+        ordered level-up moves by level, then machine moves by TM/TR id
+        (joined from the machine moves index), then the rest by name.
+        """
+        learnsets: dict[str, list[tuple[int, int | str, str, dict[str, Any]]]] = {}
+        for move_name, learners in move_index.items():
+            machine_id = machine_moves_index.get(move_name)
+            for pokemon_name, methods in learners.items():
+                if "level-up" in methods:
+                    key = (0, methods["level-up"] or 0)
+                elif "machine" in methods and machine_id is not None:
+                    key = (1, machine_id)
+                else:
+                    key = (2, _NO_MACHINE_ID)
+                learnsets.setdefault(pokemon_name, []).append((*key, move_name, methods))
+
+        learnset_index = {
+            pokemon_name: {move_name: methods for *_, move_name, methods in sorted(entries, key=lambda e: e[:3])}
+            for pokemon_name, entries in learnsets.items()
+        }
 
-    async def _query_stat_index(self) -> dict[str, dict[str, int]]:
-        """Query base stats: {pokemon_name: {stat_name: value}}"""
-        result = await self.session.execute(text("""
-            SELECT p.name, s.hp, s.attack, s.defense,
-                   s.special_attack, s.special_defense, s.speed
-            FROM pokemon_stats s
-            JOIN pokemon p ON s.pokemon_id = p.id
-        """))
-        rows = result.all()
+        logger.info(
+            "Learnset index created successfully",
+            learnset_count=len(learnset_index)
+            )
+        return learnset_index
+
+    def _index_learnsets(self) -> None:
+        self._learnset_index = self._build_learnset_index(self._move_index, self._machine_moves_index)
 
+    @staticmethod
+    def _build_stat_index(rows: Iterable[Mapping[str, Any]]) -> dict[str, dict[str, int]]:
+        """Build base stats: {pokemon_name: {stat_name: value}}"""
         stat_index = {}
         for row in rows:
-            stat_index[row.name] = {
-                "hp": row.hp,
-                "attack": row.attack,
-                "defense": row.defense,
-                "special_attack": row.special_attack,
-                "special_defense": row.special_defense,
-                "speed": row.speed
+            stat_index[intern(row["pokemon_name"])] = {
+                "hp": row["hp"],
+                "attack": row["attack"],
+                "defense": row["defense"],
+                "special_attack": row["special_attack"],
+                "special_defense": row["special_defense"],
+                "speed": row["speed"]
             }
 
         logger.info(
@@ -139,30 +211,24 @@ class SQLAlchemyRepository():
             stat_count=len(stat_index))
         return stat_index
 
-    async def _query_stat_spread_index(self) -> dict[str, Any]:
-        """Query stat distribution: {STAT_MEDIANS: {...}, QUINTILES: {...}}"""
-        result = await self.session.execute(text("""
-            SELECT stat_name, percentile_20, percentile_40, percentile_60,
-                   percentile_80, percentile_100, median
-            FROM stat_spread
-        """))
-        rows = result.all()
-        
+    @staticmethod
+    def _build_stat_spread_index(rows: Iterable[Mapping[str, Any]]) -> dict[str, Any]:
+        """Build stat distribution: {STAT_MEDIANS: {...}, QUINTILES: {...}}"""
         medians = {}
         quintiles = {}
         for row in rows:
-            stat_name = row.stat_name
+            stat_name = row["stat_name"]
 
             # Store median
-            medians[stat_name] = row.median
+            medians[stat_name] = row["median"]
 
             # Store quintiles
             quintiles[stat_name] = {
-                "20th": row.percentile_20,
-                "40th": row.percentile_40,
-                "60th": row.percentile_60,
-                "80th": row.percentile_80,
-                "100th": row.percentile_100
+                "20th": row["percentile_20"],
+                "40th": row["percentile_40"],
+                "60th": row["percentile_60"],
+                "80th": row["percentile_80"],
+                "100th": row["percentile_100"]
             }
         
         logger.info(
@@ -172,21 +238,13 @@ class SQLAlchemyRepository():
             "QUINTILES": quintiles
         }
 
-    async def _query_type_index(self) -> dict[str, frozenset[str]]:
-        """Query type index: {type_name: frozenset(pokemon_names)}"""
-        result = await self.session.execute(text("""
-            SELECT t.name as type_name, p.name as pokemon_name
-            FROM pokemon_type pt
-            JOIN type t ON pt.type_id = t.id
-            JOIN pokemon p ON pt.pokemon_id = p.id
-            ORDER BY t.name
-        """))
-        rows = result.all()
-
+    @staticmethod
+    def _build_type_index(rows: Iterable[Mapping[str, Any]]) -> dict[str, frozenset[str]]:
+        """Build type index: {type_name: frozenset(pokemon_names)}"""
         type_index = {}
         for row in rows:
-            type_name = row.type_name
-            pokemon_name = row.pokemon_name
+            type_name = intern(row["type_name"])
+            pokemon_name = intern(row["pokemon_name"])
 
             if type_name not in type_index:
                 type_index[type_name] = []
@@ -204,23 +262,14 @@ class SQLAlchemyRepository():
             )
         return filtered
 
-    async def _query_type_matchup_index(self) -> dict[str, dict[str, frozenset[str]]]:
-        """Query type matchups: {defending_type: {category: frozenset(attacking_types)}}"""
-        result = await self.session.execute(text("""
-            SELECT defender.name as defender_type,
-                   attacker.name as attacker_type,
-                   tm.multiplier
-            FROM type_matchup tm
-            JOIN type defender ON tm.defender_type_id = defender.id
-            JOIN type attacker ON tm.attacker_type_id = attacker.id
-        """))
-        rows = result.all()
-
+    @staticmethod
+    def _build_type_matchup_index(rows: Iterable[Mapping[str, Any]]) -> dict[str, dict[str, frozenset[str]]]:
+        """Build type matchups: {defending_type: {category: frozenset(attacking_types)}}"""
         matchup_index = {}
         for row in rows:
-            defender = row.defender_type
-            attacker = row.attacker_type
-            multiplier = row.multiplier
+            defender = row["defender_type"]
+            attacker = row["attacker_type"]
+            multiplier = row["multiplier"]
 
             # Initialize defender entry
             if defender not in matchup_index:
@@ -253,29 +302,45 @@ class SQLAlchemyRepository():
             matchup_count=len(matchups))
         return matchups
 
-    async def _query_machine_moves_index(self) -> dict:
-        """Query machine moves index: {move_name: machine_id}"""
-        result = await self.session.execute(text("""
-            SELECT name, machine_id FROM tm WHERE machine_id IS NOT NULL;
-        """))
-        rows = result.all()
-        
+    @staticmethod
+    def _build_type_matrix(rows: Iterable[Mapping[str, Any]]) -> TypeMatrix:
+        """Build exact multipliers as a dense (defender, attacker) log2 matrix"""
+        type_matrix = TypeMatrix.from_rows(rows)
+
+        logger.info(
+            "Type matrix created successfully",
+            type_count=len(type_matrix))
+        return type_matrix
+
+    @classmethod
+    def _build_type_matchups(
+        cls,
+        rows: Iterable[Mapping[str, Any]]
+    ) -> tuple[dict[str, dict[str, frozenset[str]]], TypeMatrix]:
+        """Build the matchup index and the type matrix from one read of the matchup rows"""
+        rows = list(rows)
+        return cls._build_type_matchup_index(rows), cls._build_type_matrix(rows)
+
+    @staticmethod
+    def _build_machine_moves_index(rows: Iterable[Mapping[str, Any]]) -> dict:
+        """Build machine moves index: {move_name: machine_id}"""
         machine_moves_index = {}
         for row in rows:
-           machine_moves_index[row.name] = row.machine_id
+            # Moves without a machine are kept out, like the SQL filter does
+            if row["machine_id"] is not None:
+                machine_moves_index[intern(row["name"])] = row["machine_id"]
 
         logger.info(
             "Machine moves index created successfully",
             machine_moves_count=len(machine_moves_index))
         return machine_moves_index
-    
-        
+
     # Public interface - return cached indexes
-    def get_pokemon_index(self) -> dict[str, dict[str,Any]]:
+    def get_pokemon_index(self) -> dict[str, PokemonRecord]:
         return self._pokemon_index
 
-    def get_move_index(self) -> dict[str, dict[str, dict[str, Any]]]:
-        """Returns move index: {move_name: {pokemon_name: {learn_method: data}}}"""
+    def get_move_index(self) -> PackedMoveIndex:
+        """Returns move index: {move_name: {pokemon_name: {learn_method: data}}} (read-only views)"""
         return self._move_index
 
     def get_stat_index(self) -> dict[str, dict[str, int]]:
@@ -294,9 +359,250 @@ class SQLAlchemyRepository():
         """Returns matchups: {defending_type: {category: frozenset(attacking_types)}}"""
         return self._type_matchup_index
 
+    def get_type_matrix(self) -> TypeMatrix:
+        """Returns exact multipliers: TypeMatrix of (defending_type, attacking_type)"""
+        return self._type_matrix
+
     def get_machine_moves_index(self) -> dict:
         return self._machine_moves_index
 
+    def get_learnset_index(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Returns learnsets: {pokemon_name: {move_name: {learn_method: data}}}, level-up moves first"""
+        return self._learnset_index
+
+    def get_type_chart(self) -> TypeChart:
+        """Returns every single/dual combo's matchups, precomputed once from the type matrix"""
+        # Derived like the learnset index, but built on first use; never in a snapshot
+        chart = self.__dict__.get("_type_chart")
+        if chart is None:
+            chart = self._type_chart = TypeChart(self._type_matrix)
+        return chart
+
+
+class SQLAlchemyRepository(AbstractRepository):
+    def __init__(self, session: AsyncSession | None):
+        self.session = session
+    
+    @classmethod
+    async def create(cls, session: AsyncSession):
+        self = cls(session)
+        await self._load_all_indexes()
+        return self
+
+    @classmethod
+    async def create_concurrent(cls, db_url: str):
+        """Load every index in parallel over a short-lived connection pool."""
+        engine = create_async_engine(db_url, pool_size=len(INDEX_QUERIES), max_overflow=0)
+        try:
+            self = cls(None)
+            await self._load_all_indexes_concurrently(
+                async_sessionmaker(engine, expire_on_commit=False)
+                )
+        finally:
+            await engine.dispose()
+        return self
+
+    async def _timed(self, index_name: str, query: Awaitable[IndexT]) -> IndexT:
+        """Await one index query and log how long it took."""
+        started = perf_counter()
+        index = await query
+        logger.info(
+            "Index query finished",
+            index=index_name,
+            elapsed_ms=round((perf_counter() - started) * 1000, 2)
+            )
+        return index
+
+    async def _load_all_indexes(self):
+        """Load every index from database on initialization, one after another."""
+        started = perf_counter()
+        try:
+            # Run every query and cache results
+            self._pokemon_index = await self._timed("pokemon", self._query_pokemon_index())
+            self._move_index = await self._timed("move", self._query_move_index())
+            self._stat_index = await self._timed("stat", self._query_stat_index())
+            self._stat_spread_index = await self._timed("stat_spread", self._query_stat_spread_index())
+            self._type_index = await self._timed("type", self._query_type_index())
+            self._type_matchup_index, self._type_matrix = await self._timed(
+                "type_matchup", self._query_type_matchups())
+            self._machine_moves_index = await self._timed("machine_moves", self._query_machine_moves_index())
+        except DatabaseError as e:
+            logger.error("Database query failed", error=str(e))
+            raise
+
+        self._index_learnsets()
+        self._log_loaded(started, mode="sequential")
+
+    async def _load_all_indexes_concurrently(self, session_factory: async_sessionmaker[AsyncSession]):
+        """Load every index at once, each query on its own pooled session."""
+        started = perf_counter()
+
+        async def load(index_name: str, query: Callable[..., Awaitable[IndexT]]) -> IndexT:
+            async with session_factory() as session:
+                return await self._timed(index_name, query(session))
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    (tg.create_task(load(index_name, getattr(self, query))), attributes)
+                    for index_name, query, attributes in INDEX_QUERIES
+                ]
+        except* DatabaseError as eg:
+            logger.error("Database query failed", error=str(eg.exceptions[0]))
+            raise
+
+        for task, attributes in tasks:
+            values = task.result() if len(attributes) > 1 else (task.result(),)
+            for attribute, value in zip(attributes, values, strict=True):
+                setattr(self, attribute, value)
+        self._index_learnsets()
+
+        self._log_loaded(started, mode="concurrent")
+
+    def _session(self, session: AsyncSession | None) -> AsyncSession:
+        """Query on the given session, falling back to the one passed to create()."""
+        session = session or self.session
+        if session is None:
+            raise ValueError("No database session available for index query")
+        return session
+
+    async def _query_pokemon_index(self, session: AsyncSession | None = None) -> dict[str, PokemonRecord]:
+        result = await self._session(session).execute(text("""
+            SELECT name, number, height, weight, type_display,
+                   is_legendary, is_mythical, is_ultra_beast,
+                   display_name, sprite_url, description, genus
+            FROM pokemon
+        """))
+        return self._build_pokemon_index(result.mappings())
+
+    async def _query_move_index(self, session: AsyncSession | None = None) -> PackedMoveIndex:
+        """Query move index: {move_name: {pokemon_name: {learn_method: level/True}}}"""
+
+        result = await self._session(session).execute(text("""
+            SELECT pm.move_name, p.name as pokemon_name, pm.learn_method, pm.level
+            FROM pokemon_move pm
+            JOIN pokemon p ON pm.pokemon_id = p.id
+            ORDER BY pm.move_name, p.name
+        """))
+        return self._build_move_index(result.mappings())
+
+    async def _query_stat_index(self, session: AsyncSession | None = None) -> dict[str, dict[str, int]]:
+        """Query base stats: {pokemon_name: {stat_name: value}}"""
+        result = await self._session(session).execute(text("""
+            SELECT p.name as pokemon_name, s.hp, s.attack, s.defense,
+                   s.special_attack, s.special_defense, s.speed
+            FROM pokemon_stats s
+            JOIN pokemon p ON s.pokemon_id = p.id
+        """))
+        return self._build_stat_index(result.mappings())
+
+    async def _query_stat_spread_index(self, session: AsyncSession | None = None) -> dict[str, Any]:
+        """Query stat distribution: {STAT_MEDIANS: {...}, QUINTILES: {...}}"""
+        result = await self._session(session).execute(text("""
+            SELECT stat_name, percentile_20, percentile_40, percentile_60,
+                   percentile_80, percentile_100, median
+            FROM stat_spread
+        """))
+        return self._build_stat_spread_index(result.mappings())
+
+    async def _query_type_index(self, session: AsyncSession | None = None) -> dict[str, frozenset[str]]:
+        """Query type index: {type_name: frozenset(pokemon_names)}"""
+        result = await self._session(session).execute(text("""
+            SELECT t.name as type_name, p.name as pokemon_name
+            FROM pokemon_type pt
+            JOIN type t ON pt.type_id = t.id
+            JOIN pokemon p ON pt.pokemon_id = p.id
+            ORDER BY t.name
+        """))
+        return self._build_type_index(result.mappings())
+
+    async def _query_type_matchups(
+        self,
+        session: AsyncSession | None = None
+    ) -> tuple[dict[str, dict[str, frozenset[str]]], TypeMatrix]:
+        """Query type matchups once: {defending_type: {category: frozenset(attacking_types)}} and the TypeMatrix"""
+        result = await self._session(session).execute(text("""
+            SELECT defender.name as defender_type,
+                   attacker.name as attacker_type,
+                   tm.multiplier
+            FROM type_matchup tm
+            JOIN type defender ON tm.defender_type_id = defender.id
+            JOIN type attacker ON tm.attacker_type_id = attacker.id
+        """))
+        return self._build_type_matchups(result.mappings())
+
+    async def _query_machine_moves_index(self, session: AsyncSession | None = None) -> dict:
+        """Query machine moves index: {move_name: machine_id}"""
+        result = await self._session(session).execute(text("""
+            SELECT name, machine_id FROM tm WHERE machine_id IS NOT NULL;
+        """))
+        return self._build_machine_moves_index(result.mappings())
+
+
+class SnapshotRepository(AbstractRepository):
+    """Serves indexes from an on-disk snapshot, never touching the database."""
+
+    @classmethod
+    def open(cls, path: Path, dataset: str):
+        started = perf_counter()
+        indexes = read_index_snapshot(path, dataset=dataset)
+
+        self = cls()
+        for attr in INDEX_ATTRIBUTES:
+            setattr(self, attr, indexes[attr])
+        self._index_learnsets()
+
+        self._log_loaded(started, mode="snapshot")
+        return self
+
+class FixtureRepository(AbstractRepository):
+    """
+    Builds indexes straight from the JSON fixtures, with no database at all.
+
+    Rows are streamed through the same builders the SQL path uses. Joins the
+    SQL queries do against `pokemon` are reproduced by dropping rows for
+    pokemon missing from pokemon.json.
+    """
+
+    @classmethod
+    def create(cls, settings: Settings):
+        """Blocking: reads every fixture file. Run it off the event loop."""
+        started = perf_counter()
+        self = cls()
+
+        self._pokemon_index = self._build_pokemon_index(self._records(settings.pokemon_fixture_path))
+        known = self._pokemon_index.keys()
+
+        self._move_index = self._build_move_index(
+            self._records(settings.pokemon_move_fixture_path, known))
+        self._stat_index = self._build_stat_index(
+            self._records(settings.pokemon_stats_fixture_path, known))
+        self._stat_spread_index = self._build_stat_spread_index(
+            self._records(settings.stat_spreads_fixture_path))
+        self._type_index = self._build_type_index(
+            self._records(settings.pokemon_type_fixture_path, known))
+        self._type_matchup_index, self._type_matrix = self._build_type_matchups(
+            self._records(settings.type_matchups_fixture_path))
+        self._machine_moves_index = self._build_machine_moves_index(
+            self._records(settings.tm_fixture_path))
+        self._index_learnsets()
+
+        self._log_loaded(started, mode="fixtures")
+        return self
+
+    @staticmethod
+    def _records(path: Path, known_pokemon: Container[str] | None = None) -> Iterator[dict[str, Any]]:
+        try:
+            for record in iter_fixture_records(path):
+                if known_pokemon is None or record["pokemon_name"] in known_pokemon:
+                    yield record
+        except FileNotFoundError as e:
+            logger.error("Fixture file not found", filepath=str(path), error=str(e))
+            raise
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse JSON", filepath=str(path), error=str(e))
+            raise
+
 # # Phase 1 (Deprecated)
 # class JsonRepository(AbstractRepository):
 #     def __init__(self, data_dir: Path):
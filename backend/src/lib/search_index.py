@@ -0,0 +1,203 @@
+"""
+Prefix and fuzzy lookup over a fixed set of names (pokemon or moves).
+
+Prefix matches use the sorted names as a flattened trie: every name that
+starts with a prefix sits in one contiguous run, found with two bisects.
+The same runs are kept per name length too, so the shortest completions
+of a prefix are read directly instead of sorting its whole run.
+Fuzzy matches use a trigram index - each name padded as "  name " is split
+into overlapping 3-character grams, and candidates are ranked by how many
+grams they share with the query (Jaccard similarity). Both are built once
+per snapshot; queries never scan the whole vocabulary.
+"""
+import re
+
+from bisect import bisect_left
+from time import perf_counter
+from typing import Iterable
+
+# Below this Jaccard similarity a name is not offered as a fuzzy match
+MIN_SIMILARITY = 0.3
+
+# Longer queries are cut down before matching, keeping per-query work bounded
+MAX_QUERY_LENGTH = 32
+
+_SEPARATORS = re.compile(r"[\s_\-]+")
+
+# Prefix runs up to this many times the limit are sorted whole instead of
+# walked by length
+SMALL_PREFIX_RUN = 4
+
+# Sorts after every character a normalized name can contain
+_PREFIX_END = "\uffff"
+
+
+def normalize(text: str) -> str:
+    """Lowercase, with spaces / hyphens / underscores folded into one "-"."""
+    return _SEPARATORS.sub("-", text.strip().lower())
+
+
+def trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class Suggestion():
+    """One ranked match for a query."""
+
+    __slots__ = ("name", "match", "score")
+
+    def __init__(self, name: str, match: str, score: float):
+        self.name = name
+        # "exact", "prefix" or "fuzzy"
+        self.match = match
+        self.score = score
+
+    def __repr__(self) -> str:
+        return f"Suggestion({self.name!r}, {self.match!r}, {self.score!r})"
+
+
+class SearchIndex():
+    """
+    Sorted prefix array and trigram postings for one vocabulary.
+
+    Built once per snapshot alongside SpeciesBitsets; read-only afterwards.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        entries = sorted({(normalize(name), name) for name in names})
+        self._keys: tuple[str, ...] = tuple(key for key, _ in entries)
+        self.names: tuple[str, ...] = tuple(name for _, name in entries)
+
+        # (length, sorted keys, names) per normalized length, shortest first
+        by_length: dict[int, list[tuple[str, str]]] = {}
+        for key, name in entries:
+            by_length.setdefault(len(key), []).append((key, name))
+        self._by_length: tuple[tuple[int, tuple[str, ...], tuple[str, ...]], ...] = tuple(
+            (length, tuple(key for key, _ in group), tuple(name for _, name in group))
+            for length, group in sorted(by_length.items())
+        )
+
+        # trigram -> ids of every name containing it, plus each name's gram count
+        postings: dict[str, list[int]] = {}
+        self._gram_counts: list[int] = []
+        for i, key in enumerate(self._keys):
+            grams = trigrams(key)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+        self._postings: dict[str, tuple[int, ...]] = {
+            gram: tuple(ids) for gram, ids in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Names whose normalized form starts with `prefix`, in sorted order."""
+        key = normalize(prefix)
+        start = bisect_left(self._keys, key)
+        end = bisect_left(self._keys, key + _PREFIX_END, lo=start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return list(self.names[start:end])
+
+    def shortest_prefix(self, prefix: str, limit: int) -> list[str]:
+        """Up to `limit` names starting with `prefix`, shortest first, then in sorted order."""
+        key = normalize(prefix)
+        start = bisect_left(self._keys, key)
+        end = bisect_left(self._keys, key + _PREFIX_END, lo=start)
+        if end - start <= SMALL_PREFIX_RUN * limit:
+            # Small run: a stable sort by length keeps key order within a length
+            run = sorted(range(start, end), key=lambda i: len(self._keys[i]))
+            return [self.names[i] for i in run[:limit]]
+
+        # Large run (short prefixes): read the shortest lengths' runs only
+        found: list[str] = []
+        for length, keys, names in self._by_length:
+            if len(found) >= limit:
+                break
+            if length < len(key):
+                continue
+            start = bisect_left(keys, key)
+            end = bisect_left(keys, key + _PREFIX_END, lo=start)
+            found.extend(names[start:min(end, start + limit - len(found))])
+        return found
+
+    def fuzzy(
+        self,
+        query: str,
+        limit: int = 10,
+        deadline: float | None = None
+    ) -> tuple[list[Suggestion], bool]:
+        """
+        Names sharing enough trigrams with `query`, most similar first.
+
+        Args:
+            query: Free text, normalized before matching
+            limit: Most suggestions returned
+            deadline: perf_counter() time after which postings stop being read
+
+        Returns:
+            (suggestions, complete) - complete is False if the deadline cut
+            the postings scan short
+        """
+        grams = trigrams(normalize(query)[:MAX_QUERY_LENGTH])
+        shared: dict[int, int] = {}
+        complete = True
+
+        # Rarest grams first, so a cut-off scan has read the most telling ones
+        for gram in sorted(grams, key=lambda g: len(self._postings.get(g, ()))):
+            if deadline is not None and perf_counter() > deadline:
+                complete = False
+                break
+            for i in self._postings.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+
+        scored = []
+        for i, count in shared.items():
+            score = count / (len(grams) + self._gram_counts[i] - count)
+            if score >= MIN_SIMILARITY:
+                scored.append((-score, self.names[i]))
+        scored.sort()
+
+        return [Suggestion(name, "fuzzy", round(-score, 3)) for score, name in scored[:limit]], complete
+
+    def suggest(
+        self,
+        query: str,
+        limit: int = 10,
+        deadline: float | None = None
+    ) -> tuple[list[Suggestion], bool]:
+        """
+        Exact match, then prefix matches (shortest first), then fuzzy matches.
+
+        Prefix matches score 1.0 (exact) or below it by how much of the name
+        the query covers; fuzzy matches score their trigram similarity.
+
+        Returns:
+            (suggestions, complete) - see fuzzy()
+        """
+        key = normalize(query)[:MAX_QUERY_LENGTH]
+        if not key:
+            return [], True
+
+        if deadline is not None and perf_counter() > deadline:
+            return [], False
+
+        suggestions: list[Suggestion] = []
+        seen: set[str] = set()
+        # Shortest completions first: "pika" -> pikachu before pikachu-gmax
+        for name in self.shortest_prefix(key, limit):
+            if normalize(name) == key:
+                suggestions.append(Suggestion(name, "exact", 1.0))
+            else:
+                suggestions.append(Suggestion(name, "prefix", round(0.5 + 0.5 * len(key) / len(name), 3)))
+            seen.add(name)
+
+        complete = True
+        if len(suggestions) < limit:
+            fuzzy, complete = self.fuzzy(key, limit + len(seen), deadline)
+            suggestions.extend(s for s in fuzzy if s.name not in seen)
+
+        return suggestions[:limit], complete
@@ -0,0 +1,169 @@
+"""
+On-disk index snapshot format.
+
+Layout (all integers little-endian):
+
+    [0:8]       MAGIC
+    [8:12]      header length N (uint32)
+    [12:12+N]   header, UTF-8 JSON:
+                {"format_version", "schema_revision", "dataset",
+                 "payload_size", "payload_sha256", "buffer_sizes",
+                 "created_at"}
+    [12+N:]     payload, pickle (protocol 5) of {index_attribute: index},
+                followed by its out-of-band buffers back to back
+
+The file is memory-mapped on read, so the checksum and unpickling work
+straight off the page cache without first copying the file into memory.
+Out-of-band buffers (e.g. ColdFieldStore blobs) are handed to the indexes
+as views of the mapping rather than copied, so the mapping stays open for
+as long as any index holds one; their pages are only faulted in when read.
+The checksum covers the payload and every buffer.
+"""
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import structlog
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from backend.src.lib.exceptions import (
+    IndexSnapshotCorruptError,
+    IndexSnapshotMismatchError,
+)
+
+logger = structlog.get_logger(__name__)
+
+MAGIC = b"PKFIDX\x00\x00"
+HEADER_LENGTH = struct.Struct("<I")
+
+# Bump whenever the shape of any cached index changes
+INDEX_FORMAT_VERSION = 5
+
+# Alembic head the indexes were queried from; bump with new migrations
+SCHEMA_REVISION = "ec1669b28087"
+
+
+def write_index_snapshot(path: Path, indexes: dict[str, Any], dataset: str) -> None:
+    """Write indexes to `path` atomically (temp file + rename)."""
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(indexes, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+
+    checksum = hashlib.sha256(payload)
+    for raw in raw_buffers:
+        checksum.update(raw)
+    header = json.dumps({
+        "format_version": INDEX_FORMAT_VERSION,
+        "schema_revision": SCHEMA_REVISION,
+        "dataset": dataset,
+        "payload_size": len(payload),
+        "payload_sha256": checksum.hexdigest(),
+        "buffer_sizes": [raw.nbytes for raw in raw_buffers],
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }).encode()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(HEADER_LENGTH.pack(len(header)))
+        f.write(header)
+        f.write(payload)
+        for raw in raw_buffers:
+            f.write(raw)
+    os.replace(tmp_path, path)
+
+    logger.info(
+        "Index snapshot written",
+        path=str(path),
+        dataset=dataset,
+        size_bytes=len(payload) + sum(raw.nbytes for raw in raw_buffers)
+        )
+
+
+def read_index_snapshot(path: Path, dataset: str) -> dict[str, Any]:
+    """Map `path`, validate it against this build and dataset, and return its indexes."""
+    if path.stat().st_size == 0:
+        raise IndexSnapshotCorruptError(f"Not an index snapshot: {path}")
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        header, offset = _read_header(mapped, path)
+        _validate_header(header, path, dataset)
+
+        payload_size = header.get("payload_size")
+        buffer_sizes = header.get("buffer_sizes")
+        if not isinstance(payload_size, int) or not isinstance(buffer_sizes, list):
+            raise IndexSnapshotCorruptError(f"Unreadable snapshot header in {path}")
+        if payload_size + sum(buffer_sizes) != len(mapped) - offset:
+            raise IndexSnapshotCorruptError(f"Snapshot {path} is truncated")
+
+        with memoryview(mapped) as view:
+            payload = view[offset:offset + payload_size]
+            buffers = []
+            start = offset + payload_size
+            for size in buffer_sizes:
+                buffers.append(view[start:start + size])
+                start += size
+
+            checksum = hashlib.sha256(payload)
+            for buffer in buffers:
+                checksum.update(buffer)
+            valid = checksum.hexdigest() == header.get("payload_sha256")
+            indexes = pickle.loads(payload, buffers=buffers) if valid else None
+            payload.release()
+            del buffers
+    except BaseException:
+        _close_quietly(mapped)
+        raise
+
+    if indexes is None:
+        _close_quietly(mapped)
+        raise IndexSnapshotCorruptError(f"Snapshot {path} failed its checksum")
+
+    # Indexes still viewing the mapping keep it alive; otherwise unmap now
+    _close_quietly(mapped)
+    return indexes
+
+
+def _close_quietly(mapped: mmap.mmap) -> None:
+    """Unmap unless views of the mapping are still held (it then closes with the last view)."""
+    try:
+        mapped.close()
+    except BufferError:
+        pass
+
+
+def _read_header(mapped: mmap.mmap, path: Path) -> tuple[dict[str, Any], int]:
+    """Returns the parsed header and the offset where the payload starts."""
+    prefix = len(MAGIC) + HEADER_LENGTH.size
+    if len(mapped) < prefix or mapped[:len(MAGIC)] != MAGIC:
+        raise IndexSnapshotCorruptError(f"Not an index snapshot: {path}")
+
+    (header_length,) = HEADER_LENGTH.unpack(mapped[len(MAGIC):prefix])
+    try:
+        header = json.loads(mapped[prefix:prefix + header_length])
+    except ValueError as e:
+        raise IndexSnapshotCorruptError(f"Unreadable snapshot header in {path}: {e}") from e
+
+    return header, prefix + header_length
+
+
+def _validate_header(header: dict[str, Any], path: Path, dataset: str) -> None:
+    expected = {
+        "format_version": INDEX_FORMAT_VERSION,
+        "schema_revision": SCHEMA_REVISION,
+        "dataset": dataset,
+    }
+    for key, value in expected.items():
+        if header.get(key) != value:
+            raise IndexSnapshotMismatchError(
+                f"Snapshot {path} has {key}={header.get(key)!r}, expected {value!r}"
+            )
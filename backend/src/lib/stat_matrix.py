@@ -0,0 +1,147 @@
+"""
+Columnar base-stat storage for stat searches.
+
+The stat index is held as one contiguous int16 column per stat, with rows in
+dense species-ID order (see bitsets.py). The weighted score only depends on
+the stat pair, so the rows are also pre-sorted once per (primary, secondary)
+pair; a search walks that ranking and stops as soon as it has `top_k` hits.
+"""
+from array import array
+from typing import Mapping
+
+from backend.src.lib.bitsets import SpeciesBitsets
+from backend.src.lib.exceptions import InvalidPokemonStatError
+
+STAT_NAMES = ("hp", "attack", "defense", "special_attack", "special_defense", "speed")
+
+# Includes same-stat pairs: ("attack", "attack") ranks by attack alone
+STAT_PAIRS = tuple(
+    (primary, secondary)
+    for primary in STAT_NAMES
+    for secondary in STAT_NAMES
+)
+
+
+def parse_stat_floors(value: str) -> dict[str, int]:
+    """Parse "attack:100,speed:90" into {"attack": 100, "speed": 90}."""
+    floors = {}
+    for part in value.split(","):
+        if not part:
+            continue
+        stat, _, floor = part.partition(":")
+        if stat not in STAT_NAMES:
+            raise InvalidPokemonStatError(
+                f"Invalid stat: '{stat}'. Valid stats: {sorted(STAT_NAMES)}"
+            )
+        try:
+            floors[stat] = int(floor)
+        except ValueError:
+            raise InvalidPokemonStatError(
+                f"Invalid floor for {stat}: '{floor}'. Expected stat:integer"
+            ) from None
+    return floors
+
+
+# Per-row species flags, matched against species_mask()
+LEGENDARY = 1
+MYTHICAL = 2
+ULTRA_BEAST = 4
+
+
+def species_mask(
+    include_legendary: bool = False,
+    include_mythical: bool = False,
+    include_ultra_beasts: bool = False
+) -> int:
+    """Flags a row must not have for the species filters the caller did not opt into."""
+    return (
+        (0 if include_legendary else LEGENDARY)
+        | (0 if include_mythical else MYTHICAL)
+        | (0 if include_ultra_beasts else ULTRA_BEAST)
+    )
+
+
+class StatMatrix():
+    """(n_pokemon, 6) int16 stats stored column-wise, with a parallel name tuple."""
+
+    def __init__(
+        self,
+        stat_index: Mapping[str, Mapping[str, int]],
+        species: SpeciesBitsets,
+        primary_weight: float,
+        secondary_weight: float
+    ):
+        # Only species known to the pokemon index, in ID order
+        names = species.decode(species.known & species.encode(
+            name for name in stat_index if name in species.ids
+            ))
+
+        self.names: tuple[str, ...] = tuple(names)
+        self.columns: dict[str, array] = {
+            stat: array("h", (stat_index[name][stat] for name in names))
+            for stat in STAT_NAMES
+        }
+
+        self.flags = bytearray(len(names))
+        for row, name in enumerate(names):
+            bit = 1 << species.ids[name]
+            self.flags[row] = (
+                (LEGENDARY if species.legendary & bit else 0)
+                | (MYTHICAL if species.mythical & bit else 0)
+                | (ULTRA_BEAST if species.ultra_beast & bit else 0)
+            )
+
+        # Best-first row order for every stat pair; ties keep ID order
+        self.rankings: dict[tuple[str, str], array] = {}
+        for primary_stat, secondary_stat in STAT_PAIRS:
+            primary = self.columns[primary_stat]
+            secondary = self.columns[secondary_stat]
+            self.rankings[(primary_stat, secondary_stat)] = array("i", sorted(
+                range(len(names)),
+                key=lambda row: (-(primary_weight * primary[row] + secondary_weight * secondary[row]), row)
+            ))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def rank(
+        self,
+        primary_stat: str,
+        secondary_stat: str,
+        min_primary: int,
+        min_secondary: int,
+        min_speed: int | None,
+        excluded_flags: int,
+        top_k: int | None = None,
+        offset: int = 0,
+    ) -> list[int]:
+        """Rows passing every filter, best weighted score first.
+
+        Walks the precomputed ranking, so with `top_k` it stops after k hits
+        (counted from `offset`, the number of leading hits to skip).
+        """
+        primary = self.columns[primary_stat]
+        secondary = self.columns[secondary_stat]
+        speed = self.columns["speed"]
+        flags = self.flags
+        floor_speed = min_speed if min_speed is not None else -1
+        limit = len(flags) if top_k is None else top_k
+
+        found = []
+        if limit <= 0:
+            return found
+        skip = offset
+        for row in self.rankings[(primary_stat, secondary_stat)]:
+            if (
+                primary[row] >= min_primary
+                and secondary[row] >= min_secondary
+                and speed[row] >= floor_speed
+                and not flags[row] & excluded_flags
+            ):
+                if skip:
+                    skip -= 1
+                    continue
+                found.append(row)
+                if len(found) == limit:
+                    break
+        return found
@@ -0,0 +1,95 @@
+"""
+Precomputed defensive type chart.
+
+There are only 18 single and 153 dual defending type combos, so every
+attacker exponent, multiplier and the grouped 4x/2x/1x/0.5x/0.25x/0x
+buckets are computed once per index snapshot (from the TypeMatrix) and each
+lookup is a dict access. The repository builds one chart per snapshot
+(get_type_chart), shared by every service that needs combo matchups.
+"""
+from collections import defaultdict
+from itertools import combinations
+from typing import Mapping
+
+from backend.src.lib.type_matrix import TypeMatrix, multiplier_for
+
+# Buckets returned by effectiveness(), strongest first
+EFFECTIVENESS_ORDER = ("4x", "2x", "1x", "0.5x", "0.25x", "0x")
+EFFECTIVENESS_KEYS = {4.0: "4x", 2.0: "2x", 1.0: "1x", 0.5: "0.5x", 0.25: "0.25x", 0.0: "0x"}
+
+TypeCombo = tuple[str, ...]
+
+
+class TypeChart():
+    """
+    Attacker multipliers and grouped effectiveness for every defending combo.
+
+    Combos are keyed by their sorted type names, so ("flying", "fire") and
+    ("fire", "flying") share an entry. Returned dicts are shared between
+    callers and must not be mutated.
+    """
+
+    def __init__(self, type_matrix: TypeMatrix):
+        self._type_matrix = type_matrix
+        self.types: tuple[str, ...] = type_matrix.types
+
+        self._exponents: dict[TypeCombo, tuple[int, ...]] = {}
+        self._multipliers: dict[TypeCombo, dict[str, float]] = {}
+        self._effectiveness: dict[TypeCombo, dict[str, frozenset[str]]] = {}
+
+        # Every single and dual combo, singles first
+        self.combos: tuple[TypeCombo, ...] = (
+            *((t,) for t in self.types),
+            *combinations(sorted(self.types), 2),
+        )
+        for combo in self.combos:
+            exponents = tuple(type_matrix.combo_exponents(*combo))
+            multipliers = dict(zip(self.types, map(multiplier_for, exponents)))
+            self._exponents[combo] = exponents
+            self._multipliers[combo] = multipliers
+            self._effectiveness[combo] = self._group(multipliers)
+
+    @staticmethod
+    def key(types: TypeCombo) -> TypeCombo:
+        return tuple(sorted(types))
+
+    def exponents(self, *types: str) -> tuple[int, ...]:
+        """Summed log2 exponents of every attacker (in `types` order) against the defending `types`."""
+        exponents = self._exponents.get(self.key(types))
+        if exponents is None:
+            exponents = tuple(self._type_matrix.combo_exponents(*types))
+        return exponents
+
+    def multipliers(self, *types: str) -> dict[str, float]:
+        """{attacking_type: multiplier} against the defending `types`."""
+        multipliers = self._multipliers.get(self.key(types))
+        if multipliers is None:
+            # Not a precomputed combo (e.g. the same type twice)
+            multipliers = self._type_matrix.multipliers(*types)
+        return multipliers
+
+    def effectiveness(self, *types: str) -> dict[str, frozenset[str]]:
+        """{"4x": frozenset(attacking_types), ...} against the defending `types`."""
+        effectiveness = self._effectiveness.get(self.key(types))
+        if effectiveness is None:
+            effectiveness = self._group(self._type_matrix.multipliers(*types))
+        return effectiveness
+
+    @staticmethod
+    def _group(multipliers: Mapping[str, float]) -> dict[str, frozenset[str]]:
+        by_effectiveness = defaultdict(list)
+        for attack_type, mult in multipliers.items():
+            # Fallback for weird values, e.g. a triple-type 8x
+            key = EFFECTIVENESS_KEYS.get(mult, f"{mult}x")
+            by_effectiveness[key].append(attack_type)
+
+        # Standard buckets strongest first, then any others, also strongest first
+        extra = sorted(
+            (key for key in by_effectiveness if key not in EFFECTIVENESS_ORDER),
+            key=lambda key: -float(key[:-1])
+        )
+        return {
+            key: frozenset(by_effectiveness[key])
+            for key in (*EFFECTIVENESS_ORDER, *extra)
+            if key in by_effectiveness
+        }
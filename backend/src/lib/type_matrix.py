@@ -0,0 +1,137 @@
+"""
+Dense attacker x defender type matrix with exact multipliers.
+
+Every multiplier in the chart is a power of two (or zero), so each cell is
+stored as its log2 exponent in a signed byte: 2x -> 1, 0.5x -> -1, 4x -> 2.
+Immunity uses a large negative sentinel. The multiplier against a dual
+type is then the sum of two rows, and any sum below IMMUNE_THRESHOLD is
+an immunity.
+"""
+import math
+import operator
+
+from array import array
+from typing import Any, Iterable, Mapping
+
+# log2 exponent stored for a 0x (immune) matchup
+IMMUNE = -64
+
+# Sums at or below this still contain an IMMUNE cell (holds for up to 31 stacked types)
+IMMUNE_THRESHOLD = IMMUNE // 2
+
+
+def exponent_for(multiplier: float) -> int:
+    """log2 exponent for a chart multiplier; 0 maps to IMMUNE."""
+    if multiplier == 0:
+        return IMMUNE
+    exponent = math.log2(multiplier)
+    if not exponent.is_integer():
+        raise ValueError(f"Type multiplier {multiplier!r} is not a power of two")
+    return int(exponent)
+
+
+def multiplier_for(exponent: int) -> float:
+    """Inverse of exponent_for, for a single cell or a summed combo."""
+    if exponent <= IMMUNE_THRESHOLD:
+        return 0.0
+    return 2.0 ** exponent
+
+
+# Precomputed multiplier_for over every sum a single or dual combo can produce
+_MULTIPLIER_BY_EXPONENT = {
+    exponent: multiplier_for(exponent)
+    for exponent in range(2 * IMMUNE - 8, 9)
+}
+
+
+class TypeMatrix():
+    """
+    Row-major (defender, attacker) matrix of log2 multipliers.
+
+    Types are indexed in sorted order; a matchup missing from the source
+    rows is neutral (exponent 0).
+    """
+
+    def __init__(self, types: Iterable[str], exponents: array):
+        self.types: tuple[str, ...] = tuple(types)
+        self.type_ids: dict[str, int] = {t: i for i, t in enumerate(self.types)}
+        self.exponents = exponents
+
+        size = len(self.types)
+        self._rows = [exponents[i * size:(i + 1) * size] for i in range(size)]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> "TypeMatrix":
+        """Build from defender_type / attacker_type / multiplier rows."""
+        cells = {
+            (row["defender_type"], row["attacker_type"]): exponent_for(row["multiplier"])
+            for row in rows
+        }
+        return cls._from_cells(cells)
+
+    @classmethod
+    def from_matchup_index(cls, matchup_index: Mapping[str, Mapping[str, Iterable[str]]]) -> "TypeMatrix":
+        """
+        Build from the legacy category shape.
+
+        That shape folds 4x into double_damage_from, so it can only recover
+        single-type multipliers of 2, 0.5 and 0.
+        """
+        category_exponents = {
+            "double_damage_from": 1,
+            "half_damage_from": -1,
+            "no_damage_from": IMMUNE,
+        }
+        cells = {
+            (defender, attacker): category_exponents[category]
+            for defender, categories in matchup_index.items()
+            for category, attackers in categories.items()
+            for attacker in attackers
+        }
+        return cls._from_cells(cells)
+
+    @classmethod
+    def _from_cells(cls, cells: Mapping[tuple[str, str], int]) -> "TypeMatrix":
+        types = sorted({t for pair in cells for t in pair})
+        type_ids = {t: i for i, t in enumerate(types)}
+        exponents = array("b", bytes(len(types) * len(types)))
+
+        for (defender, attacker), exponent in cells.items():
+            exponents[type_ids[defender] * len(types) + type_ids[attacker]] = exponent
+        return cls(types, exponents)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TypeMatrix):
+            return NotImplemented
+        return self.types == other.types and self.exponents == other.exponents
+
+    def row(self, defender: str) -> array:
+        """Exponents of every attacker (in `types` order) against `defender`."""
+        return self._rows[self.type_ids[defender]]
+
+    def combo_exponents(self, *defenders: str) -> list[int]:
+        """Summed exponents of every attacker against a (multi-)typed defender."""
+        rows = [self.row(defender) for defender in defenders]
+        if len(rows) == 1:
+            return list(rows[0])
+        if len(rows) == 2:
+            return list(map(operator.add, *rows))
+        return [sum(column) for column in zip(*rows)]
+
+    def multipliers(self, *defenders: str) -> dict[str, float]:
+        """{attacking_type: multiplier} against the defending types."""
+        exponents = self.combo_exponents(*defenders)
+        if len(defenders) > 2:
+            return dict(zip(self.types, map(multiplier_for, exponents)))
+        return dict(zip(self.types, map(_MULTIPLIER_BY_EXPONENT.__getitem__, exponents)))
+
+    def multiplier(self, attacker: str, *defenders: str) -> float:
+        attacker_id = self.type_ids[attacker]
+        return multiplier_for(sum(self.row(defender)[attacker_id] for defender in defenders))
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """{defending_type: {attacking_type: multiplier}} - for hashing and debugging."""
+        return {defender: self.multipliers(defender) for defender in self.types}
@@ -0,0 +1,72 @@
+"""
+LRU cache of serialized candidate finder responses.
+
+Search results only depend on the query parameters and the index snapshot
+they were computed from, so a hit skips validation, the search and JSON
+serialization. Entries are the response body bytes. Everything cached for
+an older snapshot is dropped the first time a newer version is seen.
+"""
+from collections import OrderedDict
+from typing import Hashable
+
+from backend.src.config.settings import settings
+
+
+class ResponseCache():
+    """Bounded LRU of response bodies for a single index snapshot version."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._version: int | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _check_version(self, version: int) -> None:
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self._version = version
+
+    def get(self, version: int, key: Hashable) -> bytes | None:
+        """Cached body for `key` under snapshot `version`, marking it most recent."""
+        if not self.enabled:
+            return None
+        self._check_version(version)
+
+        body = self._entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, version: int, key: Hashable, body: bytes) -> None:
+        if not self.enabled:
+            return
+        self._check_version(version)
+
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._version = None
+
+
+response_cache = ResponseCache(settings.response_cache_size)
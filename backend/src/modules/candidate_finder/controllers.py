@@ -1,36 +1,75 @@
 
+import hashlib
 import json
 
-from litestar import get, Controller, Request, Response, MediaType
+from typing import Annotated, Any, AsyncIterator, Callable, Hashable, Iterator
+
+import msgspec
+
+from pydantic import BaseModel
+
+from litestar import get, post, Controller, Request, Response, MediaType
 from litestar.exceptions import NotFoundException, ClientException
-from litestar.status_codes import HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
+from litestar.params import Parameter
+from litestar.response import Stream
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_503_SERVICE_UNAVAILABLE
+)
 
 from backend.src.modules.candidate_finder.urls import (
+    BATCH,
+    CACHE,
+    EXPORT,
+    CANDIDATES,
     HEALTH,
+    INDEXES,
+    INDEXES_RELOAD,
     POKEMON,
     POKEMON_NAME,
+    SUGGEST,
     TYPE_MATCHUPS
 )
 
 from backend.src.lib.exceptions import (
+    IndexesNotLoadedError,
+    InvalidFilterExpressionError,
     InvalidPokemonMoveError,
+    InvalidPokemonNameError,
     InvalidPokemonTypeError,
     InvalidPokemonStatError,
     NoPokemonFoundError,
+    TooManyBatchItemsError,
     TooManyTypesError,
 
 )
 
 from backend.src.modules.candidate_finder.schemas import (
+    BatchLookupRequest,
+    BatchLookupResponse,
+    CandidateQueryResponse,
+    ResponseCacheResponse,
     PokemonInfoResponse,
     PokemonTypeResponse,
     PokemonMoveResponse,
     PokemonStatsResponse,
-    TypeMatchupResponse
+    SuggestionResponse,
+    TypeMatchupResponse,
+    IndexRefreshMetricsResponse,
+    IndexSnapshotResponse
 )
 
+from backend.src.modules.candidate_finder.cache import response_cache
+from backend.src.modules.candidate_finder.encoding import encode_response, sorted_names
 from backend.src.modules.candidate_finder.deps import CandidateFinderService
+from backend.src.modules.candidate_finder.services import MAX_SUGGESTIONS, SUGGESTION_KINDS
+from backend.src.lib.deps import INDEX_CONTENT_HASH_STATE_KEY, INDEX_VERSION_STATE_KEY, admin_token_guard
 from backend.src.config.settings import settings
+from backend.src.lib.index_store import index_store, IndexSnapshot
+from backend.src.lib.stat_matrix import parse_stat_floors
 
 # Error handlers
 def invalid_pokemon_type_error_handler(_: Request, exc: InvalidPokemonTypeError) -> Response:
@@ -68,21 +107,151 @@ def invalid_pokemon_stat_error_handler(_: Request, exc: InvalidPokemonStatError)
         status_code=HTTP_400_BAD_REQUEST,
     )
 
+def too_many_batch_items_error_handler(_: Request, exc: TooManyBatchItemsError) -> Response:
+    return Response(
+        media_type=MediaType.TEXT,
+        content=str(exc),
+        status_code=HTTP_400_BAD_REQUEST,
+    )
+
+def invalid_filter_expression_error_handler(_: Request, exc: InvalidFilterExpressionError) -> Response:
+    return Response(
+        media_type=MediaType.TEXT,
+        content=str(exc),
+        status_code=HTTP_400_BAD_REQUEST,
+    )
+
+def indexes_not_loaded_error_handler(_: Request, exc: IndexesNotLoadedError) -> Response:
+    return Response(
+        media_type=MediaType.TEXT,
+        content=str(exc),
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+def _snapshot_response(snapshot: IndexSnapshot) -> IndexSnapshotResponse:
+    return IndexSnapshotResponse(
+        version=snapshot.version,
+        content_hash=snapshot.content_hash,
+        loaded_at=snapshot.loaded_at,
+        refresh=IndexRefreshMetricsResponse.model_validate(index_store.metrics)
+    )
+
+
+# Rows encoded per chunk written to an export stream
+EXPORT_CHUNK_ROWS = 64
+
+_ndjson_encoder = msgspec.json.Encoder()
+
+
+async def _ndjson_chunks(rows: Iterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode rows as NDJSON, EXPORT_CHUNK_ROWS at a time, so memory stays flat."""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == EXPORT_CHUNK_ROWS:
+            yield _ndjson_encoder.encode_lines(chunk)
+            chunk.clear()
+    if chunk:
+        yield _ndjson_encoder.encode_lines(chunk)
+
+
+def _pokemon_info(name: str, info: dict[str, Any]) -> dict[str, Any]:
+    """PokemonInfoResponse fields from a pokemon index entry."""
+    return {
+        "name": name,
+        "number": info["number"],
+        "types": info["type_display"].split("/"),
+        "height": info["height"],
+        "weight": info["weight"],
+        "sprite_url": info["sprite_url"],
+        "description": info["description"],
+        "genus": info["genus"],
+    }
+
+
+def _etag(content_hash: str, key: Hashable) -> str:
+    """Strong ETag for a query against one dataset snapshot.
+
+    Uses the snapshot content hash rather than its version, so every
+    process serving the same data hands out the same tag.
+    """
+    digest = hashlib.sha256(f"{content_hash}:{key!r}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # If-None-Match uses the weak comparison, so W/"x" matches "x". "*" is
+    # not honoured: an invalid query has no representation to match.
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _cached_response(
+    request: Request,
+    key: Hashable,
+    build: Callable[[], tuple[type[BaseModel], Any]]
+) -> Response:
+    """
+    Serve `key` on this snapshot: 304 if the client already has it, else the
+    cached body, else build and cache it.
+
+    `build` returns the response schema and the plain data to encode with it.
+    """
+    etag = _etag(request.state[INDEX_CONTENT_HASH_STATE_KEY], key)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.response_max_age}",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(content=b"", status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+
+    version = request.state[INDEX_VERSION_STATE_KEY]
+    body = response_cache.get(version, key)
+    if body is None:
+        # Errors raised by build() propagate and are never cached
+        body = encode_response(*build())
+        response_cache.put(version, key, body)
+    return Response(content=body, media_type=MediaType.JSON, headers=headers)
+
 
 class CandidateFinderController(Controller):
     path = ""  # Routes already have full paths from urls.py
 
     exception_handlers = {
+        IndexesNotLoadedError: indexes_not_loaded_error_handler,
+        InvalidFilterExpressionError: invalid_filter_expression_error_handler,
         InvalidPokemonMoveError: invalid_pokemon_move_error_handler,
         InvalidPokemonStatError: invalid_pokemon_stat_error_handler,
         InvalidPokemonTypeError: invalid_pokemon_type_error_handler,        
         NoPokemonFoundError: no_pokemon_found_error_handler,
+        TooManyBatchItemsError: too_many_batch_items_error_handler,
         TooManyTypesError: too_many_types_error_handler
     }
 
     @get(HEALTH)
     async def health_check(self) -> dict:
         return { "status": "healthy" }
+
+    @get(INDEXES)
+    async def index_snapshot(self) -> IndexSnapshotResponse:
+        return _snapshot_response(index_store.current)
+
+    @post(INDEXES_RELOAD, status_code=HTTP_200_OK, guards=[admin_token_guard])
+    async def reload_indexes(self) -> IndexSnapshotResponse:
+        snapshot = await index_store.reload()
+        return _snapshot_response(snapshot)
+
+    @get(CACHE)
+    async def cache_stats(self) -> ResponseCacheResponse:
+        return ResponseCacheResponse(
+            size=len(response_cache),
+            max_entries=response_cache.max_entries,
+            hits=response_cache.hits,
+            misses=response_cache.misses,
+            evictions=response_cache.evictions,
+            invalidations=response_cache.invalidations
+        )
         
     @get (POKEMON_NAME)
     async def pokemon_name(
@@ -94,16 +263,85 @@ class CandidateFinderController(Controller):
         if not name:
             raise ClientException(detail="Name required")
         
-        results = finder.get_pokemon_by_name(name)
+        try:
+            results = finder.get_pokemon_by_name(name)
+        except InvalidPokemonNameError:
+            raise NotFoundException(detail=f"pokemon {name!r} not found") from None
 
-        if results:
-            return PokemonInfoResponse(name = name, **results)
-        else:
-            raise NotFoundException(detail=f"pokemon {name!r} not found")
+        return PokemonInfoResponse.model_validate(_pokemon_info(name, results))
+
+    @get(SUGGEST)
+    async def suggest(
+        self,
+        finder: CandidateFinderService,
+        # Partial or misspelled pokemon / move name
+        q: str,
+        # Comma separated: pokemon, move (default: both)
+        kinds: str | None = None,
+        limit: Annotated[int, Parameter(ge=1, le=MAX_SUGGESTIONS)] = 10
+    ) -> Response[SuggestionResponse]:
+        # Called on every keystroke: each prefix is a new key, so these are
+        # not put in the response cache where they would evict real searches
+        kind_list = [k for k in kinds.split(",") if k] if kinds else SUGGESTION_KINDS
+        try:
+            results = finder.suggest(q, kinds=kind_list, limit=limit)
+        except ValueError as e:
+            raise ClientException(detail=str(e)) from None
+
+        return Response(content=encode_response(SuggestionResponse, results), media_type=MediaType.JSON)
+
+    @get(EXPORT)
+    async def export(
+        self,
+        finder: CandidateFinderService,
+        # e.g. "type=fire and attack>=100, legendary=false"
+        expression: Annotated[str | None, Parameter(query="filter")] = None,
+        # Comma separated: number, types, flags, stats, moves (default: all)
+        fields: str | None = None
+    ) -> Stream:
+        field_list = [f for f in fields.split(",") if f] if fields else None
+
+        # Validation happens here, before the first byte is streamed
+        try:
+            rows = finder.export_rows(expression, field_list)
+        except ValueError as e:
+            raise ClientException(detail=str(e)) from None
+
+        return Stream(_ndjson_chunks(rows), media_type="application/x-ndjson")
+
+    @post(BATCH, status_code=HTTP_200_OK)
+    async def batch_lookup(
+        self,
+        finder: CandidateFinderService,
+        data: BatchLookupRequest
+    ) -> Response[BatchLookupResponse]:
+        # One request for many /pokemon/{name}, /pokemon?move= and /type-matchups lookups
+        if not (data.pokemon or data.moves or data.type_combos):
+            raise ClientException(detail="Must specify pokemon, moves or type_combos")
+
+        batch = finder.lookup_batch(
+            pokemon=data.pokemon,
+            moves=data.moves,
+            type_combos=data.type_combos,
+            include_legendary=data.include_legendary,
+            include_mythical=data.include_mythical,
+            include_ultra_beasts=data.include_ultra_beasts
+            )
+
+        # Same shapes as the single-item endpoints
+        for name, entry in batch["pokemon"].items():
+            if entry["data"] is not None:
+                entry["data"] = _pokemon_info(name, entry["data"])
+        for entry in batch["type_combos"].values():
+            if entry["data"] is not None:
+                entry["data"] = {key: sorted_names(types) for key, types in entry["data"].items()}
+
+        return Response(content=encode_response(BatchLookupResponse, batch), media_type=MediaType.JSON)
         
     @get(POKEMON)
     async def pokemon_list(
         self,
+        request: Request,
         finder: CandidateFinderService,
         move: str | None = None,
         types: str | None = None,
@@ -114,63 +352,129 @@ class CandidateFinderController(Controller):
         min_speed: int | None = None,
         include_mythical: bool = False,
         include_legendary: bool = False,
-        include_ultra_beasts: bool = False
-    ) -> PokemonMoveResponse | PokemonTypeResponse | PokemonStatsResponse:
-            # Split types by hyphen to support dual types (e.g., "fire" or "fire-flying")
-        if types:
-            type_list = types.split('-')
-
-        if move:
-            results = finder.get_pokemon_by_move(
-            move,
-            include_legendary=include_legendary,
-            include_mythical=include_mythical,
-            include_ultra_beasts=include_ultra_beasts
-            )
-            return PokemonMoveResponse(move_name=move, pokemon_list=results)
-
-        elif types:
-            # Split types by hyphen to support dual types (e.g., "fire" or "fire-flying")
-            type_list = types.split('-')
+        include_ultra_beasts: bool = False,
+        # Paging and projection, applied inside the service so only the
+        # requested slice is ranked and built
+        limit: Annotated[int | None, Parameter(ge=1)] = None,
+        offset: Annotated[int, Parameter(ge=0)] = 0,
+        # Comma separated stat names (stats filter) or learn methods (move filter)
+        fields: str | None = None
+    ) -> Response[PokemonMoveResponse | PokemonTypeResponse | PokemonStatsResponse]:
+        field_list = [f for f in fields.split(",") if f] if fields else None
 
-            results = finder.get_pokemon_by_type(
-                *type_list,  # Now unpacks the list, not the string
+        def search() -> tuple[type[BaseModel], Any]:
+            if move:
+                results = finder.get_pokemon_by_move(
+                move,
                 include_legendary=include_legendary,
                 include_mythical=include_mythical,
-                include_ultra_beasts=include_ultra_beasts
-            )
+                include_ultra_beasts=include_ultra_beasts,
+                offset=offset,
+                limit=limit,
+                fields=field_list
+                )
+                return PokemonMoveResponse, {"move_name": move, "pokemon_list": results}
+
+            elif types:
+                # Split types by hyphen to support dual types (e.g., "fire" or "fire-flying")
+                type_list = types.split('-')
+
+                results = finder.get_pokemon_by_type(
+                    *type_list,  # Now unpacks the list, not the string
+                    include_legendary=include_legendary,
+                    include_mythical=include_mythical,
+                    include_ultra_beasts=include_ultra_beasts,
+                    offset=offset,
+                    limit=limit
+                )
         
-            return PokemonTypeResponse(type_combo=types, pokemon_list=results)
-
-        elif primary_stat and secondary_stat:
-            results = finder.get_pokemon_by_stats(
-                primary_stat,
-                secondary_stat,
-                min_primary=min_primary,
-                min_secondary=min_secondary,
-                min_speed=min_speed,
-                include_mythical=include_mythical,
+                return PokemonTypeResponse, {"type_combo": types, "pokemon_list": sorted_names(results)}
+
+            elif primary_stat and secondary_stat:
+                results = finder.get_pokemon_by_stats(
+                    primary_stat,
+                    secondary_stat,
+                    min_primary=min_primary,
+                    min_secondary=min_secondary,
+                    min_speed=min_speed,
+                    include_mythical=include_mythical,
+                    include_legendary=include_legendary,
+                    include_ultra_beasts=include_ultra_beasts,
+                    top_k=limit,
+                    offset=offset,
+                    fields=field_list
+                    )
+                return PokemonStatsResponse, results #dict[str,dict]:
+            
+            else:
+                # Return all or implement pagination
+                raise ClientException(detail="Must specify type, move, or stats filter")
+
+        key = (
+            POKEMON, move, types, primary_stat, secondary_stat, min_primary, min_secondary,
+            min_speed, include_mythical, include_legendary, include_ultra_beasts,
+            limit, offset, tuple(field_list or ())
+        )
+        return _cached_response(request, key, search)
+    
+    @get(CANDIDATES)
+    async def candidates(
+        self,
+        request: Request,
+        finder: CandidateFinderService,
+        move: str | None = None,
+        types: str | None = None,
+        versus: str | None = None,
+        # Comma separated stat:floor pairs (e.g. "attack:100,speed:90")
+        stat_floors: str | None = None,
+        include_mythical: bool = False,
+        include_legendary: bool = False,
+        include_ultra_beasts: bool = False
+    ) -> Response[CandidateQueryResponse]:
+        # Every given filter applies (AND); types and versus are hyphenated combos
+        type_list = tuple(sorted(types.split('-'))) if types else ()
+        versus_list = tuple(sorted(versus.split('-'))) if versus else ()
+        floors = parse_stat_floors(stat_floors or "")
+
+        if not (move or type_list or versus_list or floors):
+            raise ClientException(detail="Must specify move, types, versus or stat_floors")
+
+        def search() -> tuple[type[BaseModel], Any]:
+            results = finder.find_candidates(
+                move=move,
+                types=type_list,
+                versus=versus_list,
+                stat_floors=floors,
                 include_legendary=include_legendary,
+                include_mythical=include_mythical,
                 include_ultra_beasts=include_ultra_beasts
                 )
-            return PokemonStatsResponse(root=results) #dict[str,dict]:
-            
-        else:
-            # Return all or implement pagination
-            raise ClientException(detail="Must specify type, move, or stats filter")
-    
+            return CandidateQueryResponse, results
+
+        key = (
+            CANDIDATES, move, type_list, versus_list, tuple(sorted(floors.items())),
+            include_mythical, include_legendary, include_ultra_beasts
+        )
+        return _cached_response(request, key, search)
+
     @get(TYPE_MATCHUPS)
     async def type_matchups(
             self,
+            request: Request,
             finder: CandidateFinderService,
             types: str | None = None
-            ) -> TypeMatchupResponse:
+            ) -> Response[TypeMatchupResponse]:
         
             if types:
-                type_list = types.split('-')
+                # Matchups don't depend on type order, so "flying-fire" shares "fire-flying"'s entry
+                type_list = tuple(sorted(types.split('-')))
 
-                results = finder.get_type_effectiveness(*type_list)
+                def search() -> tuple[type[BaseModel], Any]:
+                    results = finder.get_type_effectiveness(*type_list)
+                    return TypeMatchupResponse, {
+                        key: sorted_names(attack_types) for key, attack_types in results.items()
+                    }
 
-                return TypeMatchupResponse(root=results)
+                return _cached_response(request, (TYPE_MATCHUPS, type_list), search)
             else:
                 raise ClientException(detail="Must specify type(s)")
\ No newline at end of file
@@ -1,8 +1,12 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from litestar import Request
+
 from backend.src.modules.candidate_finder.services import CandidateFinderService
-from backend.src.lib.repository import SQLAlchemyRepository
+from backend.src.lib.deps import INDEX_CONTENT_HASH_STATE_KEY, INDEX_VERSION_STATE_KEY
+from backend.src.lib.index_store import index_store
 
 
-async def provide_candidate_finder(db_session: AsyncSession) -> CandidateFinderService:
-    repo = await SQLAlchemyRepository.create(session=db_session)
-    return CandidateFinderService(repository=repo)
\ No newline at end of file
+async def provide_candidate_finder(request: Request) -> CandidateFinderService:
+    snapshot = index_store.current
+    request.state[INDEX_VERSION_STATE_KEY] = snapshot.version
+    request.state[INDEX_CONTENT_HASH_STATE_KEY] = snapshot.content_hash
+    return snapshot.service(CandidateFinderService)
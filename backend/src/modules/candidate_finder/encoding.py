@@ -0,0 +1,47 @@
+"""
+Response body encoders for candidate finder queries.
+
+Handlers build plain dicts and lists from the index data, with name sets
+already turned into sorted lists. The "pydantic" encoder validates that data
+against the response schema before dumping it; the "msgspec" encoder (the
+default) writes it straight to JSON bytes and skips model construction.
+Both produce the same JSON, so "pydantic" stays available as a check.
+"""
+from typing import Any, Callable, Iterable
+
+import msgspec
+from pydantic import BaseModel
+
+from backend.src.config.settings import settings
+
+_msgspec_encoder = msgspec.json.Encoder()
+
+
+def sorted_names(names: Iterable[str]) -> list[str]:
+    """Deterministic JSON array for a frozenset of names."""
+    return sorted(names)
+
+
+def encode_pydantic(schema: type[BaseModel], data: Any) -> bytes:
+    return schema.model_validate(data).model_dump_json().encode()
+
+
+def encode_msgspec(schema: type[BaseModel], data: Any) -> bytes:
+    return _msgspec_encoder.encode(data)
+
+
+ENCODERS: dict[str, Callable[[type[BaseModel], Any], bytes]] = {
+    "pydantic": encode_pydantic,
+    "msgspec": encode_msgspec,
+}
+
+
+def encode_response(schema: type[BaseModel], data: Any) -> bytes:
+    """JSON body for `data`, a `schema` response, using settings.response_encoder."""
+    encoder = ENCODERS.get(settings.response_encoder)
+    if encoder is None:
+        raise ValueError(
+            f"Unknown response_encoder {settings.response_encoder!r}, "
+            f"expected one of {sorted(ENCODERS)}"
+        )
+    return encoder(schema, data)
@@ -1,5 +1,6 @@
-from pydantic import BaseModel as _BaseModel, RootModel
+from pydantic import BaseModel as _BaseModel, RootModel, field_serializer
 from typing import Any
+from datetime import datetime
 
 class BaseModel(_BaseModel):
     # Evidently, this has to be done to enable ORM Mode
@@ -19,6 +20,11 @@ class PokemonTypeResponse(BaseModel):
     type_combo: str
     pokemon_list: frozenset[str]
 
+    # Sets serialize as sorted arrays so bodies (and ETags) are deterministic
+    @field_serializer("pokemon_list")
+    def _sorted_pokemon_list(self, value: frozenset[str]) -> list[str]:
+        return sorted(value)
+
 class PokemonMoveResponse(BaseModel):
     move_name: str
     pokemon_list: dict[str,Any]
@@ -26,5 +32,80 @@ class PokemonMoveResponse(BaseModel):
 class PokemonStatsResponse(RootModel):
     root: dict[str,dict]
 
+class QueryPlanStep(BaseModel):
+    predicate: str
+    cardinality: int | None
+    remaining: int | None
+
+class CandidateQueryResponse(BaseModel):
+    pokemon_list: list[str]
+    plan: list[QueryPlanStep]
+
+class NameSuggestion(BaseModel):
+    name: str
+    kind: str
+    match: str
+    score: float
+
+class SuggestionResponse(BaseModel):
+    query: str
+    suggestions: list[NameSuggestion]
+    complete: bool
+
 class TypeMatchupResponse(RootModel):
-    root: dict[str, frozenset[str]]
\ No newline at end of file
+    root: dict[str, frozenset[str]]
+
+    @field_serializer("root")
+    def _sorted_types(self, value: dict[str, frozenset[str]]) -> dict[str, list[str]]:
+        return {key: sorted(types) for key, types in value.items()}
+
+class IndexRefreshMetricsResponse(BaseModel):
+    refresh_count: int
+    swap_count: int
+    failure_count: int
+    last_refresh_at: datetime | None
+    last_refresh_latency_ms: float | None
+    last_refresh_changed: bool | None
+
+class IndexSnapshotResponse(BaseModel):
+    version: int
+    content_hash: str
+    loaded_at: datetime
+    refresh: IndexRefreshMetricsResponse
+
+class BatchLookupRequest(BaseModel):
+    pokemon: list[str] = []
+    moves: list[str] = []
+    type_combos: list[str] = []
+    include_legendary: bool = False
+    include_mythical: bool = False
+    include_ultra_beasts: bool = False
+
+class BatchItemError(BaseModel):
+    type: str
+    detail: str
+
+class BatchPokemonItem(BaseModel):
+    data: PokemonInfoResponse | None
+    error: BatchItemError | None
+
+class BatchMoveItem(BaseModel):
+    data: dict[str, Any] | None
+    error: BatchItemError | None
+
+class BatchTypeMatchupItem(BaseModel):
+    data: dict[str, list[str]] | None
+    error: BatchItemError | None
+
+class BatchLookupResponse(BaseModel):
+    pokemon: dict[str, BatchPokemonItem]
+    moves: dict[str, BatchMoveItem]
+    type_combos: dict[str, BatchTypeMatchupItem]
+
+class ResponseCacheResponse(BaseModel):
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
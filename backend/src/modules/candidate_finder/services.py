@@ -1,17 +1,26 @@
 # Imports
 import structlog
 
-from typing import Any
-from collections import defaultdict
+from time import perf_counter
+from typing import Any, Iterator, Sequence
 
-from backend.src.lib.repository import SQLAlchemyRepository
+from backend.src.lib.bitsets import SpeciesBitsets, iter_bits
+from backend.src.lib.filter_expression import OPERATORS, Clause, parse_filter
+from backend.src.lib.query_planner import MOVE, RESISTS, TYPE, QueryPlanner
+from backend.src.lib.repository import AbstractRepository
+from backend.src.lib.search_index import SearchIndex
+from backend.src.lib.stat_matrix import STAT_NAMES, StatMatrix, species_mask
+from backend.src.lib.type_chart import TypeChart
 
 # Exceptions
 from backend.src.lib.exceptions import (
     InvalidPokemonMoveError,
     InvalidPokemonNameError,
+    InvalidPokemonStatError,
     InvalidPokemonTypeError,
     NoPokemonFoundError,
+    PokemonSearchError,
+    TooManyBatchItemsError,
     TooManyTypesError,
 )
 
@@ -19,13 +28,38 @@ from backend.src.lib.exceptions import (
 STAT_WEIGHT_PRIMARY = 0.7
 STAT_WEIGHT_SECONDARY = 0.3
 
+# Most names + moves + type combos a single batch lookup may ask for
+MAX_BATCH_ITEMS = 100
+
+# Name suggestions: kinds searched, most returned, and the per-query time budget
+SUGGESTION_KINDS = ("pokemon", "move")
+MAX_SUGGESTIONS = 25
+DEFAULT_SUGGEST_BUDGET_MS = 20.0
+
+# Per-pokemon fields an export row can carry
+EXPORT_FIELDS = ("number", "types", "flags", "stats", "moves")
+
 logger = structlog.get_logger(__name__)
 
+
+def _check_page(offset: int, limit: int | None) -> None:
+    if offset < 0:
+        raise ValueError(f"offset must be >= 0, got {offset}")
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be >= 1, got {limit}")
+
+
+def _project(entry: dict[str, Any], fields: Sequence[str] | None) -> dict[str, Any]:
+    """Only the requested keys of a per-pokemon dict (all of them when fields is None)."""
+    if fields is None:
+        return entry
+    return {field: entry[field] for field in fields if field in entry}
+
 # Class
 class CandidateFinderService():
 
     # Initialize
-    def __init__(self, repository: SQLAlchemyRepository):
+    def __init__(self, repository: AbstractRepository):
         self.repository = repository
         if not self.repository:
             logger.error("Repository not loaded properly")
@@ -42,6 +76,9 @@ class CandidateFinderService():
             logger.error("Empty move index")
             raise ValueError("Repository returned empty MOVE index")
 
+        # {pokemon: {move: methods}}, for per-pokemon move lists
+        self._learnset_index = self.repository.get_learnset_index()
+
         self._stat_spreads_index = self.repository.get_stat_spread_index()
         if not self._stat_spreads_index:
             logger.error("Empty stat spreads index")
@@ -61,7 +98,31 @@ class CandidateFinderService():
         if not self._type_matchup_index:
             logger.error("Empty type_matchup_index")
             raise ValueError("Repository returned empty TYPE_MATCHUP index")
-        
+
+        # Dense IDs + bitsets, built once per snapshot (services are cached on it)
+        self._species = SpeciesBitsets(
+            self._pokemon_index,
+            self._type_index,
+            self._move_index
+            )
+        self._stat_matrix = StatMatrix(
+            self._stat_index,
+            self._species,
+            primary_weight=STAT_WEIGHT_PRIMARY,
+            secondary_weight=STAT_WEIGHT_SECONDARY
+            )
+        self._type_chart: TypeChart = self.repository.get_type_chart()
+        self._planner = QueryPlanner(
+            self._species,
+            self._type_chart,
+            self._pokemon_index,
+            self._stat_index
+            )
+        self._search = {
+            "pokemon": SearchIndex(self._pokemon_index),
+            "move": SearchIndex(self._move_index),
+        }
+
     def get_pokemon_by_name(
         self,
         name: str
@@ -83,7 +144,7 @@ class CandidateFinderService():
         
         # Case 3: Name does not exist
         if name not in self._pokemon_index:
-            raise InvalidPokemonMoveError(f"Invalid name: '{name}'")
+            raise InvalidPokemonNameError(f"Invalid name: '{name}'")
         
         # Case 4: Success
         results = self._pokemon_index[name]
@@ -91,12 +152,285 @@ class CandidateFinderService():
         logger.info("Found pokemon by name", name=name)
         return results
 
+    def suggest(
+        self,
+        query: str,
+        kinds: Sequence[str] = SUGGESTION_KINDS,
+        limit: int = 10,
+        budget_ms: float = DEFAULT_SUGGEST_BUDGET_MS
+    ) -> dict[str, Any]:
+        """
+        Autocomplete and typo-tolerant suggestions for pokemon and move names.
+
+        Exact and prefix matches come first, then fuzzy (trigram) matches,
+        across every requested kind ranked by score.
+
+        Args:
+            query: Partial or misspelled name, e.g. "pika" or "thundrbolt"
+            kinds: Any of SUGGESTION_KINDS
+            limit: Most suggestions returned (1 to MAX_SUGGESTIONS)
+            budget_ms: Stop reading fuzzy postings after this long
+
+        Returns:
+            {
+            "query": "thundrbolt",
+            "suggestions": [{"name": "thunderbolt", "kind": "move", "match": "fuzzy", "score": 0.643}],
+            "complete": False if the time budget cut the fuzzy search short
+            }
+
+        Raises:
+            ValueError: If the query is empty, or kinds / limit are invalid
+        """
+        logger.debug(
+            "Suggesting names",
+            query=query,
+            kinds=kinds,
+            limit=limit
+            )
+
+        # Case 1: Empty query (Caller mistake)
+        if not query or not query.strip():
+            raise ValueError("Query must be provided")
+
+        # Case 2: Invalid kinds or limit (Caller mistake)
+        invalid_kinds = [kind for kind in kinds if kind not in SUGGESTION_KINDS]
+        if not kinds or invalid_kinds:
+            raise ValueError(
+                f"Invalid suggestion kind(s): {invalid_kinds}. Valid kinds: {list(SUGGESTION_KINDS)}"
+            )
+        if not 1 <= limit <= MAX_SUGGESTIONS:
+            raise ValueError(f"limit must be between 1 and {MAX_SUGGESTIONS}, got {limit}")
+
+        # Case 3: Each kind on its own index, then merged by score
+        deadline = perf_counter() + budget_ms / 1000
+        suggestions = []
+        complete = True
+        for kind in dict.fromkeys(kinds):
+            matches, finished = self._search[kind].suggest(query, limit, deadline)
+            complete = complete and finished
+            suggestions.extend(
+                {"name": m.name, "kind": kind, "match": m.match, "score": m.score}
+                for m in matches
+            )
+        suggestions.sort(key=lambda s: (-s["score"], s["name"], s["kind"]))
+
+        logger.info("Suggested names", query=query, count=len(suggestions[:limit]), complete=complete)
+        return {"query": query, "suggestions": suggestions[:limit], "complete": complete}
+
+    def lookup_batch(
+        self,
+        pokemon: Sequence[str] = (),
+        moves: Sequence[str] = (),
+        type_combos: Sequence[str] = (),
+        include_legendary: bool = False,
+        include_mythical: bool = False,
+        include_ultra_beasts: bool = False
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Look up many pokemon, move learners and type matchups at once.
+
+        Each item succeeds or fails on its own; a bad item is reported in
+        its entry and never fails the batch. Duplicates are looked up once.
+
+        Args:
+            pokemon: Pokemon names (as for get_pokemon_by_name)
+            moves: Move names (as for get_pokemon_by_move)
+            type_combos: Hyphenated defending types (as for get_type_effectiveness)
+            include_legendary: Include legendary Pokemon in move results
+            include_mythical: Include mythical Pokemon in move results
+            include_ultra_beasts: Include Ultra Beasts in move results (postgame only)
+
+        Returns:
+            {
+            "pokemon": {name: {"data": {...}, "error": None}},
+            "moves": {move: {"data": None, "error": {"type": "InvalidPokemonMoveError", "detail": "..."}}},
+            "type_combos": {combo: {"data": {...}, "error": None}}
+            }
+
+        Raises:
+            ValueError: If nothing is requested
+            TooManyBatchItemsError: If more than MAX_BATCH_ITEMS items are requested
+        """
+        logger.debug(
+            "Batch lookup",
+            pokemon=len(pokemon),
+            moves=len(moves),
+            type_combos=len(type_combos)
+            )
+
+        # Case 1: Nothing requested (Caller mistake)
+        count = len(pokemon) + len(moves) + len(type_combos)
+        if not count:
+            raise ValueError("At least one pokemon, move or type combo must be provided")
+
+        # Case 2: Too many items (Caller mistake)
+        if count > MAX_BATCH_ITEMS:
+            raise TooManyBatchItemsError(
+                f"Maximum {MAX_BATCH_ITEMS} batch items allowed, got {count}"
+            )
+
+        # Case 3: Each item on its own; search errors become part of the result
+        def lookup(items: Sequence[str], find) -> dict[str, dict[str, Any]]:
+            results = {}
+            for item in items:
+                if item in results:
+                    continue
+                try:
+                    results[item] = {"data": find(item), "error": None}
+                except (PokemonSearchError, TypeError, ValueError) as e:
+                    results[item] = {"data": None, "error": {"type": type(e).__name__, "detail": str(e)}}
+            return results
+
+        batch = {
+            "pokemon": lookup(pokemon, self.get_pokemon_by_name),
+            "moves": lookup(moves, lambda move: self.get_pokemon_by_move(
+                move,
+                include_legendary=include_legendary,
+                include_mythical=include_mythical,
+                include_ultra_beasts=include_ultra_beasts
+                )),
+            "type_combos": lookup(type_combos, lambda combo: self.get_type_effectiveness(*combo.split("-"))),
+        }
+
+        logger.info(
+            "Batch lookup finished",
+            items=count,
+            errors=sum(1 for group in batch.values() for entry in group.values() if entry["error"])
+            )
+        return batch
+
+    def export_rows(
+        self,
+        expression: str | None = None,
+        fields: Sequence[str] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Lazily yield one row per Pokemon matching a filter expression.
+
+        Everything is validated before the first row, so a caller streaming
+        the rows never fails halfway. Rows are built one at a time from the
+        indexes, in alphabetical order.
+
+        Args:
+            expression: Filter expression (see lib.filter_expression), e.g.
+                "type=fire and attack>=100, legendary=false". None exports all.
+            fields: Row fields from EXPORT_FIELDS (default: all)
+
+        Returns:
+            Iterator of {"name": ..., "number": ..., "types": [...], "flags": {...},
+            "stats": {...}, "moves": [...]}
+
+        Raises:
+            InvalidFilterExpressionError: If the expression cannot be parsed
+            InvalidPokemonTypeError: If the expression names an unknown type
+            InvalidPokemonMoveError: If the expression names an unknown move
+            ValueError: If fields names an unknown field
+        """
+        logger.debug(
+            "Exporting pokemon",
+            expression=expression,
+            fields=fields
+            )
+
+        # Case 1: Unknown fields (Caller mistake)
+        selected = tuple(fields) if fields else EXPORT_FIELDS
+        invalid_fields = [f for f in selected if f not in EXPORT_FIELDS]
+        if invalid_fields:
+            raise ValueError(
+                f"Invalid export field(s): {invalid_fields}. Valid fields: {list(EXPORT_FIELDS)}"
+            )
+
+        # Case 2: Parse and narrow with bitsets; numeric clauses are checked per row
+        clauses = parse_filter(expression) if expression else []
+        bits, residual = self._compile_filter(clauses)
+
+        return self._iter_export_rows(bits, residual, selected)
+
+    def _compile_filter(self, clauses: list[Clause]) -> tuple[int, list[Clause]]:
+        bits = self._species.known
+        residual = []
+        flags = {
+            "legendary": self._species.legendary,
+            "mythical": self._species.mythical,
+            "ultra_beast": self._species.ultra_beast,
+        }
+
+        for clause in clauses:
+            if clause.field == "type":
+                if clause.value not in self._species.types:
+                    raise InvalidPokemonTypeError(
+                        f"Invalid Pokemon type(s): ['{clause.value}']. "
+                        f"Valid types: {sorted(self._type_index.keys())}"
+                    )
+                matched = self._species.types[clause.value]
+            elif clause.field == "move":
+                if clause.value not in self._species.moves:
+                    raise InvalidPokemonMoveError(f"Invalid move: '{clause.value}'")
+                matched = self._species.moves[clause.value]
+            elif clause.field == "name":
+                matched = self._species.encode([clause.value]) if clause.value in self._species.ids else 0
+            elif clause.field in flags:
+                # legendary=false is the same as legendary!=true
+                wanted = clause.value if clause.op == "=" else not clause.value
+                bits &= flags[clause.field] if wanted else ~flags[clause.field]
+                continue
+            else:
+                residual.append(clause)
+                continue
+
+            bits &= matched if clause.op == "=" else ~matched
+
+        return bits, residual
+
+    def _iter_export_rows(
+        self,
+        bits: int,
+        residual: list[Clause],
+        fields: tuple[str, ...]
+    ) -> Iterator[dict[str, Any]]:
+        names = self._species.names
+        checks = [(clause.field, OPERATORS[clause.op], clause.value) for clause in residual]
+        count = 0
+
+        for species_id in iter_bits(bits):
+            name = names[species_id]
+            info = self._pokemon_index[name]
+            stats = self._stat_index.get(name)
+
+            values = dict(stats or ()) | {"number": info["number"]}
+            if not all(field in values and compare(values[field], value) for field, compare, value in checks):
+                continue
+
+            row: dict[str, Any] = {"name": name}
+            if "number" in fields:
+                row["number"] = info["number"]
+            if "types" in fields:
+                row["types"] = info["type_display"].split("/")
+            if "flags" in fields:
+                row["flags"] = {
+                    "legendary": bool(info["is_legendary"]),
+                    "mythical": bool(info["is_mythical"]),
+                    "ultra_beast": bool(info["is_ultra_beast"]),
+                }
+            if "stats" in fields:
+                row["stats"] = stats
+            if "moves" in fields:
+                row["moves"] = list(self._learnset_index.get(name, ()))
+
+            count += 1
+            yield row
+
+        logger.info("Exported pokemon", count=count)
+
     def get_pokemon_by_move(
         self,
         move: str,
         include_mythical: bool = False,
         include_legendary: bool = False,
-        include_ultra_beasts: bool = False
+        include_ultra_beasts: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: Sequence[str] | None = None
     ) -> dict[str, dict[str, Any]]:
         """
         Get Pokemon that can learn a specific move.
@@ -106,6 +440,9 @@ class CandidateFinderService():
             include_mythical: Include mythical Pokemon in results
             include_legendary: Include legendary Pokemon in results
             include_ultra_beasts: Include Ultra Beasts in results (postgame only)
+            offset: Skip this many Pokemon (alphabetical order)
+            limit: Return at most this many Pokemon (default: all)
+            fields: Only these learn methods per Pokemon (e.g., ["level-up"])
 
         Returns:
             Dict mapping pokemon name to learn methods:
@@ -116,7 +453,7 @@ class CandidateFinderService():
 
         Raises:
             TypeError: If move is not a string
-            ValueError: If move is empty string
+            ValueError: If move is empty string, or offset / limit is out of range
             InvalidPokemonMoveError: If move doesn't exist
 
         Examples:
@@ -131,7 +468,10 @@ class CandidateFinderService():
             move=move,
             include_mythical=include_mythical,
             include_legendary=include_legendary,
-            include_ultra_beasts=include_ultra_beasts
+            include_ultra_beasts=include_ultra_beasts,
+            offset=offset,
+            limit=limit,
+            fields=fields
             )
 
         # Validation
@@ -146,17 +486,20 @@ class CandidateFinderService():
         # Case 3: Move does not exist
         if move not in self._move_index:
             raise InvalidPokemonMoveError(f"Invalid move: '{move}'")
+
+        # Case 4: Page out of range
+        _check_page(offset, limit)
         
-        # Case 4: Success
+        # Case 5: Success
         pokemon_found = self._move_index[move]
         
-        # Filter by species status
+        # Filter by species status; only the requested page is decoded
+        excluded = self._species.excluded(include_legendary, include_mythical, include_ultra_beasts)
         filtered = {
-            name: info
-            for name, info in pokemon_found.items()
-            if (include_legendary or not self._pokemon_index[name]["is_legendary"])
-            and (include_mythical or not self._pokemon_index[name]["is_mythical"])
-            and (include_ultra_beasts or not self._pokemon_index[name]["is_ultra_beast"])
+            name: _project(pokemon_found[name], fields)
+            for name in self._species.decode(
+                self._species.moves[move] & ~excluded, offset=offset, limit=limit
+                )
         }
 
         logger.info("Found pokemon by move", move=move, count=len(filtered))
@@ -171,7 +514,10 @@ class CandidateFinderService():
         min_speed: int | None = None,
         include_legendary: bool = False,
         include_mythical: bool = False,
-        include_ultra_beasts: bool = False
+        include_ultra_beasts: bool = False,
+        top_k: int | None = None,
+        offset: int = 0,
+        fields: Sequence[str] | None = None
     ) -> dict[str,dict]:
         """
         Search for Pokemon by base stats, ranked by weighted composite score.
@@ -185,6 +531,9 @@ class CandidateFinderService():
             include_legendary: Include legendary Pokemon in results
             include_mythical: Include mythical Pokemon in results
             include_ultra_beasts: Include Ultra Beasts in results (postgame only)
+            top_k: Only return the best `top_k` Pokemon (default: all)
+            offset: Skip this many of the best Pokemon first (for paging)
+            fields: Only these stats per Pokemon (e.g., ["attack", "speed"])
 
         Returns:
             List of Pokemon names, ranked best-first by weighted score.
@@ -192,7 +541,8 @@ class CandidateFinderService():
 
         Raises:
             TypeError: If stat names are not strings
-            ValueError: If stat names are invalid or empty
+            ValueError: If stat names are invalid or empty, or offset / top_k is out of range
+            InvalidPokemonStatError: If fields names an unknown stat
             NoPokemonFoundError: If no Pokemon match the criteria
 
         Examples:
@@ -215,7 +565,10 @@ class CandidateFinderService():
             min_speed=min_speed,
             include_legendary=include_legendary,
             include_mythical=include_mythical,
-            include_ultra_beasts=include_ultra_beasts
+            include_ultra_beasts=include_ultra_beasts,
+            top_k=top_k,
+            offset=offset,
+            fields=fields
             )
         
         # Case 1: Incorrect argument datatype (Programmer mistake)
@@ -251,47 +604,42 @@ class CandidateFinderService():
                 f"Valid stats: {sorted(valid_stats)}"
             )
 
+        invalid_fields = [field for field in fields or () if field not in valid_stats]
+        if invalid_fields:
+            raise InvalidPokemonStatError(
+                f"Invalid field(s): {invalid_fields}. "
+                f"Valid stats: {sorted(valid_stats)}"
+            )
+
+        _check_page(offset, top_k)
+
         # Case 4: Default min_secondary to median if not provided
         if min_secondary is None:
             min_secondary = int(self._stat_spreads_index['STAT_MEDIANS'][secondary_stat])
 
-        # Case 5: Filter by legendary/mythical/ultra beast status first (optimization)
-        # Only include Pokemon that exist in both indices
-        filtered_by_species = {
-            name: stats
-            for name, stats in self._stat_index.items()
-            if name in self._pokemon_index
-            and (include_legendary or not self._pokemon_index[name]["is_legendary"])
-            and (include_mythical or not self._pokemon_index[name]["is_mythical"])
-            and (include_ultra_beasts or not self._pokemon_index[name]["is_ultra_beast"])
-        }
-
-        # Case 6: Filter by stat thresholds (including optional speed filter)
-        candidates = {
-            name: stats
-            for name, stats in filtered_by_species.items()
-            if stats[primary_stat] >= min_primary
-            and stats[secondary_stat] >= min_secondary
-            and (min_speed is None or stats['speed'] >= min_speed)
-        }
+        # Case 5, 6 & 8: Walk the precomputed ranking for this stat pair
+        # (weighted 70% primary, 30% secondary, best first), keeping rows that
+        # pass the species filters and stat thresholds (including optional speed)
+        ranked_rows = self._stat_matrix.rank(
+            primary_stat,
+            secondary_stat,
+            min_primary=min_primary,
+            min_secondary=min_secondary,
+            min_speed=min_speed,
+            excluded_flags=species_mask(include_legendary, include_mythical, include_ultra_beasts),
+            top_k=top_k,
+            offset=offset
+            )
 
-        # Case 7: No Pokemon found matching criteria
-        if not candidates:
+        # Case 7: No Pokemon found matching criteria (an offset past the end is an empty page)
+        if not ranked_rows and not offset:
             raise NoPokemonFoundError(
                 f"No Pokemon found with {primary_stat} >= {min_primary} "
                 f"and {secondary_stat} >= {min_secondary}"
             )
 
-        # Case 8: Rank by weighted composite score (70% primary, 30% secondary)
-        # Higher score = better
-        ranked = sorted(
-            candidates.items(),
-            key=lambda x: (
-                STAT_WEIGHT_PRIMARY * x[1][primary_stat] +
-                STAT_WEIGHT_SECONDARY * x[1][secondary_stat]
-            ),
-            reverse=True  # Best first
-        )
+        names = self._stat_matrix.names
+        ranked = [(names[row], _project(self._stat_index[names[row]], fields)) for row in ranked_rows]
 
         logger.info(
             "Found pokemon by stats", 
@@ -317,7 +665,9 @@ class CandidateFinderService():
         *types: str,
         include_legendary: bool = False,
         include_mythical: bool = False,
-        include_ultra_beasts: bool = False
+        include_ultra_beasts: bool = False,
+        offset: int = 0,
+        limit: int | None = None
     ) -> frozenset[str]:
         """
         Search for Pokemon by type(s).
@@ -327,13 +677,15 @@ class CandidateFinderService():
             include_legendary: Include legendary Pokemon in results
             include_mythical: Include mythical Pokemon in results
             include_ultra_beasts: Include Ultra Beasts in results (postgame only)
+            offset: Skip this many Pokemon (alphabetical order)
+            limit: Return at most this many Pokemon (default: all)
 
         Returns:
             frozenset of Pokemon names matching the type(s)
 
         Raises:
             TypeError: If arguments are not strings (programmer error)
-            ValueError: If no types provided (caller error)
+            ValueError: If no types provided, or offset / limit is out of range (caller error)
             TooManyTypesError: If more than 2 types provided
             InvalidPokemonTypeError: If any type is not valid
             NoPokemonFoundError: If no Pokemon match the criteria
@@ -354,7 +706,9 @@ class CandidateFinderService():
             types=types,
             include_legendary=include_legendary,
             include_mythical=include_mythical,
-            include_ultra_beasts=include_ultra_beasts
+            include_ultra_beasts=include_ultra_beasts,
+            offset=offset,
+            limit=limit
             )
         
         # Case 1: Incorrect arg datatype (Programmer mistake)
@@ -382,27 +736,25 @@ class CandidateFinderService():
                 f"Valid types: {sorted(self._type_index.keys())}"
             )
         
+        _check_page(offset, limit)
+
         # Case 5 & 6: Single or dual type search
-        pokemon_list = self._type_index[types[0]] # type: ignore
+        pokemon_bits = self._species.types[types[0]]
         for t in types[1:]:
-            pokemon_list &= self._type_index[t]
+            pokemon_bits &= self._species.types[t]
         
         # Case 7: No pokemon found (This might be valid, not always an error)
-        if not pokemon_list:
+        if not pokemon_bits:
             raise NoPokemonFoundError(
                 f"No Pokemon found with type(s): {types}"
             )
         
         # Case 8: Filter by legendary/mythical/ultra beast status
-        filtered = frozenset(
-            name for name in pokemon_list
-            if (include_legendary or not self._pokemon_index[name]["is_legendary"])
-            and (include_mythical or not self._pokemon_index[name]["is_mythical"])
-            and (include_ultra_beasts or not self._pokemon_index[name]["is_ultra_beast"])
-        )
+        excluded = self._species.excluded(include_legendary, include_mythical, include_ultra_beasts)
+        filtered = frozenset(self._species.decode(pokemon_bits & ~excluded, offset=offset, limit=limit))
         
-        # Case 9: No pokemon after filtering
-        if not filtered:
+        # Case 9: No pokemon after filtering (an offset past the end is an empty page)
+        if not filtered and not offset:
             raise NoPokemonFoundError(
                 f"No Pokemon found with type(s) {types} after filtering legendary/mythical"
             )
@@ -418,6 +770,125 @@ class CandidateFinderService():
 
         return filtered
     
+    def find_candidates(
+        self,
+        move: str | None = None,
+        types: tuple[str, ...] = (),
+        versus: tuple[str, ...] = (),
+        stat_floors: dict[str, int] | None = None,
+        include_legendary: bool = False,
+        include_mythical: bool = False,
+        include_ultra_beasts: bool = False
+    ) -> dict[str, Any]:
+        """
+        Search for Pokemon matching every given criterion at once.
+
+        The planner intersects the move, type and resistance bitsets smallest
+        first and checks stat floors only on what is left.
+
+        Args:
+            move: Move the Pokemon must learn (e.g., "thunderbolt")
+            types: 1-2 types the Pokemon must have (e.g., ("fire", "flying"))
+            versus: 1-2 attacking types the Pokemon must resist (0.5x or less)
+            stat_floors: Minimum base stats (e.g., {"attack": 100, "speed": 90})
+            include_legendary: Include legendary Pokemon in results
+            include_mythical: Include mythical Pokemon in results
+            include_ultra_beasts: Include Ultra Beasts in results (postgame only)
+
+        Returns:
+            {
+            "pokemon_list": [names, alphabetical],
+            "plan": [{"predicate": "move:thunderbolt", "cardinality": 40, "remaining": 12}, ...]
+            }
+
+        Raises:
+            TypeError: If a move or type is not a string
+            ValueError: If no criteria are provided
+            TooManyTypesError: If more than 2 types or versus types are provided
+            InvalidPokemonMoveError: If the move doesn't exist
+            InvalidPokemonTypeError: If any type is not valid
+            InvalidPokemonStatError: If a stat floor names an unknown stat
+            NoPokemonFoundError: If no Pokemon match every criterion
+
+        Examples:
+            >>> find_candidates(move="thunderbolt", versus=("ground",), stat_floors={"speed": 100})
+            {"pokemon_list": ["rotom.fan", ...], "plan": [...]}
+        """
+        logger.debug(
+            "Searching pokemon by compound query",
+            move=move,
+            types=types,
+            versus=versus,
+            stat_floors=stat_floors,
+            include_legendary=include_legendary,
+            include_mythical=include_mythical,
+            include_ultra_beasts=include_ultra_beasts
+            )
+
+        # Case 1: Incorrect argument datatype (Programmer mistake)
+        for value in (move, *types, *versus):
+            if value is not None and not isinstance(value, str):
+                raise TypeError(f"Expected str, got {type(value).__name__}: {value!r}")
+
+        # Case 2: No criteria provided (Caller mistake)
+        floors = stat_floors or {}
+        if not (move or types or versus or floors):
+            raise ValueError("At least one of move, types, versus or stat_floors must be provided")
+
+        # Case 3: Too many types (Caller mistake)
+        for label, type_list in (("types", types), ("versus types", versus)):
+            if len(type_list) > 2:
+                raise TooManyTypesError(
+                    f"Maximum 2 {label} allowed, got {len(type_list)}: {type_list}"
+                )
+
+        # Case 4: Invalid move, types or stats (Caller mistake)
+        if move and (MOVE, move) not in self._planner:
+            raise InvalidPokemonMoveError(f"Invalid move: '{move}'")
+
+        invalid_types = [t for t in (*types, *versus) if t not in self._type_index]
+        if invalid_types:
+            raise InvalidPokemonTypeError(
+                f"Invalid Pokemon type(s): {invalid_types}. "
+                f"Valid types: {sorted(self._type_index.keys())}"
+            )
+
+        invalid_stats = [stat for stat in floors if stat not in STAT_NAMES]
+        if invalid_stats:
+            raise InvalidPokemonStatError(
+                f"Invalid stat(s): {invalid_stats}. Valid stats: {sorted(STAT_NAMES)}"
+            )
+
+        # Case 5: Execute, most selective index first
+        predicates = [(TYPE, t) for t in types] + [(RESISTS, t) for t in versus]
+        if move:
+            predicates.append((MOVE, move))
+
+        names, steps = self._planner.execute(
+            predicates,
+            excluded=self._species.excluded(include_legendary, include_mythical, include_ultra_beasts),
+            stat_floors=floors
+            )
+        plan = [
+            {"predicate": step.predicate, "cardinality": step.cardinality, "remaining": step.remaining}
+            for step in steps
+        ]
+
+        # Case 6: No pokemon found
+        if not names:
+            raise NoPokemonFoundError(
+                f"No Pokemon found matching every criterion: "
+                f"{[step['predicate'] for step in plan]}"
+            )
+
+        logger.info(
+            "Found pokemon by compound query",
+            plan=plan,
+            count=len(names)
+            )
+
+        return {"pokemon_list": names, "plan": plan}
+
     def get_type_effectiveness(self, *types: str) -> dict[str, frozenset[str]]:
         """
         Calculate type effectiveness against defending Pokemon.
@@ -466,53 +937,8 @@ class CandidateFinderService():
             )
         
         # Case 4 and 5: One or two pokemon provided
-        # Calculate effectiveness for each attacking type
-        attack_multipliers = {}
-        
-        for attack_type in self._type_matchup_index.keys():
-            multiplier = 1.0
-            
-            for defending_type in types:
-                matchup = self._type_matchup_index[defending_type]
-                
-                if attack_type in matchup["no_damage_from"]:
-                    multiplier = 0.0
-                    break
-                elif attack_type in matchup["double_damage_from"]:
-                    multiplier *= 2
-                elif attack_type in matchup["half_damage_from"]:
-                    multiplier *= 0.5
-            
-            attack_multipliers[attack_type] = multiplier
-        
-        # Group by effectiveness
-        by_effectiveness = defaultdict(list)
-        for attack_type, mult in attack_multipliers.items():
-            if mult == 4.0:
-                key = "4x"
-            elif mult == 2.0:
-                key = "2x"
-            elif mult == 1.0:
-                key = "1x"
-            elif mult == 0.5:
-                key = "0.5x"
-            elif mult == 0.25:
-                key = "0.25x"
-            elif mult == 0.0:
-                key = "0x"
-            else:
-                key = f"{mult}x"  # Fallback for weird values
-            
-            by_effectiveness[key].append(attack_type)
-
-        # Return with frozensets instead of sorted lists
-        order = ["4x", "2x", "1x", "0.5x", "0.25x", "0x"]
-
-        ordered = {
-            k: frozenset(by_effectiveness[k])
-            for k in order
-            if k in by_effectiveness
-        }
+        # Precomputed for every single and dual combo when the service was built
+        ordered = self._type_chart.effectiveness(*types)
 
         logger.info(
             "Found type matchups", 
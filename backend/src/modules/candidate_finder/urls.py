@@ -2,4 +2,11 @@
 HEALTH = "/health"
 POKEMON = "/pokemon"
 POKEMON_NAME = "/pokemon/{name:str}"
-TYPE_MATCHUPS = "/type-matchups"
\ No newline at end of file
+CANDIDATES = "/candidates"
+BATCH = "/batch"
+EXPORT = "/export"
+SUGGEST = "/suggest"
+TYPE_MATCHUPS = "/type-matchups"
+INDEXES = "/indexes"
+INDEXES_RELOAD = "/indexes/reload"
+CACHE = "/cache"
@@ -0,0 +1,64 @@
+from typing import Annotated
+
+from litestar import get, Controller, Request, Response, MediaType
+from litestar.exceptions import ClientException, NotFoundException
+from litestar.params import Parameter
+from litestar.status_codes import HTTP_503_SERVICE_UNAVAILABLE
+
+from backend.src.modules.pokedex.urls import POKEDEX, POKEDEX_ENTRY
+
+from backend.src.lib.exceptions import (
+    IndexesNotLoadedError,
+    InvalidPokemonNameError,
+)
+
+from backend.src.modules.pokedex.schemas import (
+    PokedexEntryResponse,
+    PokedexPageResponse
+)
+from backend.src.modules.pokedex.deps import PokedexService
+from backend.src.modules.pokedex.services import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+# Error handlers
+def indexes_not_loaded_error_handler(_: Request, exc: IndexesNotLoadedError) -> Response:
+    return Response(
+        media_type=MediaType.TEXT,
+        content=str(exc),
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
+class PokedexController(Controller):
+    path = ""  # Routes already have full paths from urls.py
+
+    exception_handlers = {
+        IndexesNotLoadedError: indexes_not_loaded_error_handler,
+    }
+
+    @get(POKEDEX)
+    async def browse(
+        self,
+        pokedex: PokedexService,
+        # next_cursor from the previous page
+        cursor: str | None = None,
+        limit: Annotated[int, Parameter(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE
+    ) -> PokedexPageResponse:
+        try:
+            results = pokedex.browse(cursor=cursor, limit=limit)
+        except ValueError as e:
+            raise ClientException(detail=str(e)) from None
+
+        return PokedexPageResponse.model_validate(results)
+
+    @get(POKEDEX_ENTRY)
+    async def entry(
+        self,
+        pokedex: PokedexService,
+        name: str
+    ) -> PokedexEntryResponse:
+        try:
+            results = pokedex.get_entry(name)
+        except InvalidPokemonNameError:
+            raise NotFoundException(detail=f"pokemon {name!r} not found") from None
+
+        return PokedexEntryResponse.model_validate(results)
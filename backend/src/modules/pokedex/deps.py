@@ -0,0 +1,11 @@
+from litestar import Request
+
+from backend.src.modules.pokedex.services import PokedexService
+from backend.src.lib.deps import INDEX_VERSION_STATE_KEY
+from backend.src.lib.index_store import index_store
+
+
+async def provide_pokedex(request: Request) -> PokedexService:
+    snapshot = index_store.current
+    request.state[INDEX_VERSION_STATE_KEY] = snapshot.version
+    return snapshot.service(PokedexService)
@@ -0,0 +1,33 @@
+from typing import Any
+
+from pydantic import BaseModel as _BaseModel
+
+class BaseModel(_BaseModel):
+    model_config = {"from_attributes": True}
+
+class PokedexSummary(BaseModel):
+    name: str
+    display_name: str
+    number: int
+    types: list[str]
+
+class PokedexPageResponse(BaseModel):
+    pokemon: list[PokedexSummary]
+    next_cursor: str | None
+    total: int
+
+class PokedexFlags(BaseModel):
+    legendary: bool
+    mythical: bool
+    ultra_beast: bool
+
+class PokedexEntryResponse(PokedexSummary):
+    height: float
+    weight: float
+    sprite_url: str
+    description: str
+    genus: str
+    flags: PokedexFlags
+    stats: dict[str, int] | None
+    learnset: dict[str, dict[str, Any]]
+    machines: dict[str, str]
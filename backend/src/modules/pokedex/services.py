@@ -0,0 +1,184 @@
+# Imports
+import base64
+import binascii
+import structlog
+
+from bisect import bisect_right
+from typing import Any
+
+from backend.src.lib.repository import AbstractRepository
+
+# Exceptions
+from backend.src.lib.exceptions import InvalidPokemonNameError
+
+# Browse page sizes
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+logger = structlog.get_logger(__name__)
+
+
+def encode_cursor(number: int, name: str) -> str:
+    """Opaque cursor for the entry at (number, name) - a page resumes after it."""
+    return base64.urlsafe_b64encode(f"{number}:{name}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, str]:
+    """(number, name) from encode_cursor; raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        number, name = raw.split(":", 1)
+        return int(number), name
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid cursor: '{cursor}'") from None
+
+
+# Class
+class PokedexService():
+
+    # Initialize
+    def __init__(self, repository: AbstractRepository):
+        self.repository = repository
+        if not self.repository:
+            logger.error("Repository not loaded properly")
+            raise ValueError("Repository returned empty REPOSITORY object")
+
+        self._pokemon_index = self.repository.get_pokemon_index()
+        if not self._pokemon_index:
+            logger.error("Empty pokemon index")
+            raise ValueError("Repository returned empty POKEMON index")
+
+        self._stat_index = self.repository.get_stat_index()
+        if not self._stat_index:
+            logger.error("Empty stats index")
+            raise ValueError("Repository returned empty STAT index")
+
+        self._learnset_index = self.repository.get_learnset_index()
+        if not self._learnset_index:
+            logger.error("Empty learnset index")
+            raise ValueError("Repository returned empty LEARNSET index")
+
+        self._machine_moves_index = self.repository.get_machine_moves_index()
+
+        # National dex order, with forms sharing a number ordered by name.
+        # Cursors are (number, name) keys, so a page is one bisect and a slice
+        # and stays stable when a snapshot reload adds or removes species.
+        self._order: tuple[str, ...] = tuple(
+            sorted(self._pokemon_index, key=lambda n: (self._pokemon_index[n]["number"], n))
+        )
+        self._keys: list[tuple[int, str]] = [
+            (self._pokemon_index[name]["number"], name) for name in self._order
+        ]
+
+    def _summary(self, name: str) -> dict[str, Any]:
+        info = self._pokemon_index[name]
+        return {
+            "name": name,
+            "display_name": info["display_name"],
+            "number": info["number"],
+            "types": info["type_display"].split("/"),
+        }
+
+    def browse(
+        self,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE
+    ) -> dict[str, Any]:
+        """
+        One page of every species in national dex order.
+
+        Args:
+            cursor: next_cursor from the previous page (None for the first page)
+            limit: Entries per page (1 to MAX_PAGE_SIZE)
+
+        Returns:
+            {
+            "pokemon": [{"name": "bulbasaur", "display_name": "Bulbasaur", "number": 1, "types": [...]}, ...],
+            "next_cursor": "..." or None on the last page,
+            "total": 1167
+            }
+
+        Raises:
+            ValueError: If the cursor is malformed or limit is out of range
+        """
+        logger.debug(
+            "Browsing pokedex",
+            cursor=cursor,
+            limit=limit
+            )
+
+        # Case 1: Invalid page size (Caller mistake)
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}, got {limit}")
+
+        # Case 2: Resume after the cursor's key (it need not still exist)
+        start = bisect_right(self._keys, decode_cursor(cursor)) if cursor else 0
+        page = self._order[start:start + limit]
+
+        next_cursor = None
+        if start + limit < len(self._order):
+            next_cursor = encode_cursor(*self._keys[start + limit - 1])
+
+        logger.info("Browsed pokedex", start=start, count=len(page))
+        return {
+            "pokemon": [self._summary(name) for name in page],
+            "next_cursor": next_cursor,
+            "total": len(self._order),
+        }
+
+    def get_entry(self, name: str) -> dict[str, Any]:
+        """
+        Everything known about one species: info, flags, base stats and learnset.
+
+        Returns:
+            {
+            "name": "pikachu", "display_name": "Pikachu", "number": 25, "types": ["electric"],
+            "height": 0.4, "weight": 6.0, "sprite_url": "...", "description": "...", "genus": "...",
+            "flags": {"legendary": False, "mythical": False, "ultra_beast": False},
+            "stats": {"hp": 35, ...} or None,
+            "learnset": {"thunder-shock": {"level-up": 1}, "thunderbolt": {"machine": True}, ...},
+            "machines": {"thunderbolt": "tm24", ...}
+            }
+
+            The learnset lists level-up moves by level, then machine moves by
+            TM/TR id, then the rest by name.
+
+        Raises:
+            ValueError: If the name is empty
+            InvalidPokemonNameError: If the species does not exist
+        """
+        logger.debug("Looking up pokedex entry", name=name)
+
+        # Case 1: Empty name (Caller mistake)
+        if not name:
+            raise ValueError("Pokemon name must be provided")
+
+        # Case 2: Name does not exist
+        info = self._pokemon_index.get(name)
+        if info is None:
+            raise InvalidPokemonNameError(f"Invalid name: '{name}'")
+
+        # Case 3: Success
+        learnset = self._learnset_index.get(name, {})
+        entry = self._summary(name) | {
+            "height": info["height"],
+            "weight": info["weight"],
+            "sprite_url": info["sprite_url"],
+            "description": info["description"],
+            "genus": info["genus"],
+            "flags": {
+                "legendary": bool(info["is_legendary"]),
+                "mythical": bool(info["is_mythical"]),
+                "ultra_beast": bool(info["is_ultra_beast"]),
+            },
+            "stats": self._stat_index.get(name),
+            "learnset": learnset,
+            "machines": {
+                move: self._machine_moves_index[move]
+                for move, methods in learnset.items()
+                if "machine" in methods and move in self._machine_moves_index
+            },
+        }
+
+        logger.info("Found pokedex entry", name=name)
+        return entry
@@ -0,0 +1,2 @@
+POKEDEX = "/pokedex"
+POKEDEX_ENTRY = "/pokedex/{name:str}"
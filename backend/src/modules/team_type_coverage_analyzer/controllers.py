@@ -0,0 +1,120 @@
+from typing import Annotated
+
+from litestar import get, Controller, Request, Response, MediaType
+from litestar.exceptions import ClientException
+from litestar.params import Parameter
+from litestar.status_codes import (
+    HTTP_400_BAD_REQUEST,
+    HTTP_503_SERVICE_UNAVAILABLE
+)
+
+from backend.src.modules.team_type_coverage_analyzer.urls import COVERAGE, COVERAGE_COMPLETE
+
+from backend.src.lib.exceptions import (
+    IndexesNotLoadedError,
+    InvalidPokemonNameError,
+    InvalidPokemonStatError,
+    TooManyTeamMembersError,
+    TooManyTypesError,
+)
+
+from backend.src.modules.team_type_coverage_analyzer.schemas import (
+    TeamCompletionResponse,
+    TeamCoverageResponse
+)
+from backend.src.modules.team_type_coverage_analyzer.deps import TeamCoverageService
+from backend.src.modules.team_type_coverage_analyzer.services import (
+    DEFAULT_SEARCH_BUDGET_MS,
+    MAX_TEAM_SIZE
+)
+from backend.src.lib.stat_matrix import parse_stat_floors
+
+# Error handlers
+def invalid_pokemon_name_error_handler(_: Request, exc: InvalidPokemonNameError) -> Response:
+    return Response(
+        media_type=MediaType.TEXT,
+        content=str(exc),
+        status_code=HTTP_400_BAD_REQUEST,
+    )
+
+def too_many_team_members_error_handler(_: Request, exc: TooManyTeamMembersError) -> Response:
+    return Response(
+        media_type=MediaType.TEXT,
+        content=str(exc),
+        status_code=HTTP_400_BAD_REQUEST,
+    )
+
+def invalid_pokemon_stat_error_handler(_: Request, exc: InvalidPokemonStatError) -> Response:
+    return Response(
+        media_type=MediaType.TEXT,
+        content=str(exc),
+        status_code=HTTP_400_BAD_REQUEST,
+    )
+
+def too_many_types_error_handler(_: Request, exc: TooManyTypesError) -> Response:
+    return Response(
+        media_type=MediaType.TEXT,
+        content=str(exc),
+        status_code=HTTP_400_BAD_REQUEST,
+    )
+
+def indexes_not_loaded_error_handler(_: Request, exc: IndexesNotLoadedError) -> Response:
+    return Response(
+        media_type=MediaType.TEXT,
+        content=str(exc),
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
+class TeamCoverageController(Controller):
+    path = ""  # Routes already have full paths from urls.py
+
+    exception_handlers = {
+        IndexesNotLoadedError: indexes_not_loaded_error_handler,
+        InvalidPokemonNameError: invalid_pokemon_name_error_handler,
+        InvalidPokemonStatError: invalid_pokemon_stat_error_handler,
+        TooManyTeamMembersError: too_many_team_members_error_handler,
+        TooManyTypesError: too_many_types_error_handler
+    }
+
+    @get(COVERAGE)
+    async def team_coverage(
+        self,
+        coverage: TeamCoverageService,
+        team: str | None = None
+    ) -> TeamCoverageResponse:
+        # Comma separated members: pokemon names or hyphenated type combos
+        # (e.g. "charizard,water,fire-flying")
+        members = [m for m in (team or "").split(",") if m]
+        if not members:
+            raise ClientException(detail="Must specify team")
+
+        results = coverage.analyze_team(*members)
+        return TeamCoverageResponse.model_validate(results)
+
+    @get(COVERAGE_COMPLETE)
+    async def team_completion(
+        self,
+        coverage: TeamCoverageService,
+        team: str | None = None,
+        slots: Annotated[int, Parameter(ge=1, le=MAX_TEAM_SIZE)] = 1,
+        include_legendary: bool = False,
+        include_mythical: bool = False,
+        include_ultra_beasts: bool = False,
+        # Comma separated stat:floor pairs (e.g. "attack:100,speed:90")
+        stat_floors: str | None = None,
+        budget_ms: Annotated[float, Parameter(gt=0, le=1000)] = DEFAULT_SEARCH_BUDGET_MS
+    ) -> TeamCompletionResponse:
+        # Same member format as /coverage; an empty team searches a full team
+        members = [m for m in (team or "").split(",") if m]
+
+        results = coverage.complete_team(
+            *members,
+            slots=slots,
+            include_legendary=include_legendary,
+            include_mythical=include_mythical,
+            include_ultra_beasts=include_ultra_beasts,
+            stat_floors=parse_stat_floors(stat_floors or ""),
+            budget_ms=budget_ms
+        )
+        return TeamCompletionResponse.model_validate(results)
@@ -0,0 +1,11 @@
+from litestar import Request
+
+from backend.src.modules.team_type_coverage_analyzer.services import TeamCoverageService
+from backend.src.lib.deps import INDEX_VERSION_STATE_KEY
+from backend.src.lib.index_store import index_store
+
+
+async def provide_team_coverage(request: Request) -> TeamCoverageService:
+    snapshot = index_store.current
+    request.state[INDEX_VERSION_STATE_KEY] = snapshot.version
+    return snapshot.service(TeamCoverageService)
@@ -0,0 +1,38 @@
+from pydantic import BaseModel as _BaseModel
+
+class BaseModel(_BaseModel):
+    model_config = {"from_attributes": True}
+
+class AttackerCoverage(BaseModel):
+    weak: int
+    resist: int
+    immune: int
+
+class SuggestedType(BaseModel):
+    type: str
+    score: int
+    patches: list[str]
+    new_weaknesses: list[str]
+
+class TeamCoverageResponse(BaseModel):
+    team: dict[str, list[str]]
+    attackers: dict[str, AttackerCoverage]
+    weaknesses: list[str]
+    strengths: list[str]
+    suggested_types: list[SuggestedType]
+
+class CompletionMember(BaseModel):
+    types: list[str]
+    pokemon: list[str]
+
+class TeamCompletion(BaseModel):
+    score: int
+    weaknesses: list[str]
+    members: list[CompletionMember]
+
+class TeamCompletionResponse(BaseModel):
+    team: dict[str, list[str]]
+    slots: int
+    complete: bool
+    nodes: int
+    suggestions: list[TeamCompletion]
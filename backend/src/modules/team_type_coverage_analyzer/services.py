@@ -0,0 +1,472 @@
+# Imports
+import heapq
+import operator
+import structlog
+
+from itertools import count
+from time import perf_counter
+from typing import Any
+
+from backend.src.lib.repository import AbstractRepository
+from backend.src.lib.stat_matrix import STAT_NAMES
+from backend.src.lib.type_chart import TypeChart
+from backend.src.lib.type_matrix import IMMUNE_THRESHOLD, TypeMatrix
+
+# Exceptions
+from backend.src.lib.exceptions import (
+    InvalidPokemonNameError,
+    InvalidPokemonStatError,
+    TooManyTeamMembersError,
+    TooManyTypesError,
+)
+
+MAX_TEAM_SIZE = 6
+
+# Team completion search
+DEFAULT_SEARCH_BUDGET_MS = 100.0
+DEFAULT_SUGGESTION_COUNT = 5
+EXAMPLES_PER_MEMBER = 5
+
+# Per-attacker counts are packed into 4-bit lanes of one int, so a whole
+# team's counts add up with a single integer sum per category (max 6 < 16)
+LANE_BITS = 4
+LANE_MASK = (1 << LANE_BITS) - 1
+
+logger = structlog.get_logger(__name__)
+
+
+class DefensiveProfile():
+    """Packed weak/resist/immune lanes for one defending type combo."""
+
+    __slots__ = ("types", "weak", "resist", "immune", "delta")
+
+    def __init__(self, types: tuple[str, ...], exponents: tuple[int, ...]):
+        self.types = types
+        self.weak = 0
+        self.resist = 0
+        self.immune = 0
+        for lane, exponent in enumerate(exponents):
+            bit = 1 << (lane * LANE_BITS)
+            if exponent <= IMMUNE_THRESHOLD:
+                self.immune |= bit
+            elif exponent > 0:
+                self.weak |= bit
+            elif exponent < 0:
+                self.resist |= bit
+
+        # Per attacker: +1 weak, -1 resists or immune, 0 neutral
+        self.delta = tuple(
+            (1 if exponent > 0 else 0) - (1 if exponent < 0 else 0)
+            for exponent in exponents
+        )
+
+
+def uncovered(net: tuple[int, ...]) -> int:
+    """Sum of net weaknesses (weak minus covering members) over every attacker."""
+    return sum(n for n in net if n > 0)
+
+
+# Class
+class TeamCoverageService():
+
+    # Initialize
+    def __init__(self, repository: AbstractRepository):
+        self.repository = repository
+        if not self.repository:
+            logger.error("Repository not loaded properly")
+            raise ValueError("Repository returned empty REPOSITORY object")
+
+        self._pokemon_index = self.repository.get_pokemon_index()
+        if not self._pokemon_index:
+            logger.error("Empty pokemon index")
+            raise ValueError("Repository returned empty POKEMON index")
+
+        self._type_matrix: TypeMatrix = self.repository.get_type_matrix()
+        if not len(self._type_matrix):
+            logger.error("Empty type matrix")
+            raise ValueError("Repository returned empty TYPE_MATRIX index")
+
+        # Attacking types, in lane order
+        self._types = self._type_matrix.types
+
+        self._stat_index = self.repository.get_stat_index()
+        if not self._stat_index:
+            logger.error("Empty stats index")
+            raise ValueError("Repository returned empty STAT index")
+
+        # Every single and dual defending combo, keyed by sorted type names;
+        # exponents come from the snapshot's shared TypeChart
+        type_chart: TypeChart = self.repository.get_type_chart()
+        self._profiles: dict[tuple[str, ...], DefensiveProfile] = {
+            combo: DefensiveProfile(combo, type_chart.exponents(*combo))
+            for combo in type_chart.combos
+        }
+
+        # Species grouped by combo, strongest (base stat total) first
+        def base_stat_total(name: str) -> int:
+            return sum(self._stat_index.get(name, {}).values())
+
+        self._species_by_combo: dict[tuple[str, ...], list[str]] = {}
+        for name in sorted(self._pokemon_index, key=lambda n: (-base_stat_total(n), n)):
+            key = tuple(sorted(set(self._pokemon_index[name]["type_display"].split("/"))))
+            if key in self._profiles:
+                self._species_by_combo.setdefault(key, []).append(name)
+
+    def _resolve_member(self, member: str) -> DefensiveProfile:
+        """A team member is a pokemon name or a type combo like 'fire-flying'."""
+        if member in self._pokemon_index:
+            types = self._pokemon_index[member]["type_display"].split("/")
+        else:
+            types = member.split("-")
+            if not all(t in self._type_matrix.type_ids for t in types):
+                raise InvalidPokemonNameError(
+                    f"Unknown pokemon or type combo: '{member}'. "
+                    f"Valid types: {sorted(self._types)}"
+                )
+            if len(types) > 2:
+                raise TooManyTypesError(
+                    f"Maximum 2 types allowed, got {len(types)}: {member}"
+                )
+
+        key = tuple(sorted(types))
+        profile = self._profiles.get(key)
+        if profile is None:
+            # Same type twice ('fire-fire') is just that type
+            profile = self._profiles[tuple(sorted(set(types)))]
+        return profile
+
+    def _resolve_team(self, members: tuple[str, ...]) -> list[DefensiveProfile]:
+        # Case 1: Incorrect argument datatype
+        for m in members:
+            if not isinstance(m, str):
+                raise TypeError(f"Expected str, got {type(m).__name__}: {m!r}")
+
+        # Case 2: Too many members
+        if len(members) > MAX_TEAM_SIZE:
+            raise TooManyTeamMembersError(
+                f"Maximum {MAX_TEAM_SIZE} team members allowed, got {len(members)}"
+            )
+
+        # Case 3: Resolve members (raises on unknown names / types)
+        return [self._resolve_member(m) for m in members]
+
+    def _unpack(self, packed: int) -> list[int]:
+        return [(packed >> (lane * LANE_BITS)) & LANE_MASK for lane in range(len(self._types))]
+
+    def analyze_team(self, *members: str) -> dict[str, Any]:
+        """
+        Defensive type coverage of a team.
+
+        Args:
+            *members: Up to 6 pokemon names and/or type combos ("fire-flying")
+
+        Returns:
+            {
+            "team": {member: [types]},
+            "attackers": {attacking_type: {"weak": n, "resist": n, "immune": n}},
+            "weaknesses": [attacking types more members are weak to than resist, worst first],
+            "strengths": [attacking types more members resist than are weak to, best first],
+            "suggested_types": [{"type", "score", "patches", "new_weaknesses"}, ...]
+            }
+
+        Raises:
+            TypeError: If a member is not a string
+            ValueError: If no members are provided
+            TooManyTeamMembersError: If more than 6 members are provided
+            InvalidPokemonNameError: If a member is neither a pokemon nor a type combo
+            TooManyTypesError: If a type combo has more than 2 types
+
+        Examples:
+            >>> analyze_team("charizard", "water")
+            {"team": {"charizard": ["fire", "flying"], "water": ["water"]}, ...}
+        """
+        logger.debug(
+            "Analyzing team coverage",
+            members=members
+            )
+
+        # Case 1-3: Datatypes, team size, unknown names / types
+        profiles = self._resolve_team(members)
+
+        # Case 4: No members provided
+        if not profiles:
+            raise ValueError("At least one team member must be provided")
+
+        # Case 5: Aggregate every attacker at once, one int sum per category
+        weak = self._unpack(sum(p.weak for p in profiles))
+        resist = self._unpack(sum(p.resist for p in profiles))
+        immune = self._unpack(sum(p.immune for p in profiles))
+
+        attackers = {
+            attack_type: {"weak": weak[i], "resist": resist[i], "immune": immune[i]}
+            for i, attack_type in enumerate(self._types)
+        }
+        net = [weak[i] - resist[i] - immune[i] for i in range(len(self._types))]
+
+        weaknesses = sorted(
+            (t for i, t in enumerate(self._types) if net[i] > 0),
+            key=lambda t: (-net[self._type_matrix.type_ids[t]], t)
+        )
+        strengths = sorted(
+            (t for i, t in enumerate(self._types) if net[i] < 0),
+            key=lambda t: (net[self._type_matrix.type_ids[t]], t)
+        )
+
+        results = {
+            "team": {m: list(p.types) for m, p in zip(members, profiles)},
+            "attackers": attackers,
+            "weaknesses": weaknesses,
+            "strengths": strengths,
+            "suggested_types": self._suggest_types(net),
+        }
+
+        logger.info(
+            "Analyzed team coverage",
+            members=members,
+            weaknesses=len(weaknesses),
+            strengths=len(strengths)
+            )
+        return results
+
+    def _suggest_types(self, net: list[int]) -> list[dict[str, Any]]:
+        """
+        Rank single types by how many uncovered weaknesses they patch.
+
+        score = gaps the type resists or is immune to, minus attackers that
+        would become new gaps because the type is weak to them.
+        """
+        suggestions = []
+        for candidate in self._types:
+            profile = self._profiles[(candidate,)]
+            covers = self._unpack(profile.resist | profile.immune)
+            weak_to = self._unpack(profile.weak)
+
+            patches = [t for i, t in enumerate(self._types) if net[i] > 0 and covers[i]]
+            new_weaknesses = [t for i, t in enumerate(self._types) if net[i] == 0 and weak_to[i]]
+            score = len(patches) - len(new_weaknesses)
+
+            if patches and score > 0:
+                suggestions.append({
+                    "type": candidate,
+                    "score": score,
+                    "patches": patches,
+                    "new_weaknesses": new_weaknesses,
+                })
+
+        suggestions.sort(key=lambda s: (-s["score"], -len(s["patches"]), s["type"]))
+        return suggestions
+
+    def complete_team(
+        self,
+        *members: str,
+        slots: int = 1,
+        include_legendary: bool = False,
+        include_mythical: bool = False,
+        include_ultra_beasts: bool = False,
+        stat_floors: dict[str, int] | None = None,
+        budget_ms: float = DEFAULT_SEARCH_BUDGET_MS,
+        suggestion_count: int = DEFAULT_SUGGESTION_COUNT
+    ) -> dict[str, Any]:
+        """
+        Search for the members that best fill the open slots of a team.
+
+        Only the type combo matters for coverage, so the search runs over the
+        combos that have at least one eligible species (at most 171) rather
+        than over species. It is a depth-first branch and bound: a partial
+        team whose optimistic bound (every remaining member covers every
+        gap) cannot beat the current best teams is pruned.
+
+        Args:
+            *members: Current team - pokemon names and/or type combos
+            slots: Number of members to add
+            include_legendary: Include legendary Pokemon in results
+            include_mythical: Include mythical Pokemon in results
+            include_ultra_beasts: Include Ultra Beasts in results (postgame only)
+            stat_floors: Minimum base stats, e.g. {"attack": 100}
+            budget_ms: Stop searching after this long and return the best so far
+            suggestion_count: Number of best completions to return
+
+        Returns:
+            {
+            "team": {member: [types]},
+            "slots": slots,
+            "complete": False if the time budget ran out,
+            "nodes": partial teams explored,
+            "suggestions": [{"score", "weaknesses", "members": [{"types", "pokemon"}]}, ...]
+            }
+            score is the sum of net weaknesses (weak members minus covering
+            members) over all attackers, as uncovered(); lower is better.
+
+        Raises:
+            TypeError: If a member is not a string
+            ValueError: If slots is not positive
+            TooManyTeamMembersError: If the team would exceed 6 members
+            InvalidPokemonNameError: If a member is neither a pokemon nor a type combo
+            TooManyTypesError: If a type combo has more than 2 types
+            InvalidPokemonStatError: If a stat floor names an unknown stat
+        """
+        logger.debug(
+            "Completing team",
+            members=members,
+            slots=slots,
+            stat_floors=stat_floors,
+            budget_ms=budget_ms
+            )
+
+        # Case 1-3: Datatypes, team size, unknown names / types
+        profiles = self._resolve_team(members)
+
+        # Case 4: Slot count
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        if len(profiles) + slots > MAX_TEAM_SIZE:
+            raise TooManyTeamMembersError(
+                f"Maximum {MAX_TEAM_SIZE} team members allowed, "
+                f"got {len(profiles)} + {slots} open slots"
+            )
+
+        # Case 5: Stat floors
+        floors = stat_floors or {}
+        invalid_stats = [stat for stat in floors if stat not in STAT_NAMES]
+        if invalid_stats:
+            raise InvalidPokemonStatError(
+                f"Invalid stat(s): {invalid_stats}. Valid stats: {sorted(STAT_NAMES)}"
+            )
+
+        # Case 6: Eligible species per combo
+        eligible = self._eligible_species(
+            include_legendary, include_mythical, include_ultra_beasts, floors
+        )
+
+        net = tuple(sum(column) for column in zip(*(p.delta for p in profiles))) \
+            if profiles else (0,) * len(self._types)
+        teams, complete, nodes = self._branch_and_bound(
+            net, eligible, slots, budget_ms / 1000, suggestion_count
+        )
+
+        suggestions = []
+        for cost, picks, final_net in teams:
+            suggestions.append({
+                "score": cost,
+                "weaknesses": [t for t, n in zip(self._types, final_net) if n > 0],
+                "members": [
+                    {"types": list(combo), "pokemon": eligible[combo][:EXAMPLES_PER_MEMBER]}
+                    for combo in picks
+                ],
+            })
+
+        logger.info(
+            "Completed team",
+            members=members,
+            slots=slots,
+            complete=complete,
+            nodes=nodes,
+            suggestions=len(suggestions)
+            )
+
+        return {
+            "team": {m: list(p.types) for m, p in zip(members, profiles)},
+            "slots": slots,
+            "complete": complete,
+            "nodes": nodes,
+            "suggestions": suggestions,
+        }
+
+    def _eligible_species(
+        self,
+        include_legendary: bool,
+        include_mythical: bool,
+        include_ultra_beasts: bool,
+        floors: dict[str, int]
+    ) -> dict[tuple[str, ...], list[str]]:
+        eligible = {}
+        for combo, names in self._species_by_combo.items():
+            kept = [
+                name for name in names
+                if (include_legendary or not self._pokemon_index[name]["is_legendary"])
+                and (include_mythical or not self._pokemon_index[name]["is_mythical"])
+                and (include_ultra_beasts or not self._pokemon_index[name]["is_ultra_beast"])
+                and all(
+                    self._stat_index.get(name, {}).get(stat, -1) >= floor
+                    for stat, floor in floors.items()
+                )
+            ]
+            if kept:
+                eligible[combo] = kept
+        return eligible
+
+    def _branch_and_bound(
+        self,
+        net: tuple[int, ...],
+        eligible: dict[tuple[str, ...], list[str]],
+        slots: int,
+        budget_s: float,
+        suggestion_count: int
+    ) -> tuple[list[tuple[int, list[tuple[str, ...]], tuple[int, ...]]], bool, int]:
+        """
+        Returns (best teams first, whether the search finished, nodes visited).
+
+        Teams are ranked by (score, sum of net): score is uncovered(net), the
+        sum of net weaknesses over all attackers, and ties go to the team that
+        resists more overall.
+        """
+        # Most promising combos first, so good bounds are found early
+        def first_pick_cost(combo: tuple[str, ...]) -> tuple[int, int, tuple[str, ...]]:
+            child = tuple(map(operator.add, net, self._profiles[combo].delta))
+            return uncovered(child), sum(child), combo
+
+        combos = sorted(eligible, key=first_pick_cost)
+        deltas = [self._profiles[combo].delta for combo in combos]
+        # A combo can repeat only as often as there are distinct species for it
+        species_counts = [len(eligible[combo]) for combo in combos]
+        min_delta_sum = min((sum(delta) for delta in deltas), default=0)
+
+        deadline = perf_counter() + budget_s
+        tiebreak = count()
+        # Max-heap on cost: (-uncovered, -sum(net), -order found, picks, net)
+        best: list[tuple[int, int, int, list[int], tuple[int, ...]]] = []
+        picks: list[int] = []
+        nodes = 0
+
+        def search(start: int, net: tuple[int, ...], remaining: int) -> bool:
+            """Returns False once the time budget has run out."""
+            nonlocal nodes
+            for i in range(start, len(combos)):
+                nodes += 1
+                if perf_counter() > deadline:
+                    return False
+                if picks.count(i) >= species_counts[i]:
+                    continue
+
+                child = tuple(map(operator.add, net, deltas[i]))
+                left = remaining - 1
+
+                # Each further member covers each gap at most once and adds
+                # at least min_delta_sum to the sum of net
+                if len(best) == suggestion_count:
+                    bound = (sum(n - left for n in child if n > left), sum(child) + left * min_delta_sum)
+                    if bound >= (-best[0][0], -best[0][1]):
+                        continue
+
+                picks.append(i)
+                if left:
+                    # Same combo may repeat (another species of the same types)
+                    if not search(i, child, left):
+                        picks.pop()
+                        return False
+                else:
+                    entry = (-uncovered(child), -sum(child), -next(tiebreak), picks.copy(), child)
+                    if len(best) < suggestion_count:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+                picks.pop()
+            return True
+
+        complete = search(0, net, slots) if combos else True
+
+        teams = [
+            (-neg_uncovered, [combos[i] for i in team_picks], final_net)
+            for neg_uncovered, _, _, team_picks, final_net in sorted(best, reverse=True)
+        ]
+        return teams, complete, nodes
@@ -0,0 +1,2 @@
+COVERAGE = "/coverage"
+COVERAGE_COMPLETE = "/coverage/complete"
@@ -0,0 +1,87 @@
+"""
+Compare how long each index source takes to build a full repository.
+
+    python -m benchmarks.bench_index_load [--repeat N]
+
+Database timings use settings.db_url, so the database must be seeded
+(`just go`). Sources that are unavailable are reported and skipped.
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+
+from pathlib import Path
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from backend.src.config.settings import settings
+from backend.src.lib.repository import (
+    AbstractRepository,
+    FixtureRepository,
+    SnapshotRepository,
+    SQLAlchemyRepository
+)
+from benchmarks.common import load_sql_sequential
+
+Loader = Callable[[], Awaitable[AbstractRepository]]
+
+
+async def load_sql_concurrent() -> AbstractRepository:
+    return await SQLAlchemyRepository.create_concurrent(settings.db_url)
+
+
+async def load_fixtures() -> AbstractRepository:
+    return FixtureRepository.create(settings)
+
+
+def snapshot_loader(path: Path) -> Loader:
+    async def load_snapshot() -> AbstractRepository:
+        return SnapshotRepository.open(path, dataset=settings.dataset)
+    return load_snapshot
+
+
+async def time_loader(name: str, loader: Loader, repeat: int) -> AbstractRepository | None:
+    timings = []
+    repository = None
+    for _ in range(repeat):
+        started = perf_counter()
+        try:
+            repository = await loader()
+        except Exception as e:
+            print(f"{name:<16} skipped: {type(e).__name__}: {e}")
+            return None
+        timings.append((perf_counter() - started) * 1000)
+
+    print(
+        f"{name:<16} median {statistics.median(timings):8.2f} ms"
+        f"   min {min(timings):8.2f} ms   max {max(timings):8.2f} ms"
+    )
+    return repository
+
+
+async def main(repeat: int) -> None:
+    print(f"dataset={settings.dataset} repeat={repeat}")
+    loaded = [
+        await time_loader("sql sequential", load_sql_sequential, repeat),
+        await time_loader("sql concurrent", load_sql_concurrent, repeat),
+        await time_loader("fixtures", load_fixtures, repeat),
+    ]
+
+    # Snapshot whatever loaded, so the snapshot path can be timed too
+    source = next((repository for repository in loaded if repository is not None), None)
+    if source is None:
+        print(f"{'snapshot':<16} skipped: no source to snapshot")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"{settings.dataset}.pkfidx"
+        source.write_snapshot(path, dataset=settings.dataset)
+        await time_loader("snapshot", snapshot_loader(path), repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
@@ -0,0 +1,80 @@
+"""
+Report the in-memory footprint of every cached index, per worker.
+
+    python -m benchmarks.bench_index_memory
+
+Needs a seeded database at settings.db_url. Two numbers are reported: the
+bytes tracemalloc sees still allocated after a full repository load, and a
+per-index deep size where an object shared between indexes (an interned
+name, a learn-method dict) is only counted for the first index that
+reaches it.
+"""
+import asyncio
+import gc
+import sys
+import tracemalloc
+
+from array import array
+from typing import Any
+
+from backend.src.lib.repository import INDEX_ATTRIBUTES
+from benchmarks.common import load_sql_sequential, quiet_logging
+
+# Index attributes that are reported, in order; derived indexes come last
+REPORTED_ATTRIBUTES = (*INDEX_ATTRIBUTES, "_learnset_index")
+
+
+def deep_sizeof(obj: Any, seen: set[int]) -> int:
+    """sys.getsizeof over `obj` and everything it references, skipping ids in `seen`."""
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif isinstance(current, (str, bytes, int, float, bool, array)) or current is None:
+            continue
+        else:
+            if hasattr(current, "__dict__"):
+                stack.append(vars(current))
+            for cls in type(current).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    if hasattr(current, slot):
+                        stack.append(getattr(current, slot))
+    return size
+
+
+async def main() -> None:
+    quiet_logging()
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    repository = await load_sql_sequential()
+    gc.collect()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{'index':<22} {'deep size':>12}")
+    seen: set[int] = set()
+    total = 0
+    for attr in REPORTED_ATTRIBUTES:
+        index = getattr(repository, attr, None)
+        if index is None:
+            continue
+        size = deep_sizeof(index, seen)
+        total += size
+        print(f"{attr:<22} {size / 1024:>9.1f} KB")
+    print(f"{'total':<22} {total / 1024:>9.1f} KB")
+    print(f"\ntracemalloc: retained {(after - before) / 1024:.1f} KB, peak {(peak - before) / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
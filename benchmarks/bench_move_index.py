@@ -0,0 +1,72 @@
+"""
+Compare the packed move index with the nested dicts it replaced.
+
+    python -m benchmarks.bench_move_index [--repeat N] [--synthetic-moves N]
+
+Needs a seeded database at settings.db_url. --synthetic-moves replaces the
+seeded moves with N generated ones over the real pokemon names (about 120
+learners each, like a full dataset). The dict form is rebuilt from
+the packed index with one fresh learn-method dict per (move, pokemon)
+pair, the way the repository used to hold it. Reports deep size, then the
+time to look up every learner one by one and to walk every move's items.
+"""
+import argparse
+import asyncio
+import random
+
+from backend.src.lib.move_index import PackedMoveIndex
+
+from benchmarks.bench_index_memory import deep_sizeof
+from benchmarks.common import load_sql_sequential, quiet_logging, summary, time_call
+
+
+def synthetic_pairs(names: list[str], moves: int) -> dict[str, dict[str, dict]]:
+    rng = random.Random(0)
+    methods = [{"machine": True}, {"egg": True}, {"tutor": True}, {"machine": True, "tutor": True}]
+    return {
+        f"move-{i}": {
+            pokemon: {"level-up": rng.randint(1, 100)} if rng.random() < 0.3 else rng.choice(methods)
+            for pokemon in rng.sample(names, min(len(names), 120))
+        }
+        for i in range(moves)
+    }
+
+
+async def main(repeat: int, synthetic_moves: int) -> None:
+    repository = await load_sql_sequential()
+    quiet_logging()
+
+    packed = repository.get_move_index()
+    if synthetic_moves:
+        packed = PackedMoveIndex.from_pairs(
+            synthetic_pairs(sorted(repository.get_pokemon_index()), synthetic_moves)
+        )
+    nested = {
+        move: {pokemon: dict(methods) for pokemon, methods in learners.items()}
+        for move, learners in packed.items()
+    }
+    pairs = [(move, pokemon) for move, learners in nested.items() for pokemon in learners]
+
+    print(f"{len(packed)} moves, {len(pairs)} pairs, repeat={repeat}")
+    for label, index in (("dict", nested), ("packed", packed)):
+        def lookup_all() -> None:
+            for move, pokemon in pairs:
+                index[move][pokemon]
+
+        def walk_all() -> None:
+            for learners in index.values():
+                for _ in learners.items():
+                    pass
+
+        size = deep_sizeof(index, set())
+        print(f"{label:<7} size {size / 1024:9.1f} KB ({size / max(len(pairs), 1):6.1f} B/pair)")
+        print(f"{label:<7} lookup {summary(time_call(lookup_all, repeat))}")
+        print(f"{label:<7} walk   {summary(time_call(walk_all, repeat))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--synthetic-moves", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat, args.synthetic_moves))
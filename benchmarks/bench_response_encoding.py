@@ -0,0 +1,60 @@
+"""
+Compare response encoding throughput: pydantic schemas vs direct msgspec.
+
+    python -m benchmarks.bench_response_encoding [--repeat N]
+
+Needs a seeded database at settings.db_url. Each payload is encoded from
+the same plain data the candidate finder handlers build; the search itself
+is not timed.
+"""
+import argparse
+import asyncio
+
+from backend.src.modules.candidate_finder.encoding import ENCODERS, sorted_names
+from backend.src.modules.candidate_finder.schemas import (
+    PokemonMoveResponse,
+    PokemonStatsResponse,
+    PokemonTypeResponse,
+    TypeMatchupResponse
+)
+from backend.src.modules.candidate_finder.services import CandidateFinderService
+from benchmarks.common import load_sql_sequential, quiet_logging, summary, time_call
+
+
+async def main(repeat: int) -> None:
+    finder = CandidateFinderService(repository=await load_sql_sequential())
+    quiet_logging()
+
+    every_stat = finder.get_pokemon_by_stats(
+        "attack", "speed", min_secondary=0,
+        include_legendary=True, include_mythical=True, include_ultra_beasts=True
+        )
+    payloads = {
+        f"stats ({len(every_stat)})": (PokemonStatsResponse, every_stat),
+        "type water": (PokemonTypeResponse, {
+            "type_combo": "water",
+            "pokemon_list": sorted_names(finder.get_pokemon_by_type("water"))
+        }),
+        "move psychic": (PokemonMoveResponse, {
+            "move_name": "psychic",
+            "pokemon_list": finder.get_pokemon_by_move("psychic", include_legendary=True)
+        }),
+        "type matchups": (TypeMatchupResponse, {
+            key: sorted_names(types)
+            for key, types in finder.get_type_effectiveness("fire", "flying").items()
+        }),
+    }
+
+    print(f"repeat={repeat}")
+    for label, (schema, data) in payloads.items():
+        size = len(ENCODERS["msgspec"](schema, data))
+        for name, encode in ENCODERS.items():
+            timings = time_call(lambda: encode(schema, data), repeat)
+            print(f"{label:<18} {name:<9} {summary(timings)}   {size:>7} bytes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
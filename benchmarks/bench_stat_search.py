@@ -0,0 +1,67 @@
+"""
+Compare the ranked stat search with the previous dict-based one.
+
+    python -m benchmarks.bench_stat_search [--repeat N] [--top-k K]
+
+Runs every ordered (primary, secondary) pair of the six stats - 36 pairs -
+with the default filters. Needs a seeded database at settings.db_url.
+"""
+import argparse
+import asyncio
+
+from backend.src.lib.stat_matrix import STAT_PAIRS
+from backend.src.modules.candidate_finder.services import (
+    STAT_WEIGHT_PRIMARY,
+    STAT_WEIGHT_SECONDARY,
+    CandidateFinderService
+)
+from benchmarks.common import load_sql_sequential, quiet_logging, summary, time_call
+
+def dict_stat_search(service: CandidateFinderService, primary: str, secondary: str) -> dict[str, dict]:
+    """The per-request dict comprehensions + sorted() the precomputed rankings replaced."""
+    pokemon_index = service._pokemon_index
+    min_secondary = int(service._stat_spreads_index["STAT_MEDIANS"][secondary])
+    filtered = {
+        name: stats
+        for name, stats in service._stat_index.items()
+        if name in pokemon_index
+        and not pokemon_index[name]["is_legendary"]
+        and not pokemon_index[name]["is_mythical"]
+        and not pokemon_index[name]["is_ultra_beast"]
+    }
+    candidates = {
+        name: stats
+        for name, stats in filtered.items()
+        if stats[primary] >= 0 and stats[secondary] >= min_secondary
+    }
+    ranked = sorted(
+        candidates.items(),
+        key=lambda x: STAT_WEIGHT_PRIMARY * x[1][primary] + STAT_WEIGHT_SECONDARY * x[1][secondary],
+        reverse=True
+    )
+    return dict(ranked)
+
+
+async def main(repeat: int, top_k: int | None) -> None:
+    service = CandidateFinderService(repository=await load_sql_sequential())
+    quiet_logging()
+
+    def run_dict() -> None:
+        for primary, secondary in STAT_PAIRS:
+            dict_stat_search(service, primary, secondary)
+
+    def run_ranked() -> None:
+        for primary, secondary in STAT_PAIRS:
+            service.get_pokemon_by_stats(primary, secondary, top_k=top_k)
+
+    print(f"{len(STAT_PAIRS)} stat pairs per run, repeat={repeat}, top_k={top_k}")
+    print(f"{'dict':<8} {summary(time_call(run_dict, repeat))}")
+    print(f"{'ranked':<8} {summary(time_call(run_ranked, repeat))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat, args.top_k))
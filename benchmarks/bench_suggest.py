@@ -0,0 +1,41 @@
+"""
+Time name suggestions: prefix completions and typo-tolerant (trigram) matches.
+
+    python -m benchmarks.bench_suggest [--repeat N]
+
+Needs a seeded database at settings.db_url. Every query is timed through
+CandidateFinderService.suggest over both pokemon and move names, the way
+the TUI calls it on each keystroke.
+"""
+import argparse
+import asyncio
+
+from backend.src.modules.candidate_finder.services import CandidateFinderService
+from benchmarks.common import load_sql_sequential, quiet_logging, summary, time_call
+
+QUERIES = {
+    "prefix 1 char": "p",
+    "prefix": "pika",
+    "exact": "psychic",
+    "typo": "thundrbolt",
+    "long typo": "charizzard megax ybolt",
+    "no match": "qqqq",
+}
+
+
+async def main(repeat: int) -> None:
+    finder = CandidateFinderService(repository=await load_sql_sequential())
+    quiet_logging()
+
+    print(f"repeat={repeat}")
+    for label, query in QUERIES.items():
+        results = finder.suggest(query)
+        timings = time_call(lambda: finder.suggest(query), repeat)
+        print(f"{label:<14} {query!r:<26} {summary(timings)}   {len(results['suggestions']):>3} suggestions")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
@@ -0,0 +1,43 @@
+"""
+Time the branch-and-bound search for the best members to fill open team slots.
+
+    python -m benchmarks.bench_team_completion [--repeat N] [--budget-ms MS]
+
+Needs a seeded database at settings.db_url. Each line also reports the
+nodes explored and whether the search finished inside the time budget.
+"""
+import argparse
+import asyncio
+
+from backend.src.modules.team_type_coverage_analyzer.services import TeamCoverageService
+from benchmarks.common import load_sql_sequential, quiet_logging, summary, time_call
+
+TEAMS = {
+    "1 slot": (("charizard", "water", "bulbasaur", "ground-flying", "gengar"), 1),
+    "2 slots": (("charizard", "water", "bulbasaur", "gengar"), 2),
+    "3 slots": (("charizard", "water", "bulbasaur"), 3),
+}
+
+
+async def main(repeat: int, budget_ms: float) -> None:
+    service = TeamCoverageService(repository=await load_sql_sequential())
+    quiet_logging()
+
+    print(f"repeat={repeat} budget_ms={budget_ms}")
+    for label, (team, slots) in TEAMS.items():
+        def complete():
+            return service.complete_team(*team, slots=slots, budget_ms=budget_ms)
+
+        result = complete()
+        print(
+            f"{label:<8} {summary(time_call(complete, repeat))}"
+            f"   nodes {result['nodes']:>7}   complete {result['complete']}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=1000.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat, args.budget_ms))
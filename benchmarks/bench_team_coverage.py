@@ -0,0 +1,34 @@
+"""
+Time a full team coverage evaluation.
+
+    python -m benchmarks.bench_team_coverage [--repeat N]
+
+Needs a seeded database at settings.db_url.
+"""
+import argparse
+import asyncio
+
+from backend.src.modules.team_type_coverage_analyzer.services import TeamCoverageService
+from benchmarks.common import load_sql_sequential, quiet_logging, summary, time_call
+
+TEAMS = {
+    "1 member": ("charizard",),
+    "3 members": ("charizard", "water", "bulbasaur"),
+    "6 members": ("charizard", "water", "bulbasaur", "ground-flying", "steel-fairy", "gengar"),
+}
+
+
+async def main(repeat: int) -> None:
+    service = TeamCoverageService(repository=await load_sql_sequential())
+    quiet_logging()
+
+    print(f"repeat={repeat}")
+    for label, team in TEAMS.items():
+        print(f"{label:<10} {summary(time_call(lambda: service.analyze_team(*team), repeat))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
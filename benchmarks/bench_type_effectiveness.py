@@ -0,0 +1,71 @@
+"""
+Compare ways of computing attacker multipliers for every defending combo.
+
+    python -m benchmarks.bench_type_effectiveness [--repeat N]
+
+  sets    - the per-call frozenset membership chain over the legacy index
+  matrix  - summed log2 rows of the TypeMatrix
+  chart   - precomputed TypeChart lookup
+
+Each run covers all 18 single and 153 dual combos. Needs a seeded database
+at settings.db_url.
+"""
+import argparse
+import asyncio
+
+from itertools import combinations
+
+from backend.src.lib.type_chart import TypeChart
+from benchmarks.common import load_sql_sequential, quiet_logging, summary, time_call
+
+
+def set_multipliers(type_matchup_index: dict, *types: str) -> dict[str, float]:
+    """The membership chain get_type_effectiveness used before the matrix."""
+    attack_multipliers = {}
+    for attack_type in type_matchup_index:
+        multiplier = 1.0
+        for defending_type in types:
+            matchup = type_matchup_index[defending_type]
+            if attack_type in matchup["no_damage_from"]:
+                multiplier = 0.0
+                break
+            elif attack_type in matchup["double_damage_from"]:
+                multiplier *= 2
+            elif attack_type in matchup["half_damage_from"]:
+                multiplier *= 0.5
+        attack_multipliers[attack_type] = multiplier
+    return attack_multipliers
+
+
+async def main(repeat: int) -> None:
+    repository = await load_sql_sequential()
+    quiet_logging()
+
+    type_matchup_index = repository.get_type_matchup_index()
+    matrix = repository.get_type_matrix()
+    chart = TypeChart(matrix)
+    combos = [(t,) for t in matrix.types] + list(combinations(matrix.types, 2))
+
+    def run_sets() -> None:
+        for combo in combos:
+            set_multipliers(type_matchup_index, *combo)
+
+    def run_matrix() -> None:
+        for combo in combos:
+            matrix.multipliers(*combo)
+
+    def run_chart() -> None:
+        for combo in combos:
+            chart.multipliers(*combo)
+
+    print(f"{len(combos)} defending combos per run, repeat={repeat}")
+    print(f"{'sets':<8} {summary(time_call(run_sets, repeat))}")
+    print(f"{'matrix':<8} {summary(time_call(run_matrix, repeat))}")
+    print(f"{'chart':<8} {summary(time_call(run_chart, repeat))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
@@ -0,0 +1,44 @@
+"""Helpers shared by the benchmark scripts."""
+import logging
+import statistics
+import structlog
+
+from time import perf_counter
+from typing import Any, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.src.config.settings import settings
+from backend.src.lib.repository import AbstractRepository, SQLAlchemyRepository
+
+
+async def load_sql_sequential() -> AbstractRepository:
+    """Load every index from settings.db_url over a single session."""
+    engine = create_async_engine(settings.db_url)
+    try:
+        async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+            return await SQLAlchemyRepository.create(session=session)
+    finally:
+        await engine.dispose()
+
+
+def time_call(fn: Callable[[], Any], repeat: int) -> list[float]:
+    """Milliseconds per call of `fn`, `repeat` times."""
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        fn()
+        timings.append((perf_counter() - started) * 1000)
+    return timings
+
+
+def summary(timings: list[float]) -> str:
+    return (
+        f"median {statistics.median(timings):8.3f} ms"
+        f"   min {min(timings):8.3f} ms   max {max(timings):8.3f} ms"
+    )
+
+
+def quiet_logging() -> None:
+    """Drop info/debug log calls so they don't dominate per-call timings."""
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
@@ -1,6 +1,8 @@
 import pytest
 import pytest_asyncio
 from backend.src.modules.candidate_finder.services import CandidateFinderService
+from backend.src.modules.team_type_coverage_analyzer.services import TeamCoverageService
+from backend.src.modules.pokedex.services import PokedexService
 from backend.src.lib.repository import SQLAlchemyRepository
 from tests.unit.mock_repository import MockRepository
 
@@ -16,6 +18,16 @@ async def finder(sqlalchemy_repo) -> CandidateFinderService:
     """Create CandidateFinderService with the seeded repository (SQLite)"""
     return CandidateFinderService(sqlalchemy_repo)
 
+@pytest_asyncio.fixture
+async def coverage(sqlalchemy_repo) -> TeamCoverageService:
+    """Create TeamCoverageService with the seeded repository (SQLite)"""
+    return TeamCoverageService(sqlalchemy_repo)
+
+@pytest_asyncio.fixture
+async def pokedex(sqlalchemy_repo) -> PokedexService:
+    """Create PokedexService with the seeded repository (SQLite)"""
+    return PokedexService(sqlalchemy_repo)
+
 @pytest_asyncio.fixture
 async def finder_postgres(sqlalchemy_repo_postgres) -> CandidateFinderService:
     """Create CandidateFinderService with the seeded repository (PostgreSQL - function-scoped)"""
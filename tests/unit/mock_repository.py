@@ -2,6 +2,10 @@
 
 from typing import Any
 
+from backend.src.lib.repository import AbstractRepository
+from backend.src.lib.type_chart import TypeChart
+from backend.src.lib.type_matrix import TypeMatrix
+
 class MockRepository:
     """Test double with minimal, predictable data for unit testing."""
 
@@ -246,3 +250,23 @@ class MockRepository:
             "steel": {"double_damage_from": frozenset({"fire", "fighting", "ground"}), "half_damage_from": frozenset({"normal", "grass", "ice", "flying", "psychic", "bug", "rock", "dragon", "steel", "fairy"}), "no_damage_from": frozenset({"poison"})},
             "fairy": {"double_damage_from": frozenset({"poison", "steel"}), "half_damage_from": frozenset({"fighting", "bug", "dark"}), "no_damage_from": frozenset({"dragon"})},
         }
+
+    def get_type_matrix(self) -> TypeMatrix:
+        """Returns exact type multipliers, derived from the matchup index above."""
+        return TypeMatrix.from_matchup_index(self.get_type_matchup_index())
+
+    def get_type_chart(self) -> TypeChart:
+        """Returns the precomputed combo chart over the matrix above."""
+        return TypeChart(self.get_type_matrix())
+
+    def get_machine_moves_index(self) -> dict:
+        """Returns machine move IDs for testing."""
+        return {
+            "psychic": "tm29",
+        }
+
+    def get_learnset_index(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Returns learnsets, derived from the move index above."""
+        return AbstractRepository._build_learnset_index(
+            self.get_move_index(), self.get_machine_moves_index()
+        )
@@ -1,6 +1,14 @@
 # tests/api/test_pokemon_routes.py
+import asyncio
+import pytest
 from litestar.testing import TestClient
-from backend.src.app import app
+from backend.src.app import app, rate_limit_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limit():
+    """Give every test its own rate-limit window instead of sharing one across the module."""
+    asyncio.run(app.stores.get(rate_limit_config.store).delete_all())
 
 # ========
 # /health
@@ -296,6 +304,30 @@ def test_pokemon_stats_success():
         assert len(data) > 0
 
 
+# Case: limit / offset / fields
+def test_pokemon_stats_page_and_fields():
+    """Test /pokemon stats filter pages and projects server-side."""
+    with TestClient(app=app) as client:
+        full = client.get("/pokemon?primary_stat=attack&secondary_stat=speed").json()
+        response = client.get(
+            "/pokemon?primary_stat=attack&secondary_stat=speed&limit=3&offset=2&fields=attack,speed"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data) == list(full)[2:5]
+        assert all(set(stats) == {"attack", "speed"} for stats in data.values())
+
+
+# Case: invalid paging 400
+def test_pokemon_invalid_page():
+    """Test /pokemon rejects a non-positive limit or negative offset."""
+    with TestClient(app=app) as client:
+        assert client.get("/pokemon?move=tackle&limit=0").status_code == 400
+        assert client.get("/pokemon?move=tackle&offset=-1").status_code == 400
+        assert client.get("/pokemon?primary_stat=attack&secondary_stat=speed&fields=luck").status_code == 400
+
+
 # Case 5: Test exclude legendary
 def test_pokemon_stats_exclude_legendary():
     """Test /pokemon stats filter excludes legendaries by default."""
@@ -382,3 +414,449 @@ def test_type_matchups_success_dual():
 
 
 
+# ========
+# /indexes
+# ========
+
+# Case 1: Snapshot version is reported
+def test_indexes_snapshot_version():
+    """Test /indexes reports the loaded snapshot."""
+    with TestClient(app=app) as client:
+        response = client.get("/indexes")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["version"] >= 1
+        assert "loaded_at" in data
+        assert len(data["content_hash"]) == 64
+        assert data["refresh"]["last_refresh_latency_ms"] is not None
+
+
+# Case 2: Reload needs the admin token and keeps the version for unchanged data
+def test_indexes_reload(monkeypatch):
+    """Test /indexes/reload is guarded and an identical rebuild keeps the version."""
+    from backend.src.config.settings import settings
+
+    with TestClient(app=app) as client:
+        # Disabled unless a token is configured
+        assert client.post("/indexes/reload").status_code == 403
+
+        monkeypatch.setattr(settings, "admin_token", "s3cret")
+        assert client.post("/indexes/reload").status_code == 401
+        assert client.post("/indexes/reload", headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+        before = client.get("/indexes").json()
+        response = client.post("/indexes/reload", headers={"X-Admin-Token": "s3cret"})
+
+        assert response.status_code == 200
+        assert response.json()["version"] == before["version"]
+        assert response.json()["content_hash"] == before["content_hash"]
+
+
+# Case 3: Responses carry the serving snapshot version
+def test_index_version_header():
+    """Test finder responses carry the X-Index-Version header."""
+    with TestClient(app=app) as client:
+        version = client.get("/indexes").json()["version"]
+        response = client.get("/pokemon?types=fire")
+
+        assert response.status_code == 200
+        assert response.headers["x-index-version"] == str(version)
+
+
+# ========
+# /coverage
+# ========
+
+# Case 1: No team 400
+def test_coverage_no_team():
+    """Test /coverage without a team returns 400."""
+    with TestClient(app=app) as client:
+        response = client.get("/coverage")
+
+        assert response.status_code == 400
+
+
+# Case 2: Too many members 400
+def test_coverage_too_many_members():
+    """Test /coverage with more than 6 members returns 400."""
+    with TestClient(app=app) as client:
+        response = client.get("/coverage?team=fire,water,grass,rock,ice,bug,dark")
+
+        assert response.status_code == 400
+
+
+# Case 3: Unknown member 400
+def test_coverage_unknown_member():
+    """Test /coverage with an unknown member returns 400."""
+    with TestClient(app=app) as client:
+        response = client.get("/coverage?team=charizard,fakemon")
+
+        assert response.status_code == 400
+        assert "fakemon" in response.text
+
+
+# Case 4: success 200
+def test_coverage_success():
+    """Test /coverage returns per-attacker counts and suggestions."""
+    with TestClient(app=app) as client:
+        response = client.get("/coverage?team=charizard,fire-flying,water")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["team"]["fire-flying"] == ["fire", "flying"]
+        assert data["attackers"]["rock"]["weak"] == 2
+        assert "rock" in data["weaknesses"]
+        assert data["suggested_types"]
+        assert "x-index-version" in response.headers
+
+
+# /coverage/complete
+# =================
+
+# Case 1: Invalid slots 400
+def test_coverage_complete_invalid_slots():
+    """Test /coverage/complete rejects slots outside 1-6 and overfull teams."""
+    with TestClient(app=app) as client:
+        assert client.get("/coverage/complete?team=charizard&slots=0").status_code == 400
+        assert client.get("/coverage/complete?team=charizard&slots=6").status_code == 400
+
+
+# Case 2: Invalid stat floor 400
+def test_coverage_complete_invalid_stat_floor():
+    """Test /coverage/complete with an unknown stat returns 400."""
+    with TestClient(app=app) as client:
+        response = client.get("/coverage/complete?team=charizard&stat_floors=luck:100")
+
+        assert response.status_code == 400
+        assert "luck" in response.text
+
+
+# Case 3: success 200
+def test_coverage_complete_success():
+    """Test /coverage/complete returns ranked completions."""
+    with TestClient(app=app) as client:
+        response = client.get("/coverage/complete?team=charizard,water&slots=2&stat_floors=speed:80")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["team"]["charizard"] == ["fire", "flying"]
+        assert data["slots"] == 2
+        assert data["suggestions"]
+        assert len(data["suggestions"][0]["members"]) == 2
+
+
+# ========
+# /candidates
+# ========
+
+# Case 1: No filters 400
+def test_candidates_no_params():
+    """Test /candidates without any filter returns 400."""
+    with TestClient(app=app) as client:
+        response = client.get("/candidates")
+
+        assert response.status_code == 400
+
+
+# Case 2: Invalid filters 400
+def test_candidates_invalid_filters():
+    """Test /candidates rejects unknown moves, types and stats."""
+    with TestClient(app=app) as client:
+        assert client.get("/candidates?move=fakemove").status_code == 400
+        assert client.get("/candidates?versus=faketype").status_code == 400
+        assert client.get("/candidates?stat_floors=luck:10").status_code == 400
+
+
+# Case 3: Nothing matches 404
+def test_candidates_not_found():
+    """Test /candidates returns 404 when the filters exclude everything."""
+    with TestClient(app=app) as client:
+        response = client.get("/candidates?move=thunderbolt&types=water")
+
+        assert response.status_code == 404
+
+
+# Case 4: success 200
+def test_candidates_success():
+    """Test /candidates applies every filter and reports the plan."""
+    with TestClient(app=app) as client:
+        response = client.get(
+            "/candidates?move=thunderbolt&types=electric&stat_floors=speed:100&include_legendary=true"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["pokemon_list"] == ["raichu", "zapdos"]
+        assert data["plan"][0]["predicate"] == "move:thunderbolt"
+
+
+# ========
+# /cache
+# ========
+
+# Case 1: Repeated queries are served from the cache, across an identical reload
+def test_response_cache_hits_and_reload(monkeypatch):
+    """Test identical queries hit the response cache and a no-op reload keeps it."""
+    from backend.src.config.settings import settings
+
+    monkeypatch.setattr(settings, "admin_token", "s3cret")
+    with TestClient(app=app) as client:
+        first = client.get("/type-matchups?types=fire-flying")
+        before = client.get("/cache").json()
+        # Same matchup in the other order shares the entry
+        second = client.get("/type-matchups?types=flying-fire")
+        after = client.get("/cache").json()
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert after["hits"] == before["hits"] + 1
+
+        client.post("/indexes/reload", headers={"X-Admin-Token": "s3cret"})
+        third = client.get("/type-matchups?types=fire-flying")
+        reloaded = client.get("/cache").json()
+
+        assert third.json() == first.json()
+        assert reloaded["invalidations"] == after["invalidations"]
+        assert reloaded["hits"] == after["hits"] + 1
+
+
+# Case 2: Errors are not cached
+def test_response_cache_skips_errors():
+    """Test failed queries are recomputed rather than cached."""
+    with TestClient(app=app) as client:
+        before = client.get("/cache").json()
+        assert client.get("/pokemon?move=fakemove").status_code == 400
+        assert client.get("/pokemon?move=fakemove").status_code == 400
+        after = client.get("/cache").json()
+
+        assert after["hits"] == before["hits"]
+
+
+# ========
+# ETag / conditional GET
+# ========
+
+# Case 1: Responses carry a strong ETag and Cache-Control
+def test_etag_and_cache_control():
+    """Test candidate finder responses are tagged per query and snapshot."""
+    with TestClient(app=app) as client:
+        fire = client.get("/type-matchups?types=fire")
+        water = client.get("/type-matchups?types=water")
+
+        assert fire.headers["etag"].startswith('"')
+        assert fire.headers["etag"] != water.headers["etag"]
+        assert "max-age=" in fire.headers["cache-control"]
+        # Same snapshot and query, same tag
+        assert client.get("/type-matchups?types=fire").headers["etag"] == fire.headers["etag"]
+
+
+# Case 2: Matching If-None-Match gets a 304 with no body
+def test_if_none_match_not_modified():
+    """Test a matching If-None-Match short-circuits to 304."""
+    with TestClient(app=app) as client:
+        first = client.get("/pokemon?types=fire")
+        etag = first.headers["etag"]
+
+        response = client.get("/pokemon?types=fire", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = client.get("/pokemon?types=fire", headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+        assert response.json() == first.json()
+
+
+# Case 3: Errors are not tagged
+def test_etag_not_on_errors():
+    """Test failed queries carry no ETag."""
+    with TestClient(app=app) as client:
+        response = client.get("/pokemon?move=fakemove")
+
+        assert response.status_code == 400
+        assert "etag" not in response.headers
+
+
+# ========
+# Response encoding
+# ========
+
+# Case 1: msgspec encoder serves the same JSON
+def test_msgspec_encoder(monkeypatch):
+    """Test the msgspec response encoder is a drop-in for the pydantic path."""
+    from backend.src.config.settings import settings
+    from backend.src.modules.candidate_finder.cache import response_cache
+
+    monkeypatch.setattr(settings, "response_encoder", "pydantic")
+    with TestClient(app=app) as client:
+        expected = client.get("/pokemon?primary_stat=attack&secondary_stat=speed&limit=20")
+
+    monkeypatch.setattr(settings, "response_encoder", "msgspec")
+    # Otherwise the pydantic body would be served back from the response cache
+    response_cache.clear()
+    with TestClient(app=app) as client:
+        response = client.get("/pokemon?primary_stat=attack&secondary_stat=speed&limit=20")
+
+        assert response.status_code == 200
+        assert response.content == expected.content
+
+
+# ========
+# /batch
+# ========
+
+# Case 1: Empty or oversized batch 400
+def test_batch_invalid_size():
+    """Test /batch rejects an empty or oversized batch."""
+    with TestClient(app=app) as client:
+        assert client.post("/batch", json={}).status_code == 400
+        assert client.post("/batch", json={"pokemon": ["bulbasaur"] * 101}).status_code == 400
+
+
+# Case 2: success 200 with per-item errors
+def test_batch_success():
+    """Test /batch returns every item, reporting bad ones without failing."""
+    with TestClient(app=app) as client:
+        response = client.post("/batch", json={
+            "pokemon": ["bulbasaur", "fakemon"],
+            "moves": ["tackle"],
+            "type_combos": ["fire-flying", "faketype"],
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+
+        single = client.get("/pokemon/bulbasaur").json()
+        assert data["pokemon"]["bulbasaur"] == {"data": single, "error": None}
+        assert data["pokemon"]["fakemon"]["error"]["type"] == "InvalidPokemonNameError"
+
+        assert data["moves"]["tackle"]["data"] == client.get("/pokemon?move=tackle").json()["pokemon_list"]
+
+        matchups = client.get("/type-matchups?types=fire-flying").json()
+        assert data["type_combos"]["fire-flying"] == {"data": matchups, "error": None}
+        assert data["type_combos"]["faketype"]["error"]["type"] == "InvalidPokemonTypeError"
+
+
+# Case 3: Both response encoders agree
+def test_batch_msgspec_encoder(monkeypatch):
+    """Test /batch encodes the same with the msgspec encoder."""
+    from backend.src.config.settings import settings
+    body = {"pokemon": ["bulbasaur", "fakemon"], "moves": ["tackle"], "type_combos": ["water"]}
+
+    with TestClient(app=app) as client:
+        monkeypatch.setattr(settings, "response_encoder", "pydantic")
+        expected = client.post("/batch", json=body).content
+        monkeypatch.setattr(settings, "response_encoder", "msgspec")
+        assert client.post("/batch", json=body).content == expected
+
+
+# ========
+# /export
+# ========
+
+# Case 1: Invalid filter 400
+def test_export_invalid_filter():
+    """Test /export rejects a malformed filter before streaming."""
+    with TestClient(app=app) as client:
+        assert client.get("/export?filter=attack>>1").status_code == 400
+        assert client.get("/export?fields=luck").status_code == 400
+
+
+# Case 2: success 200 NDJSON
+def test_export_success():
+    """Test /export streams one JSON object per line."""
+    import json
+
+    with TestClient(app=app) as client:
+        response = client.get("/export", params={"filter": "type=fire, speed>=100", "fields": "types,stats"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert rows
+        for row in rows:
+            assert set(row) == {"name", "types", "stats"}
+            assert "fire" in row["types"]
+            assert row["stats"]["speed"] >= 100
+
+
+# Case 3: Unfiltered export covers every pokemon
+def test_export_everything():
+    """Test /export without a filter returns every pokemon across many chunks."""
+    with TestClient(app=app) as client:
+        response = client.get("/export?fields=number")
+        lines = response.text.splitlines()
+
+        assert response.status_code == 200
+        assert len(lines) > 64
+
+
+# ========
+# /suggest
+# ========
+
+# Case 1: Invalid arguments 400
+def test_suggest_invalid():
+    """Test /suggest rejects unknown kinds and out of range limits."""
+    with TestClient(app=app) as client:
+        assert client.get("/suggest?q=pika&kinds=item").status_code == 400
+        assert client.get("/suggest?q=pika&limit=0").status_code == 400
+        assert client.get("/suggest?q=%20").status_code == 400
+        assert client.get("/suggest").status_code == 400
+
+
+# Case 2: success 200
+def test_suggest_success():
+    """Test /suggest returns ranked typo-tolerant suggestions."""
+    with TestClient(app=app) as client:
+        response = client.get("/suggest", params={"q": "charzard", "kinds": "pokemon", "limit": 5})
+        data = response.json()
+
+        assert response.status_code == 200
+        assert data["query"] == "charzard"
+        assert data["suggestions"][0]["name"] == "charizard"
+        assert data["suggestions"][0]["kind"] == "pokemon"
+        assert len(data["suggestions"]) <= 5
+
+
+# ========
+# /pokedex
+# ========
+
+# Case 1: Invalid page arguments 400
+def test_pokedex_invalid():
+    """Test /pokedex rejects bad cursors and page sizes."""
+    with TestClient(app=app) as client:
+        assert client.get("/pokedex?cursor=!!!").status_code == 400
+        assert client.get("/pokedex?limit=0").status_code == 400
+        assert client.get("/pokedex?limit=1000").status_code == 400
+
+
+# Case 2: Pages chain through next_cursor
+def test_pokedex_pages():
+    """Test /pokedex pages follow on from each other in dex order."""
+    with TestClient(app=app) as client:
+        first = client.get("/pokedex?limit=3").json()
+        second = client.get("/pokedex", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+
+        numbers = [p["number"] for p in first["pokemon"] + second["pokemon"]]
+        assert [p["name"] for p in first["pokemon"]] == ["bulbasaur", "ivysaur", "venusaur"]
+        assert numbers == sorted(numbers)
+        assert second["total"] == first["total"]
+
+
+# Case 3: Entry 200 / 404
+def test_pokedex_entry():
+    """Test /pokedex/{name} returns the combined entry, or 404."""
+    with TestClient(app=app) as client:
+        response = client.get("/pokedex/charizard")
+        data = response.json()
+
+        assert response.status_code == 200
+        assert data["name"] == "charizard"
+        assert data["types"] == ["fire", "flying"]
+        assert data["stats"]["speed"] > 0
+        assert data["learnset"]
+
+        assert client.get("/pokedex/fakemon").status_code == 404
@@ -0,0 +1,57 @@
+import pytest
+from backend.src.lib.bitsets import SpeciesBitsets, iter_bits
+
+# ===========================
+# test_bitsets.py
+# ============================
+
+@pytest.fixture
+def species(mock_repo) -> SpeciesBitsets:
+    return SpeciesBitsets(
+        mock_repo.get_pokemon_index(),
+        mock_repo.get_type_index(),
+        mock_repo.get_move_index()
+        )
+
+# Case 1: Set bit positions, lowest first
+@pytest.mark.unit
+def test_iter_bits():
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
+    assert list(iter_bits(1 << 1200)) == [1200]
+
+# Case 2: IDs are dense and follow name order; decode inverts encode
+@pytest.mark.unit
+def test_species_bitsets_round_trip(species):
+    assert species.ids == {name: i for i, name in enumerate(sorted(species.ids))}
+    names = ["pikachu", "bulbasaur", "gengar"]
+    assert species.decode(species.encode(names)) == sorted(names)
+
+# Case 3: Type intersection matches the frozenset index
+@pytest.mark.unit
+def test_species_bitsets_type_intersection(species, mock_repo):
+    type_index = mock_repo.get_type_index()
+    bits = species.types["fire"] & species.types["flying"]
+    assert frozenset(species.decode(bits)) == type_index["fire"] & type_index["flying"]
+
+# Case 4: Species filters clear exactly the flagged pokemon
+@pytest.mark.unit
+def test_species_bitsets_excluded(species, mock_repo):
+    pokemon_index = mock_repo.get_pokemon_index()
+    kept = species.decode(species.known & ~species.excluded(include_mythical=True))
+
+    assert kept == sorted(
+        name for name, info in pokemon_index.items()
+        if not info["is_legendary"] and not info["is_ultra_beast"]
+    )
+    assert species.excluded(True, True, True) == 0
+
+# Case 5: Paged decode matches slicing the full decode
+@pytest.mark.unit
+def test_species_bitsets_decode_page(species, mock_repo):
+    bits = species.types["fire"]
+    full = species.decode(bits)
+
+    assert species.decode(bits, offset=2, limit=3) == full[2:5]
+    assert species.decode(bits, offset=len(full)) == []
+    assert species.decode(bits, limit=1) == full[:1]
@@ -1,9 +1,13 @@
 
 import pytest
 from backend.src.lib.exceptions import (
+    InvalidFilterExpressionError,
     NoPokemonFoundError,
     InvalidPokemonMoveError,
-    InvalidPokemonTypeError
+    InvalidPokemonStatError,
+    InvalidPokemonTypeError,
+    TooManyBatchItemsError,
+    TooManyTypesError
 )
 
 # ===========================
@@ -93,6 +97,23 @@ def test_get_pokemon_by_move_include_all_special_pokemon(finder):
     # Should include normal Pokemon
     assert "alakazam" in result
 
+# Case 7: Paging and learn-method projection
+@pytest.mark.unit
+def test_get_pokemon_by_move_page_and_fields(finder):
+    full = finder.get_pokemon_by_move("psychic", include_legendary=True, include_mythical=True)
+    page = finder.get_pokemon_by_move(
+        "psychic", include_legendary=True, include_mythical=True, offset=2, limit=3
+        )
+    assert list(page) == list(full)[2:5]
+
+    projected = finder.get_pokemon_by_move("psychic", fields=["level-up"])
+    for name, methods in projected.items():
+        assert set(methods) <= {"level-up"}
+        assert methods == {k: v for k, v in full[name].items() if k == "level-up"}
+
+    with pytest.raises(ValueError):
+        finder.get_pokemon_by_move("psychic", limit=0)
+
 # ===========================
 # test_get_pokemon_by_stats.py
 # ============================
@@ -245,6 +266,63 @@ def test_get_pokemon_by_stats_min_speed_filter(finder):
     # Rhyperior (Attack: 140, Defense: 130, Speed: 40) should NOT be included (too slow)
     assert "rhyperior" not in result
 
+# Case 12: top_k returns the head of the full ranking
+@pytest.mark.unit
+def test_get_pokemon_by_stats_top_k(finder):
+    full = finder.get_pokemon_by_stats("special_attack", "speed")
+    top = finder.get_pokemon_by_stats("special_attack", "speed", top_k=5)
+
+    assert list(top.items()) == list(full.items())[:5]
+
+# Case 13: Matches a plain filter + sort over the stat index
+@pytest.mark.unit
+def test_get_pokemon_by_stats_matches_reference(finder, sqlalchemy_repo):
+    stat_index = sqlalchemy_repo.get_stat_index()
+    pokemon_index = sqlalchemy_repo.get_pokemon_index()
+
+    result = finder.get_pokemon_by_stats("defense", "hp", min_primary=90, min_secondary=60)
+    expected = sorted(
+        (
+            name for name, stats in stat_index.items()
+            if name in pokemon_index
+            and not pokemon_index[name]["is_legendary"]
+            and not pokemon_index[name]["is_mythical"]
+            and not pokemon_index[name]["is_ultra_beast"]
+            and stats["defense"] >= 90 and stats["hp"] >= 60
+        ),
+        key=lambda name: (-(0.7 * stat_index[name]["defense"] + 0.3 * stat_index[name]["hp"]), name)
+    )
+
+    assert list(result) == expected
+
+# Case 14: offset pages through the same ranking; fields projects stats
+@pytest.mark.unit
+def test_get_pokemon_by_stats_offset_and_fields(finder):
+    full = finder.get_pokemon_by_stats("special_attack", "speed")
+    page = finder.get_pokemon_by_stats("special_attack", "speed", top_k=5, offset=5)
+    assert list(page) == list(full)[5:10]
+
+    projected = finder.get_pokemon_by_stats("special_attack", "speed", top_k=3, fields=["speed"])
+    assert all(stats == {"speed": full[name]["speed"]} for name, stats in projected.items())
+
+    # Past the end is an empty page, not an error
+    assert finder.get_pokemon_by_stats("special_attack", "speed", offset=len(full)) == {}
+
+    with pytest.raises(InvalidPokemonStatError):
+        finder.get_pokemon_by_stats("special_attack", "speed", fields=["luck"])
+
+# Case 15: Same stat as primary and secondary ranks by that stat alone
+@pytest.mark.unit
+def test_get_pokemon_by_stats_same_stat(finder, sqlalchemy_repo):
+    stat_index = sqlalchemy_repo.get_stat_index()
+
+    result = finder.get_pokemon_by_stats("attack", "attack", min_primary=120)
+    attacks = [stat_index[name]["attack"] for name in result]
+
+    assert result
+    assert attacks == sorted(attacks, reverse=True)
+    assert all(attack >= 120 for attack in attacks)
+
 # ===========================
 # test_get_pokemon_by_type.py
 # ============================
@@ -309,6 +387,15 @@ def test_get_pokemon_by_type_include_all_special_pokemon(finder):
     # Should include normal Pokemon
     assert "alakazam" in result
 
+# Case 6: Paging over alphabetical order
+@pytest.mark.unit
+def test_get_pokemon_by_type_page(finder):
+    full = sorted(finder.get_pokemon_by_type("fire"))
+    page = finder.get_pokemon_by_type("fire", offset=10, limit=10)
+
+    assert sorted(page) == full[10:20]
+    assert finder.get_pokemon_by_type("fire", offset=len(full)) == frozenset()
+
 # ===========================
 # test_get_type_effectiveness.py
 # ============================
@@ -343,3 +430,171 @@ def test_get_type_effectiveness_dual_type(finder):
 
     # Grass is 0.25x effective (fire resists, flying resists)
     assert "grass" in result["0.25x"]
+
+# ===========================
+# test_find_candidates.py
+# ============================
+
+# Case 1: No criteria (Caller mistake)
+@pytest.mark.unit
+def test_find_candidates_no_criteria(finder):
+    with pytest.raises(ValueError):
+        finder.find_candidates()
+
+# Case 2: Invalid move / type / stat / too many types
+@pytest.mark.unit
+def test_find_candidates_invalid_criteria(finder):
+    with pytest.raises(InvalidPokemonMoveError):
+        finder.find_candidates(move="fakemove")
+    with pytest.raises(InvalidPokemonTypeError):
+        finder.find_candidates(versus=("faketype",))
+    with pytest.raises(InvalidPokemonStatError):
+        finder.find_candidates(stat_floors={"luck": 10})
+    with pytest.raises(TooManyTypesError):
+        finder.find_candidates(types=("fire", "water", "grass"))
+
+# Case 3: Every criterion applies at once, most selective index first
+@pytest.mark.unit
+def test_find_candidates_compound(finder):
+    result = finder.find_candidates(
+        move="thunderbolt",
+        types=("electric",),
+        stat_floors={"speed": 100},
+        include_legendary=True
+        )
+
+    assert result["pokemon_list"] == ["raichu", "zapdos"]
+    predicates = [step["predicate"] for step in result["plan"]]
+    assert predicates == ["move:thunderbolt", "type:electric", "stats:speed>=100"]
+
+# Case 4: Resists versus type matches the type chart
+@pytest.mark.unit
+def test_find_candidates_versus(finder):
+    result = finder.find_candidates(types=("fire", "flying"), versus=("grass",))
+
+    assert "charizard" in result["pokemon_list"]
+    for name in result["pokemon_list"]:
+        types = finder.get_pokemon_by_name(name)["type_display"].split("/")
+        assert finder._type_chart.multipliers(*types)["grass"] < 1
+
+# Case 5: Nothing matches
+@pytest.mark.unit
+def test_find_candidates_not_found(finder):
+    with pytest.raises(NoPokemonFoundError):
+        finder.find_candidates(move="thunderbolt", types=("water",))
+
+# ===========================
+# test_lookup_batch.py
+# ============================
+
+# Case 1: Nothing requested / too many items (Caller mistake)
+@pytest.mark.unit
+def test_lookup_batch_invalid_size(finder):
+    with pytest.raises(ValueError):
+        finder.lookup_batch()
+    with pytest.raises(TooManyBatchItemsError):
+        finder.lookup_batch(pokemon=["bulbasaur"] * 101)
+
+# Case 2: Each item matches its single lookup; bad items don't fail the batch
+@pytest.mark.unit
+def test_lookup_batch_per_item_results(finder):
+    batch = finder.lookup_batch(
+        pokemon=["bulbasaur", "fakemon", "bulbasaur"],
+        moves=["thunderbolt", "fakemove"],
+        type_combos=["fire-flying", "fire-water-grass"],
+        include_legendary=True
+        )
+
+    assert list(batch["pokemon"]) == ["bulbasaur", "fakemon"]
+    assert batch["pokemon"]["bulbasaur"] == {"data": finder.get_pokemon_by_name("bulbasaur"), "error": None}
+    assert batch["pokemon"]["fakemon"]["data"] is None
+    assert batch["pokemon"]["fakemon"]["error"]["type"] == "InvalidPokemonNameError"
+
+    assert batch["moves"]["thunderbolt"]["data"] == finder.get_pokemon_by_move("thunderbolt", include_legendary=True)
+    assert batch["moves"]["fakemove"]["error"]["type"] == "InvalidPokemonMoveError"
+
+    assert batch["type_combos"]["fire-flying"]["data"] == finder.get_type_effectiveness("fire", "flying")
+    assert batch["type_combos"]["fire-water-grass"]["error"]["type"] == "TooManyTypesError"
+
+# ===========================
+# test_export_rows.py
+# ============================
+
+# Case 1: Invalid fields / expressions fail before any row is produced
+@pytest.mark.unit
+def test_export_rows_invalid(finder):
+    with pytest.raises(ValueError):
+        finder.export_rows(fields=["luck"])
+    with pytest.raises(InvalidFilterExpressionError):
+        finder.export_rows("attack>=")
+    with pytest.raises(InvalidPokemonTypeError):
+        finder.export_rows("type=faketype")
+    with pytest.raises(InvalidPokemonMoveError):
+        finder.export_rows("move=fakemove")
+
+# Case 2: Filters match the indexes
+@pytest.mark.unit
+def test_export_rows_filter(finder, sqlalchemy_repo):
+    stat_index = sqlalchemy_repo.get_stat_index()
+    fire = finder.get_pokemon_by_type("fire", include_legendary=True, include_mythical=True, include_ultra_beasts=True)
+
+    rows = list(finder.export_rows("type=fire and attack>=100, legendary=false"))
+    names = [row["name"] for row in rows]
+
+    assert names == sorted(names)
+    assert set(names) == {
+        name for name in fire
+        if name in stat_index and stat_index[name]["attack"] >= 100
+        and not finder.get_pokemon_by_name(name)["is_legendary"]
+    }
+    for row in rows:
+        assert "fire" in row["types"]
+        assert row["stats"] == stat_index[row["name"]]
+        assert row["flags"]["legendary"] is False
+
+# Case 3: Moves and field selection
+@pytest.mark.unit
+def test_export_rows_moves_and_fields(finder):
+    rows = list(finder.export_rows("move=thunderbolt", fields=["moves"]))
+
+    assert [row["name"] for row in rows] == ["pikachu", "raichu", "zapdos"]
+    assert all(set(row) == {"name", "moves"} and "thunderbolt" in row["moves"] for row in rows)
+
+# ===========================
+# test_suggest.py
+# ============================
+
+# Case 1: Invalid arguments
+@pytest.mark.unit
+@pytest.mark.parametrize("query, kinds, limit", [
+    ("", ("pokemon",), 10),
+    ("pika", ("item",), 10),
+    ("pika", (), 10),
+    ("pika", ("pokemon",), 0),
+    ("pika", ("pokemon",), 26),
+])
+def test_suggest_invalid(finder, query, kinds, limit):
+    with pytest.raises(ValueError):
+        finder.suggest(query, kinds=kinds, limit=limit)
+
+# Case 2: Pokemon and moves ranked together
+@pytest.mark.unit
+def test_suggest_ranked(finder):
+    results = finder.suggest("thundrbolt")
+
+    assert results["query"] == "thundrbolt"
+    assert results["complete"] is True
+    top = results["suggestions"][0]
+    assert (top["name"], top["kind"], top["match"]) == ("thunderbolt", "move", "fuzzy")
+    scores = [s["score"] for s in results["suggestions"]]
+    assert scores == sorted(scores, reverse=True)
+
+# Case 3: Kinds restrict the vocabulary; prefix completions for pokemon
+@pytest.mark.unit
+def test_suggest_kinds(finder):
+    results = finder.suggest("pika", kinds=["pokemon"], limit=3)
+
+    assert results["suggestions"][0]["name"] == "pikachu"
+    assert results["suggestions"][0]["match"] == "prefix"
+    assert all(s["kind"] == "pokemon" for s in results["suggestions"])
+    assert len(results["suggestions"]) <= 3
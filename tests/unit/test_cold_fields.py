@@ -0,0 +1,62 @@
+import pickle
+import pytest
+from backend.src.lib.cold_fields import ColdFieldStore
+
+# ===========================
+# test_cold_fields.py
+# ============================
+
+ROWS = [
+    ("Bulbasaur", "https://example.com/1.png", "A strange seed was planted on its back at birth.", "Seed Pokémon"),
+    ("Pikachu", "https://example.com/25.png", "", "Mouse Pokémon"),
+    ("Mew", "https://example.com/151.png", "Said to contain the genes of all Pokémon.", "New Species Pokémon"),
+]
+
+# Case 1: Entries decode back to their fields
+@pytest.mark.unit
+def test_cold_field_store_get():
+    store = ColdFieldStore.from_rows(ROWS)
+
+    assert len(store) == 3
+    assert store.get(1) == {
+        "display_name": "Pikachu",
+        "sprite_url": "https://example.com/25.png",
+        "description": "",
+        "genus": "Mouse Pokémon",
+    }
+    assert store.get(2)["genus"] == "New Species Pokémon"
+
+# Case 2: LRU keeps the most recent entries only
+@pytest.mark.unit
+def test_cold_field_store_lru():
+    store = ColdFieldStore.from_rows(ROWS, max_entries=2)
+
+    first = store.get(0)
+    assert store.get(0) is first
+    store.get(1)
+    store.get(2)
+    assert store.get(0) is not first
+    assert (store.hits, store.misses) == (1, 4)
+
+# Case 3: A zero-sized cache decodes on every access
+@pytest.mark.unit
+def test_cold_field_store_cache_disabled():
+    store = ColdFieldStore.from_rows(ROWS, max_entries=0)
+
+    assert store.get(0) == store.get(0)
+    assert (store.hits, store.misses) == (0, 2)
+
+# Case 4: Protocol 5 hands the blob out of band
+@pytest.mark.unit
+def test_cold_field_store_pickle_out_of_band():
+    store = ColdFieldStore.from_rows(ROWS)
+    buffers = []
+    data = pickle.dumps(store, protocol=5, buffer_callback=buffers.append)
+
+    assert len(buffers) == 1
+    restored = pickle.loads(data, buffers=[memoryview(b) for b in buffers])
+    assert isinstance(restored.blob, memoryview)
+    assert [restored.get(i) for i in range(3)] == [store.get(i) for i in range(3)]
+
+    in_band = pickle.loads(pickle.dumps(store, protocol=4))
+    assert [in_band.get(i) for i in range(3)] == [store.get(i) for i in range(3)]
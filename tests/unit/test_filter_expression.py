@@ -0,0 +1,36 @@
+import pytest
+from backend.src.lib.exceptions import InvalidFilterExpressionError
+from backend.src.lib.filter_expression import Clause, parse_filter
+
+# ===========================
+# test_filter_expression.py
+# ============================
+
+# Case 1: Clauses joined by "," or "and", values typed by field
+@pytest.mark.unit
+def test_parse_filter():
+    assert parse_filter("type=fire and attack>=100, legendary=FALSE, move!=tackle") == [
+        Clause("type", "=", "fire"),
+        Clause("attack", ">=", 100),
+        Clause("legendary", "=", False),
+        Clause("move", "!=", "tackle"),
+    ]
+    assert parse_filter(" speed > 90 AND number<=151 ") == [
+        Clause("speed", ">", 90),
+        Clause("number", "<=", 151),
+    ]
+
+# Case 2: Malformed expressions
+@pytest.mark.unit
+@pytest.mark.parametrize("expression", [
+    "",
+    "attack",
+    "luck>=10",
+    "attack>=high",
+    "type>=fire",
+    "legendary=maybe",
+    "attack=>100",
+])
+def test_parse_filter_invalid(expression):
+    with pytest.raises(InvalidFilterExpressionError):
+        parse_filter(expression)
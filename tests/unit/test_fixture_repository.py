@@ -0,0 +1,100 @@
+import json
+import shutil
+import pytest
+from backend.src.config.settings import Settings, settings
+from backend.src.lib.fixtures import iter_fixture_records
+from backend.src.lib.repository import AbstractRepository, FixtureRepository
+
+# ===========================
+# test_fixture_repository.py
+# ============================
+
+POKEMON_MOVES = [
+    {"pokemon_name": "pikachu", "move_name": "thunderbolt", "learn_method": "level-up", "level": 36},
+    {"pokemon_name": "pikachu", "move_name": "thunderbolt", "learn_method": "machine", "level": 0},
+    {"pokemon_name": "raichu", "move_name": "thunderbolt", "learn_method": "machine", "level": 0},
+    {"pokemon_name": "not_a_pokemon", "move_name": "thunderbolt", "learn_method": "egg", "level": 0},
+]
+
+@pytest.fixture
+def fixture_settings(tmp_path):
+    local = Settings(data_dir=tmp_path, dataset=settings.dataset)
+    shutil.copytree(settings.fixtures_dir, local.fixtures_dir)
+    local.pokemon_move_fixture_path.write_text(json.dumps(POKEMON_MOVES))
+    return local
+
+@pytest.fixture
+def fixture_repo(fixture_settings):
+    return FixtureRepository.create(fixture_settings)
+
+# Case 1: Streaming reader matches json.load, whatever the chunk size
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [7, 4096])
+def test_iter_fixture_records_matches_json_load(chunk_size):
+    path = settings.pokemon_fixture_path
+    records = list(iter_fixture_records(path, chunk_size=chunk_size))
+    assert records == json.loads(path.read_text())
+
+# Case 2: Same indexes as the database for everything seeded from fixtures
+@pytest.mark.unit
+def test_fixture_repository_matches_sqlalchemy(fixture_repo, sqlalchemy_repo):
+    assert fixture_repo.get_pokemon_index() == sqlalchemy_repo.get_pokemon_index()
+    assert fixture_repo.get_stat_index() == sqlalchemy_repo.get_stat_index()
+    assert fixture_repo.get_stat_spread_index() == sqlalchemy_repo.get_stat_spread_index()
+    assert fixture_repo.get_type_index() == sqlalchemy_repo.get_type_index()
+    assert fixture_repo.get_type_matchup_index() == sqlalchemy_repo.get_type_matchup_index()
+    assert fixture_repo.get_type_matrix() == sqlalchemy_repo.get_type_matrix()
+    assert fixture_repo.get_machine_moves_index() == sqlalchemy_repo.get_machine_moves_index()
+
+# Case 3: Move index shape; rows for unknown pokemon are dropped
+@pytest.mark.unit
+def test_fixture_repository_move_index(fixture_repo):
+    assert fixture_repo.get_move_index() == {
+        "thunderbolt": {
+            "pikachu": {"level-up": 36, "machine": True},
+            "raichu": {"machine": True},
+        }
+    }
+
+# Case 4: Learnsets are built alongside, keyed by pokemon
+@pytest.mark.unit
+def test_fixture_repository_learnset_index(fixture_repo):
+    assert fixture_repo.get_learnset_index() == {
+        "pikachu": {"thunderbolt": {"level-up": 36, "machine": True}},
+        "raichu": {"thunderbolt": {"machine": True}},
+    }
+
+# Case 5: Level-up moves by level, then machine moves by TM id, then the rest
+@pytest.mark.unit
+def test_build_learnset_index_order():
+    move_index = {
+        "tackle": {"eevee": {"level-up": 1}},
+        "bite": {"eevee": {"level-up": 30}},
+        "growl": {"eevee": {"level-up": 1}},
+        "toxic": {"eevee": {"machine": True}},
+        "dig": {"eevee": {"machine": True}},
+        "wish": {"eevee": {"egg": True}},
+        "covet": {"eevee": {"tutor": True}},
+        "swift": {"eevee": {"machine": True}},
+    }
+    machine_moves_index = {"toxic": "tm006", "dig": "tm028"}
+
+    learnsets = AbstractRepository._build_learnset_index(move_index, machine_moves_index)
+
+    assert list(learnsets["eevee"]) == [
+        "growl", "tackle", "bite", "toxic", "dig", "covet", "swift", "wish",
+    ]
+
+# Case 6: Missing fixture file
+@pytest.mark.unit
+def test_fixture_repository_missing_file(fixture_settings):
+    fixture_settings.pokemon_move_fixture_path.unlink()
+    with pytest.raises(FileNotFoundError):
+        FixtureRepository.create(fixture_settings)
+
+# Case 7: Malformed fixture file
+@pytest.mark.unit
+def test_fixture_repository_malformed_file(fixture_settings):
+    fixture_settings.tm_fixture_path.write_text('[{"name": "mega_punch", ')
+    with pytest.raises(json.JSONDecodeError):
+        FixtureRepository.create(fixture_settings)
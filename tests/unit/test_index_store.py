@@ -0,0 +1,136 @@
+import pytest
+from types import SimpleNamespace
+from backend.src.config.settings import settings
+from backend.src.lib.deps import create_repository_loader
+from backend.src.lib.exceptions import IndexesNotLoadedError
+from backend.src.lib.index_store import IndexStore, index_content_hash
+from backend.src.lib.repository import SnapshotRepository, SQLAlchemyRepository
+from backend.src.modules.candidate_finder.services import CandidateFinderService
+
+# ===========================
+# test_index_store.py
+# ============================
+
+# Case 1: Nothing loaded yet
+@pytest.mark.unit
+def test_index_store_current_before_load():
+    store = IndexStore()
+    assert not store.is_loaded
+    with pytest.raises(IndexesNotLoadedError):
+        store.current
+
+# Case 2: Reload without a loader
+@pytest.mark.unit
+async def test_index_store_reload_without_loader():
+    store = IndexStore()
+    with pytest.raises(IndexesNotLoadedError):
+        await store.reload()
+
+# Case 3: Reload republishes; only changed data gets a new version
+@pytest.mark.unit
+async def test_index_store_reload_versions(sqlalchemy_repo, mock_repo):
+    store = IndexStore()
+    repos = iter([sqlalchemy_repo, sqlalchemy_repo, mock_repo])
+
+    async def loader():
+        return next(repos)
+
+    store.configure(loader)
+    first = await store.reload()
+    same = await store.reload()
+    changed = await store.reload()
+
+    assert first.version == 1
+    assert same is not first and same.version == 1
+    assert changed.version == 2
+    assert store.current is changed
+
+# Case 4: Services are shared within a snapshot, rebuilt across snapshots
+@pytest.mark.unit
+def test_index_snapshot_service_is_cached(sqlalchemy_repo):
+    store = IndexStore()
+    snapshot = store.publish(sqlalchemy_repo)
+
+    finder = snapshot.service(CandidateFinderService)
+    assert snapshot.service(CandidateFinderService) is finder
+
+    reloaded = store.publish(sqlalchemy_repo)
+    assert reloaded.service(CandidateFinderService) is not finder
+
+# Case 5: Content hash is stable for identical data
+@pytest.mark.unit
+def test_index_content_hash_is_stable(sqlalchemy_repo, mock_repo):
+    assert index_content_hash(sqlalchemy_repo) == index_content_hash(sqlalchemy_repo)
+    assert index_content_hash(sqlalchemy_repo) != index_content_hash(mock_repo)
+
+# Case 6: Refresh keeps the snapshot when nothing changed
+@pytest.mark.unit
+async def test_index_store_refresh_unchanged(sqlalchemy_repo):
+    store = IndexStore()
+
+    async def loader():
+        return sqlalchemy_repo
+
+    store.configure(loader)
+    first = await store.reload()
+    refreshed = await store.refresh()
+
+    assert refreshed is first
+    assert store.metrics.refresh_count == 2
+    assert store.metrics.last_refresh_changed is False
+    assert store.metrics.last_refresh_latency_ms is not None
+
+# Case 7: Refresh swaps in changed data
+@pytest.mark.unit
+async def test_index_store_refresh_swaps_changed(sqlalchemy_repo, mock_repo):
+    store = IndexStore()
+    repos = iter([sqlalchemy_repo, mock_repo])
+
+    async def loader():
+        return next(repos)
+
+    store.configure(loader)
+    first = await store.reload()
+    refreshed = await store.refresh()
+
+    assert refreshed.version == first.version + 1
+    assert refreshed.repository is mock_repo
+    assert store.current is refreshed
+    assert store.metrics.swap_count == 2
+
+# Case 8: Failed refresh keeps serving the previous snapshot
+@pytest.mark.unit
+async def test_index_store_refresh_failure_keeps_snapshot(sqlalchemy_repo):
+    store = IndexStore()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise RuntimeError("database went away")
+        return sqlalchemy_repo
+
+    store.configure(loader)
+    first = await store.reload()
+    with pytest.raises(RuntimeError):
+        await store.refresh()
+
+    assert store.current is first
+    assert store.metrics.failure_count == 1
+
+# Case 9: Snapshot source serves startup only; refreshes rebuild from the database
+@pytest.mark.unit
+async def test_repository_loader_refreshes_from_database(_db_engine, sqlalchemy_repo, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    monkeypatch.setattr(settings, "index_source", "snapshot")
+    monkeypatch.setattr(settings, "index_snapshot_write", True)
+    monkeypatch.setattr(settings, "index_load_concurrently", False)
+    sqlalchemy_repo.write_snapshot(settings.index_snapshot_path, dataset=settings.dataset)
+    written = settings.index_snapshot_path.stat().st_mtime_ns
+
+    loader = create_repository_loader(SimpleNamespace(get_session=_db_engine))  # type: ignore[arg-type]
+
+    assert isinstance(await loader(), SnapshotRepository)
+    assert isinstance(await loader(), SQLAlchemyRepository)
+    assert settings.index_snapshot_path.stat().st_mtime_ns > written
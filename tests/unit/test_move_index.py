@@ -0,0 +1,82 @@
+import pickle
+import pytest
+from backend.src.lib.move_index import PackedMoveIndex
+
+# ===========================
+# test_move_index.py
+# ============================
+
+PAIRS = {
+    "thunderbolt": {
+        "raichu": {"machine": True},
+        "pikachu": {"level-up": 36, "machine": True},
+        "zapdos": {"machine": True, "tutor": True},
+    },
+    "hypnosis": {
+        "gastly": {"level-up": 4},
+        "ralts": {"egg": True},
+        "pikachu": {"light-ball-egg": True},
+    },
+}
+
+@pytest.fixture
+def packed() -> PackedMoveIndex:
+    return PackedMoveIndex.from_pairs(PAIRS)
+
+# Case 1: Decodes back to the dict shape
+@pytest.mark.unit
+def test_packed_move_index_round_trip(packed):
+    assert packed == PAIRS
+    assert dict(packed["thunderbolt"].items()) == PAIRS["thunderbolt"]
+    assert packed["hypnosis"]["pikachu"] == {"light-ball-egg": True}
+    assert len(packed) == 2 and len(packed["thunderbolt"]) == 3
+
+# Case 2: Learners iterate in name order and miss cleanly
+@pytest.mark.unit
+def test_packed_move_index_lookup(packed):
+    assert list(packed["thunderbolt"]) == ["pikachu", "raichu", "zapdos"]
+    assert "pikachu" in packed["thunderbolt"]
+    assert "gastly" not in packed["thunderbolt"]
+    assert "missingno" not in packed["thunderbolt"]
+    assert packed["thunderbolt"].get("gastly") is None
+    assert "surf" not in packed
+    with pytest.raises(KeyError):
+        packed["thunderbolt"]["gastly"]
+    with pytest.raises(KeyError):
+        packed["surf"]
+
+# Case 3: Equal learn methods share one decoded dict
+@pytest.mark.unit
+def test_packed_move_index_flyweights(packed):
+    assert packed["thunderbolt"]["raichu"] is packed["thunderbolt"]["raichu"]
+    assert packed["thunderbolt"]["pikachu"] is not packed["thunderbolt"]["raichu"]
+    assert packed.methods[:4] == ("level-up", "machine", "tutor", "egg")
+
+# Case 4: Pickles (snapshots) as arrays and decodes the same afterwards
+@pytest.mark.unit
+def test_packed_move_index_pickle(packed):
+    restored = pickle.loads(pickle.dumps(packed, protocol=pickle.HIGHEST_PROTOCOL))
+
+    assert restored == packed == PAIRS
+    assert restored["thunderbolt"].ids == packed["thunderbolt"].ids
+
+# Case 5: items() is a reusable ItemsView, not a one-shot iterator
+@pytest.mark.unit
+def test_packed_move_index_items_view(packed):
+    items = packed["thunderbolt"].items()
+
+    assert len(items) == 3
+    assert list(items) == list(items) == sorted(PAIRS["thunderbolt"].items())
+    assert ("zapdos", {"machine": True, "tutor": True}) in items
+    assert ("zapdos", {"machine": True}) not in items
+
+# Case 6: A missing level-up level stays None; level 0 stays 0
+@pytest.mark.unit
+def test_packed_move_index_levels():
+    pairs = {"growl": {"eevee": {"level-up": None}, "pichu": {"level-up": 0, "egg": True}}}
+    packed = PackedMoveIndex.from_pairs(pairs)
+
+    assert packed == pairs
+    assert pickle.loads(pickle.dumps(packed)) == pairs
+    with pytest.raises(ValueError):
+        PackedMoveIndex.from_pairs({"growl": {"eevee": {"level-up": 300}}})
@@ -0,0 +1,78 @@
+import pytest
+from backend.src.lib.exceptions import InvalidPokemonNameError
+from backend.src.modules.pokedex.services import MAX_PAGE_SIZE, decode_cursor, encode_cursor
+
+# ===========================
+# test_pokedex.py
+# ============================
+
+# Case 1: Cursors round trip; garbage is rejected
+@pytest.mark.unit
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(122, "galar.mr_mime")) == (122, "galar.mr_mime")
+    for cursor in ("!!!", encode_cursor(1, "x")[:-1] + "*", "bm90LWEtY3Vyc29y"):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+# Case 2: Invalid page arguments (Caller mistake)
+@pytest.mark.unit
+@pytest.mark.parametrize("limit", [0, MAX_PAGE_SIZE + 1])
+def test_browse_invalid_limit(pokedex, limit):
+    with pytest.raises(ValueError):
+        pokedex.browse(limit=limit)
+
+# Case 3: Walking every page visits each species once, in dex order
+@pytest.mark.unit
+def test_browse_all_pages(pokedex, sqlalchemy_repo):
+    seen = []
+    cursor = None
+    while True:
+        page = pokedex.browse(cursor=cursor, limit=MAX_PAGE_SIZE)
+        assert len(page["pokemon"]) <= MAX_PAGE_SIZE
+        seen.extend((p["number"], p["name"]) for p in page["pokemon"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == sorted(seen)
+    assert len(seen) == page["total"] == len(sqlalchemy_repo.get_pokemon_index())
+    assert seen[0] == (1, "bulbasaur")
+
+# Case 4: A cursor for a removed species still resumes in the right place
+@pytest.mark.unit
+def test_browse_cursor_between_keys(pokedex):
+    page = pokedex.browse(cursor=encode_cursor(25, "zzzz"), limit=1)
+
+    assert page["pokemon"][0]["number"] > 25
+
+# Case 5: Unknown / empty name
+@pytest.mark.unit
+def test_get_entry_invalid(pokedex):
+    with pytest.raises(ValueError):
+        pokedex.get_entry("")
+    with pytest.raises(InvalidPokemonNameError):
+        pokedex.get_entry("fakemon")
+
+# Case 6: Entry combines info, stats and the learnset
+@pytest.mark.unit
+def test_get_entry(pokedex, sqlalchemy_repo):
+    entry = pokedex.get_entry("charizard")
+
+    assert entry["number"] == 6
+    assert entry["types"] == ["fire", "flying"]
+    assert entry["flags"] == {"legendary": False, "mythical": False, "ultra_beast": False}
+    assert entry["stats"] == sqlalchemy_repo.get_stat_index()["charizard"]
+    assert entry["learnset"] == {
+        move: learners["charizard"]
+        for move, learners in sqlalchemy_repo.get_move_index().items()
+        if "charizard" in learners
+    }
+    assert entry["learnset"] == sqlalchemy_repo.get_learnset_index()["charizard"]
+    assert entry["machines"] == {
+        move: machine_id
+        for move, machine_id in sqlalchemy_repo.get_machine_moves_index().items()
+        if "machine" in entry["learnset"].get(move, {})
+    }
+
+    # Species without base stats still have an entry
+    assert pokedex.get_entry("pikachu")["stats"] is None
@@ -0,0 +1,68 @@
+import pytest
+from backend.src.lib.bitsets import SpeciesBitsets
+from backend.src.lib.query_planner import MOVE, RESISTS, TYPE, QueryPlanner
+from backend.src.lib.type_chart import TypeChart
+
+# ===========================
+# test_query_planner.py
+# ============================
+
+@pytest.fixture
+def planner(mock_repo) -> QueryPlanner:
+    species = SpeciesBitsets(
+        mock_repo.get_pokemon_index(),
+        mock_repo.get_type_index(),
+        mock_repo.get_move_index()
+        )
+    return QueryPlanner(
+        species,
+        TypeChart(mock_repo.get_type_matrix()),
+        mock_repo.get_pokemon_index(),
+        mock_repo.get_stat_index()
+        )
+
+# Case 1: Cardinalities match the source indexes
+@pytest.mark.unit
+def test_query_planner_cardinality(planner, mock_repo):
+    for move, learners in mock_repo.get_move_index().items():
+        assert planner.cardinality[(MOVE, move)] == len(set(learners))
+    for type_name, members in mock_repo.get_type_index().items():
+        assert planner.cardinality[(TYPE, type_name)] == len(members)
+
+# Case 2: Most selective predicate runs first
+@pytest.mark.unit
+def test_query_planner_orders_by_cardinality(planner):
+    predicates = [(TYPE, "fire"), (MOVE, "hypnosis"), (RESISTS, "water")]
+    order = planner.plan(predicates)
+
+    assert sorted(order) == sorted(predicates)
+    cardinalities = [planner.cardinality[p] for p in order]
+    assert cardinalities == sorted(cardinalities)
+
+# Case 3: Result is the intersection of every predicate
+@pytest.mark.unit
+def test_query_planner_intersects(planner, mock_repo):
+    names, steps = planner.execute([(TYPE, "fire"), (TYPE, "flying")])
+    fire = set(mock_repo.get_type_index()["fire"])
+    flying = set(mock_repo.get_type_index()["flying"])
+
+    assert set(names) == fire & flying
+    assert steps[-1].remaining == len(names)
+
+# Case 4: Once empty, later steps are skipped and stat floors still apply
+@pytest.mark.unit
+def test_query_planner_short_circuits(planner, mock_repo):
+    stat_index = mock_repo.get_stat_index()
+    names, steps = planner.execute([], stat_floors={"speed": 100})
+    assert names
+    assert all(stat_index[name]["speed"] >= 100 for name in names)
+    assert steps[-1].cardinality is None
+
+    # Everything excluded: nothing left to intersect or check
+    names, steps = planner.execute(
+        [(TYPE, "fire"), (RESISTS, "water")],
+        excluded=planner._species.known,
+        stat_floors={"speed": 100}
+        )
+    assert names == []
+    assert [step.remaining for step in steps] == [None, None, None]
@@ -0,0 +1,61 @@
+import pickle
+import pytest
+from backend.src.lib.cold_fields import COLD_FIELDS, ColdFieldStore
+from backend.src.lib.records import PokemonRecord
+
+# ===========================
+# test_records.py
+# ============================
+
+PIKACHU = {
+    "display_name": "Pikachu", "number": 25, "height": 0.4, "weight": 6.0,
+    "sprite_url": "https://example.com/25.png", "description": "Mouse.", "genus": "Mouse Pokémon",
+    "type_display": "electric", "is_legendary": False, "is_mythical": False, "is_ultra_beast": False,
+}
+
+def make_record(info: dict) -> PokemonRecord:
+    cold = ColdFieldStore.from_rows([tuple(info[field] for field in COLD_FIELDS)])
+    hot = {key: value for key, value in info.items() if key not in COLD_FIELDS}
+    return PokemonRecord(**hot, cold=cold, cold_id=0)
+
+# Case 1: Reads like the dict it replaces
+@pytest.mark.unit
+def test_pokemon_record_mapping():
+    record = make_record(PIKACHU)
+
+    assert record == PIKACHU and PIKACHU == record
+    assert record["number"] == 25 and record.number == 25
+    assert list(record) == list(PIKACHU)
+    assert dict(record.items()) == PIKACHU
+    assert record.get("stats") is None
+    assert "genus" in record and "stats" not in record
+    with pytest.raises(KeyError):
+        record["stats"]
+    with pytest.raises(AttributeError):
+        record.stats = {}  # type: ignore
+
+# Case 2: Pickles (snapshots) round trip
+@pytest.mark.unit
+def test_pokemon_record_pickle():
+    record = make_record(PIKACHU)
+
+    for protocol in (4, 5):
+        assert pickle.loads(pickle.dumps(record, protocol=protocol)) == record
+
+# Case 3: Records of one index share a single text store
+@pytest.mark.unit
+def test_pokemon_records_share_cold_store(sqlalchemy_repo):
+    stores = {id(info.cold) for info in sqlalchemy_repo.get_pokemon_index().values()}
+
+    assert len(stores) == 1
+
+# Case 4: Names are one object across every index
+@pytest.mark.unit
+def test_repository_names_shared(sqlalchemy_repo):
+    pokemon_names = {name: name for name in sqlalchemy_repo.get_pokemon_index()}
+
+    for members in sqlalchemy_repo.get_type_index().values():
+        assert all(name is pokemon_names[name] for name in members if name in pokemon_names)
+    for learners in sqlalchemy_repo.get_move_index().values():
+        assert all(name is pokemon_names[name] for name in learners if name in pokemon_names)
+    assert all(name is pokemon_names[name] for name in sqlalchemy_repo.get_stat_index() if name in pokemon_names)
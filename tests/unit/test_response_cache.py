@@ -0,0 +1,51 @@
+import pytest
+from backend.src.modules.candidate_finder.cache import ResponseCache
+
+# ===========================
+# test_response_cache.py
+# ============================
+
+# Case 1: Miss, then hit
+@pytest.mark.unit
+def test_response_cache_hit_and_miss():
+    cache = ResponseCache(max_entries=2)
+
+    assert cache.get(1, "a") is None
+    cache.put(1, "a", b"A")
+    assert cache.get(1, "a") == b"A"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+# Case 2: Least recently used entry is evicted first
+@pytest.mark.unit
+def test_response_cache_evicts_lru():
+    cache = ResponseCache(max_entries=2)
+    cache.put(1, "a", b"A")
+    cache.put(1, "b", b"B")
+    cache.get(1, "a")  # "b" is now least recently used
+    cache.put(1, "c", b"C")
+
+    assert cache.get(1, "b") is None
+    assert cache.get(1, "a") == b"A"
+    assert cache.get(1, "c") == b"C"
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+# Case 3: A new snapshot version drops every entry
+@pytest.mark.unit
+def test_response_cache_invalidated_by_version():
+    cache = ResponseCache(max_entries=4)
+    cache.put(1, "a", b"A")
+
+    assert cache.get(2, "a") is None
+    assert len(cache) == 0
+    assert cache.invalidations == 1
+
+# Case 4: Size 0 disables caching
+@pytest.mark.unit
+def test_response_cache_disabled():
+    cache = ResponseCache(max_entries=0)
+    cache.put(1, "a", b"A")
+
+    assert cache.get(1, "a") is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
@@ -0,0 +1,58 @@
+import pytest
+from backend.src.modules.candidate_finder.encoding import (
+    encode_msgspec,
+    encode_pydantic,
+    encode_response,
+    sorted_names
+)
+from backend.src.modules.candidate_finder.schemas import (
+    CandidateQueryResponse,
+    PokemonMoveResponse,
+    PokemonStatsResponse,
+    PokemonTypeResponse,
+    TypeMatchupResponse
+)
+
+# ===========================
+# test_response_encoding.py
+# ============================
+
+# Case 1: Both encoders produce identical bytes for every response shape
+@pytest.mark.unit
+def test_encoders_match(finder):
+    cases = [
+        (PokemonMoveResponse, {
+            "move_name": "psychic",
+            "pokemon_list": finder.get_pokemon_by_move("psychic", include_legendary=True)
+        }),
+        (PokemonTypeResponse, {
+            "type_combo": "fire",
+            "pokemon_list": sorted_names(finder.get_pokemon_by_type("fire"))
+        }),
+        (PokemonStatsResponse, finder.get_pokemon_by_stats("attack", "speed")),
+        (TypeMatchupResponse, {
+            key: sorted_names(types)
+            for key, types in finder.get_type_effectiveness("fire", "flying").items()
+        }),
+        (CandidateQueryResponse, finder.find_candidates(types=("fire",), versus=("grass",))),
+    ]
+    for schema, data in cases:
+        assert encode_msgspec(schema, data) == encode_pydantic(schema, data), schema.__name__
+
+# Case 2: Sets are always encoded as sorted arrays
+@pytest.mark.unit
+def test_pydantic_sorts_sets():
+    body = encode_pydantic(PokemonTypeResponse, {
+        "type_combo": "fire",
+        "pokemon_list": frozenset({"vulpix", "charmander", "ponyta"})
+    })
+    assert body == b'{"type_combo":"fire","pokemon_list":["charmander","ponyta","vulpix"]}'
+
+# Case 3: Unknown encoder setting
+@pytest.mark.unit
+def test_unknown_encoder(monkeypatch):
+    from backend.src.config.settings import settings
+    monkeypatch.setattr(settings, "response_encoder", "pickle")
+
+    with pytest.raises(ValueError):
+        encode_response(PokemonTypeResponse, {"type_combo": "fire", "pokemon_list": []})
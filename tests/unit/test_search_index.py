@@ -0,0 +1,77 @@
+import pytest
+from backend.src.lib import search_index
+from backend.src.lib.search_index import MIN_SIMILARITY, SearchIndex, normalize
+
+# ===========================
+# test_search_index.py
+# ============================
+
+@pytest.fixture
+def index() -> SearchIndex:
+    return SearchIndex([
+        "pikachu", "pikachu.partner", "pichu", "raichu", "mr_mime",
+        "charizard", "charmander", "charmeleon", "thunderbolt", "thunder",
+    ])
+
+# Case 1: Separators and case fold together
+@pytest.mark.unit
+def test_normalize():
+    assert normalize("  Mr Mime ") == normalize("mr_mime") == normalize("MR-MIME") == "mr-mime"
+
+# Case 2: Prefix matches are the contiguous sorted run
+@pytest.mark.unit
+def test_search_index_prefix(index):
+    assert index.prefix("char") == ["charizard", "charmander", "charmeleon"]
+    assert index.prefix("charm", limit=1) == ["charmander"]
+    assert index.prefix("zzz") == []
+    assert index.prefix("mr mime") == ["mr_mime"]
+
+# Case 3: Exact, then shortest prefix completions, then fuzzy
+@pytest.mark.unit
+def test_search_index_suggest_order(index):
+    suggestions, complete = index.suggest("pikachu", limit=3)
+
+    assert complete
+    assert [(s.name, s.match) for s in suggestions] == [
+        ("pikachu", "exact"),
+        ("pikachu.partner", "prefix"),
+        ("pichu", "fuzzy"),
+    ]
+    assert suggestions[0].score == 1.0
+    assert all(s.score >= MIN_SIMILARITY for s in suggestions)
+
+# Case 4: Typos find the intended name
+@pytest.mark.unit
+@pytest.mark.parametrize("query, expected", [
+    ("charzard", "charizard"),
+    ("thundrbolt", "thunderbolt"),
+    ("raichuu", "raichu"),
+])
+def test_search_index_fuzzy(index, query, expected):
+    suggestions, _ = index.fuzzy(query)
+
+    assert suggestions[0].name == expected
+    assert [s.score for s in suggestions] == sorted((s.score for s in suggestions), reverse=True)
+
+# Case 5: Nothing close, empty query, expired deadline
+@pytest.mark.unit
+def test_search_index_no_match(index):
+    assert index.suggest("xyzzy") == ([], True)
+    assert index.suggest("   ") == ([], True)
+
+    suggestions, complete = index.fuzzy("charzard", deadline=0.0)
+    assert suggestions == [] and not complete
+
+    # The deadline is checked before the prefix step too
+    assert index.suggest("char", deadline=0.0) == ([], False)
+
+# Case 6: Shortest prefix completions match sorting the whole run, on both paths
+@pytest.mark.unit
+@pytest.mark.parametrize("small_run", [0, search_index.SMALL_PREFIX_RUN])
+@pytest.mark.parametrize("prefix", ["p", "pi", "char", "thunder", "mr", "zzz", ""])
+def test_search_index_shortest_prefix(index, prefix, small_run, monkeypatch):
+    monkeypatch.setattr(search_index, "SMALL_PREFIX_RUN", small_run)
+    expected = sorted(index.prefix(prefix), key=lambda n: (len(n), n))
+
+    for limit in (1, 2, 3, len(index)):
+        assert index.shortest_prefix(prefix, limit) == expected[:limit]
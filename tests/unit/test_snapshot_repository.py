@@ -0,0 +1,76 @@
+import json
+import pytest
+from backend.src.lib import snapshot_format
+from backend.src.lib.repository import SnapshotRepository, INDEX_ATTRIBUTES
+from backend.src.lib.exceptions import (
+    IndexSnapshotCorruptError,
+    IndexSnapshotMismatchError
+)
+
+# ===========================
+# test_snapshot_repository.py
+# ============================
+
+@pytest.fixture
+def snapshot_path(tmp_path, sqlalchemy_repo):
+    path = tmp_path / "pokerogue.pkfidx"
+    sqlalchemy_repo.write_snapshot(path, dataset="pokerogue")
+    return path
+
+# Case 1: Round trip returns every index unchanged
+@pytest.mark.unit
+def test_snapshot_repository_round_trip(snapshot_path, sqlalchemy_repo):
+    repo = SnapshotRepository.open(snapshot_path, dataset="pokerogue")
+
+    for attr in INDEX_ATTRIBUTES:
+        assert getattr(repo, attr) == getattr(sqlalchemy_repo, attr)
+    assert repo.get_learnset_index() == sqlalchemy_repo.get_learnset_index()
+
+# Case 2: Dataset mismatch
+@pytest.mark.unit
+def test_snapshot_repository_dataset_mismatch(snapshot_path):
+    with pytest.raises(IndexSnapshotMismatchError, match="dataset"):
+        SnapshotRepository.open(snapshot_path, dataset="unbound")
+
+# Case 3: Format version mismatch
+@pytest.mark.unit
+def test_snapshot_repository_format_mismatch(snapshot_path, monkeypatch):
+    monkeypatch.setattr(snapshot_format, "INDEX_FORMAT_VERSION", snapshot_format.INDEX_FORMAT_VERSION + 1)
+    with pytest.raises(IndexSnapshotMismatchError, match="format_version"):
+        SnapshotRepository.open(snapshot_path, dataset="pokerogue")
+
+# Case 4: Flipped payload byte fails the checksum
+@pytest.mark.unit
+def test_snapshot_repository_checksum(snapshot_path):
+    data = bytearray(snapshot_path.read_bytes())
+    data[-1] ^= 0xFF
+    snapshot_path.write_bytes(bytes(data))
+
+    with pytest.raises(IndexSnapshotCorruptError, match="checksum"):
+        SnapshotRepository.open(snapshot_path, dataset="pokerogue")
+
+# Case 5: Truncated file
+@pytest.mark.unit
+def test_snapshot_repository_truncated(snapshot_path):
+    snapshot_path.write_bytes(snapshot_path.read_bytes()[:-10])
+
+    with pytest.raises(IndexSnapshotCorruptError, match="truncated"):
+        SnapshotRepository.open(snapshot_path, dataset="pokerogue")
+
+# Case 6: Not a snapshot at all
+@pytest.mark.unit
+def test_snapshot_repository_bad_magic(tmp_path):
+    path = tmp_path / "bogus.pkfidx"
+    path.write_text(json.dumps({"not": "a snapshot"}))
+
+    with pytest.raises(IndexSnapshotCorruptError):
+        SnapshotRepository.open(path, dataset="pokerogue")
+
+# Case 7: Pokédex text is read off the mapped file, not copied
+@pytest.mark.unit
+def test_snapshot_repository_maps_cold_fields(snapshot_path, sqlalchemy_repo):
+    repo = SnapshotRepository.open(snapshot_path, dataset="pokerogue")
+    charizard = repo.get_pokemon_index()["charizard"]
+
+    assert isinstance(charizard.cold.blob, memoryview)
+    assert charizard["description"] == sqlalchemy_repo.get_pokemon_index()["charizard"]["description"]
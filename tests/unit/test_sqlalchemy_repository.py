@@ -0,0 +1,48 @@
+import pytest
+from backend.src.lib.repository import INDEX_ATTRIBUTES, INDEX_QUERIES, SQLAlchemyRepository
+
+# ===========================
+# test_sqlalchemy_repository.py
+# ============================
+
+# Case 1: Concurrent loading builds the same indexes as sequential loading
+@pytest.mark.unit
+async def test_load_all_indexes_concurrently_matches_sequential(_db_engine, sqlalchemy_repo):
+    repo = SQLAlchemyRepository(None)
+    await repo._load_all_indexes_concurrently(_db_engine)
+
+    assert repo.get_pokemon_index() == sqlalchemy_repo.get_pokemon_index()
+    assert repo.get_move_index() == sqlalchemy_repo.get_move_index()
+    assert repo.get_stat_index() == sqlalchemy_repo.get_stat_index()
+    assert repo.get_stat_spread_index() == sqlalchemy_repo.get_stat_spread_index()
+    assert repo.get_type_index() == sqlalchemy_repo.get_type_index()
+    assert repo.get_type_matchup_index() == sqlalchemy_repo.get_type_matchup_index()
+    assert repo.get_type_matrix().as_dict() == sqlalchemy_repo.get_type_matrix().as_dict()
+    assert repo.get_machine_moves_index() == sqlalchemy_repo.get_machine_moves_index()
+    assert repo.get_learnset_index() == sqlalchemy_repo.get_learnset_index()
+
+# Case 2: Queries need a session from somewhere
+@pytest.mark.unit
+async def test_query_without_session():
+    repo = SQLAlchemyRepository(None)
+    with pytest.raises(ValueError):
+        await repo._query_pokemon_index()
+
+# Case 3: Learnsets invert the move index and share its learn-method dicts
+@pytest.mark.unit
+async def test_learnset_index_shares_move_index(sqlalchemy_repo):
+    move_index = sqlalchemy_repo.get_move_index()
+    learnset_index = sqlalchemy_repo.get_learnset_index()
+
+    assert sum(map(len, learnset_index.values())) == sum(map(len, move_index.values()))
+    for pokemon, learnset in learnset_index.items():
+        for move, methods in learnset.items():
+            assert methods is move_index[move][pokemon]
+
+# Case 4: Every index is filled by exactly one query
+@pytest.mark.unit
+def test_index_queries_cover_every_index():
+    filled = [attribute for _, _, attributes in INDEX_QUERIES for attribute in attributes]
+
+    assert sorted(filled) == sorted(INDEX_ATTRIBUTES)
+    assert len(INDEX_QUERIES) < len(INDEX_ATTRIBUTES)
@@ -0,0 +1,146 @@
+import pytest
+from backend.src.lib.exceptions import (
+    InvalidPokemonNameError,
+    InvalidPokemonStatError,
+    TooManyTeamMembersError,
+    TooManyTypesError
+)
+
+# ===========================
+# test_team_coverage.py
+# ============================
+
+# Case 1: Incorrect arg datatype (Programmer mistake)
+@pytest.mark.unit
+def test_analyze_team_incorrect_argument_datatype(coverage):
+    with pytest.raises(TypeError):
+        coverage.analyze_team(123) # type: ignore
+
+# Case 2: Empty team (Caller mistake)
+@pytest.mark.unit
+def test_analyze_team_empty(coverage):
+    with pytest.raises(ValueError):
+        coverage.analyze_team()
+
+# Case 3: Too many members
+@pytest.mark.unit
+def test_analyze_team_too_many_members(coverage):
+    with pytest.raises(TooManyTeamMembersError):
+        coverage.analyze_team(*["fire"] * 7)
+
+# Case 4: Unknown member / too many types in a combo
+@pytest.mark.unit
+def test_analyze_team_invalid_members(coverage):
+    with pytest.raises(InvalidPokemonNameError):
+        coverage.analyze_team("fakemon")
+    with pytest.raises(TooManyTypesError):
+        coverage.analyze_team("fire-water-grass")
+
+# Case 5: Pokemon names resolve to their types; combos are order independent
+@pytest.mark.unit
+def test_analyze_team_resolves_members(coverage):
+    result = coverage.analyze_team("charizard", "flying-fire", "bulbasaur")
+
+    assert result["team"] == {
+        "charizard": ["fire", "flying"],
+        "flying-fire": ["fire", "flying"],
+        "bulbasaur": ["grass", "poison"],
+    }
+
+# Case 6: Per-attacker counts
+@pytest.mark.unit
+def test_analyze_team_attacker_counts(coverage):
+    result = coverage.analyze_team("charizard", "water", "ground-flying")
+    attackers = result["attackers"]
+
+    # rock: charizard weak (4x), water neutral, ground-flying neutral
+    assert attackers["rock"] == {"weak": 1, "resist": 0, "immune": 0}
+    # electric: charizard and water weak, ground-flying immune
+    assert attackers["electric"] == {"weak": 2, "resist": 0, "immune": 1}
+    # ground: charizard and ground-flying immune (flying), water neutral
+    assert attackers["ground"] == {"weak": 0, "resist": 0, "immune": 2}
+    # fire: charizard and water resist, ground-flying neutral
+    assert attackers["fire"] == {"weak": 0, "resist": 2, "immune": 0}
+
+# Case 7: Weaknesses, strengths and suggestions
+@pytest.mark.unit
+def test_analyze_team_suggestions(coverage):
+    result = coverage.analyze_team("charizard", "fire")
+
+    assert "rock" in result["weaknesses"]
+    assert "water" in result["weaknesses"]
+    assert "fire" in result["strengths"]
+
+    suggested = [s["type"] for s in result["suggested_types"]]
+    assert suggested
+    # Water and steel resist rock, fire's big problem
+    assert "steel" in suggested or "water" in suggested
+    best = result["suggested_types"][0]
+    assert best["score"] == len(best["patches"]) - len(best["new_weaknesses"])
+
+# Case 8: Completion slot validation
+@pytest.mark.unit
+def test_complete_team_slot_validation(coverage):
+    with pytest.raises(ValueError):
+        coverage.complete_team("charizard", slots=0)
+    with pytest.raises(TooManyTeamMembersError):
+        coverage.complete_team(*["fire"] * 5, slots=2)
+    with pytest.raises(InvalidPokemonStatError):
+        coverage.complete_team("charizard", stat_floors={"luck": 100})
+
+# Case 9: Completions are ranked, scored and backed by real species
+@pytest.mark.unit
+def test_complete_team_suggestions(coverage):
+    result = coverage.complete_team("charizard", "fire", slots=2, budget_ms=5000)
+
+    assert result["complete"] is True
+    suggestions = result["suggestions"]
+    assert suggestions
+    assert [s["score"] for s in suggestions] == sorted(s["score"] for s in suggestions)
+
+    for suggestion in suggestions:
+        members = [m["types"] for m in suggestion["members"]]
+        assert len(members) == 2
+        team = ["charizard", "fire"] + ["-".join(types) for types in members]
+        # Score matches the analyzer's view of the completed team
+        assert set(suggestion["weaknesses"]) == set(coverage.analyze_team(*team)["weaknesses"])
+        assert suggestion["score"] >= len(suggestion["weaknesses"])
+        for member in suggestion["members"]:
+            assert member["pokemon"]
+
+# Case 10: Branch and bound matches exhaustive search
+@pytest.mark.unit
+def test_complete_team_matches_exhaustive(coverage):
+    from itertools import combinations_with_replacement
+    from backend.src.modules.team_type_coverage_analyzer.services import uncovered
+
+    base = coverage._resolve_team(("charizard", "water"))
+    eligible = coverage._eligible_species(False, False, False, {})
+    best = min(
+        uncovered(tuple(map(sum, zip(*(p.delta for p in base + [coverage._profiles[c] for c in picks])))))
+        for picks in combinations_with_replacement(sorted(eligible), 1)
+    )
+
+    result = coverage.complete_team("charizard", "water", slots=1, budget_ms=5000)
+    assert result["suggestions"][0]["score"] == best
+
+# Case 11: Species filters and stat floors
+@pytest.mark.unit
+def test_complete_team_filters(coverage):
+    result = coverage.complete_team(
+        "charizard", stat_floors={"speed": 120}, budget_ms=5000
+    )
+
+    for suggestion in result["suggestions"]:
+        for member in suggestion["members"]:
+            for name in member["pokemon"]:
+                assert coverage._stat_index[name]["speed"] >= 120
+                assert not coverage._pokemon_index[name]["is_legendary"]
+
+# Case 12: An exhausted time budget still returns a valid (partial) result
+@pytest.mark.unit
+def test_complete_team_budget(coverage):
+    result = coverage.complete_team("charizard", slots=3, budget_ms=0.001)
+
+    assert result["complete"] is False
+    assert result["nodes"] >= 1
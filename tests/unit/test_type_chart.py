@@ -0,0 +1,66 @@
+import pytest
+from itertools import combinations
+from backend.src.lib.type_chart import TypeChart
+
+# ===========================
+# test_type_chart.py
+# ============================
+
+@pytest.fixture
+def chart(sqlalchemy_repo) -> TypeChart:
+    return TypeChart(sqlalchemy_repo.get_type_matrix())
+
+# Case 1: Every single and dual combo is precomputed
+@pytest.mark.unit
+def test_type_chart_precomputes_all_combos(chart):
+    assert len(chart.types) == 18
+    assert len(chart._effectiveness) == 18 + 153
+
+# Case 2: Dual combos are order independent and shared
+@pytest.mark.unit
+def test_type_chart_dual_order_independent(chart):
+    assert chart.effectiveness("fire", "flying") is chart.effectiveness("flying", "fire")
+    assert chart.effectiveness("fire", "flying")["4x"] == frozenset({"rock"})
+
+# Case 3: Multipliers stack and immunities win
+@pytest.mark.unit
+def test_type_chart_multipliers(chart):
+    assert chart.multipliers("grass", "bug")["fire"] == 4.0
+    assert chart.multipliers("steel", "rock")["fighting"] == 4.0
+    assert chart.multipliers("ghost", "normal")["fighting"] == 0.0
+    assert chart.multipliers("water")["water"] == 0.5
+
+# Case 4: Same type twice falls back to an on-the-fly computation
+@pytest.mark.unit
+def test_type_chart_same_type_twice(chart):
+    assert chart.multipliers("fire", "fire")["water"] == 4.0
+    assert "4x" in chart.effectiveness("fire", "fire")
+
+# Case 5: Buckets cover every attacking type exactly once
+@pytest.mark.unit
+def test_type_chart_buckets_partition_types(chart):
+    for combo in combinations(sorted(chart.types), 2):
+        buckets = chart.effectiveness(*combo).values()
+        assert sum(len(bucket) for bucket in buckets) == len(chart.types)
+        assert frozenset().union(*buckets) == frozenset(chart.types)
+
+# Case 6: Multipliers outside the standard buckets get their own, never dropped
+@pytest.mark.unit
+def test_type_chart_group_keeps_unusual_multipliers():
+    grouped = TypeChart._group({"ice": 8.0, "fire": 2.0, "water": 1.5, "grass": 0.125})
+
+    assert list(grouped) == ["2x", "8.0x", "1.5x", "0.125x"]
+    assert grouped["8.0x"] == frozenset({"ice"})
+    assert frozenset().union(*grouped.values()) == frozenset({"ice", "fire", "water", "grass"})
+
+# Case 7: One chart per repository, shared by the finder and the coverage engine
+@pytest.mark.unit
+def test_type_chart_shared_per_repository(sqlalchemy_repo, coverage):
+    chart = sqlalchemy_repo.get_type_chart()
+
+    assert sqlalchemy_repo.get_type_chart() is chart
+    assert chart.exponents("fire", "flying")[chart.types.index("rock")] == 2
+    for combo in chart.combos:
+        assert coverage._profiles[combo].delta == tuple(
+            (exponent > 0) - (exponent < 0) for exponent in chart.exponents(*combo)
+        )
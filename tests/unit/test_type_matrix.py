@@ -0,0 +1,48 @@
+import pytest
+from backend.src.lib.type_matrix import IMMUNE, TypeMatrix, exponent_for, multiplier_for
+
+# ===========================
+# test_type_matrix.py
+# ============================
+
+# Case 1: log2 encoding round trips every chart multiplier
+@pytest.mark.unit
+@pytest.mark.parametrize("multiplier", [0.0, 0.25, 0.5, 1.0, 2.0, 4.0])
+def test_exponent_round_trip(multiplier):
+    assert multiplier_for(exponent_for(multiplier)) == multiplier
+
+# Case 2: Multipliers that aren't powers of two are rejected
+@pytest.mark.unit
+def test_exponent_for_rejects_non_power_of_two():
+    with pytest.raises(ValueError):
+        exponent_for(1.5)
+
+# Case 3: Exact multipliers survive, unlike the legacy category shape
+@pytest.mark.unit
+def test_type_matrix_keeps_exact_multipliers():
+    matrix = TypeMatrix.from_rows([
+        {"defender_type": "bug", "attacker_type": "fire", "multiplier": 4.0},
+        {"defender_type": "bug", "attacker_type": "ghost", "multiplier": 0.0},
+        {"defender_type": "fire", "attacker_type": "fire", "multiplier": 0.5},
+    ])
+
+    assert matrix.multiplier("fire", "bug") == 4.0
+    assert matrix.multiplier("ghost", "bug") == 0.0
+    assert matrix.multiplier("ghost", "fire") == 1.0  # missing rows are neutral
+    assert matrix.row("bug")[matrix.type_ids["ghost"]] == IMMUNE
+
+# Case 4: Dual types sum exponents; immunity wins
+@pytest.mark.unit
+def test_type_matrix_dual_types(sqlalchemy_repo):
+    matrix = sqlalchemy_repo.get_type_matrix()
+
+    assert matrix.multipliers("grass", "bug")["fire"] == 4.0
+    assert matrix.multipliers("water", "dragon")["fire"] == 0.25
+    assert matrix.multipliers("normal", "ghost")["fighting"] == 0.0
+    assert matrix.multipliers("ground", "flying")["electric"] == 0.0
+
+# Case 5: The legacy shape rebuilds the same single-type chart
+@pytest.mark.unit
+def test_type_matrix_from_matchup_index(sqlalchemy_repo):
+    legacy = TypeMatrix.from_matchup_index(sqlalchemy_repo.get_type_matchup_index())
+    assert legacy == sqlalchemy_repo.get_type_matrix()